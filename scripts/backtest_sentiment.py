@@ -0,0 +1,86 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+# Default data paths: the repository's Data/ folder from a checkout; for the installed
+# commands (where project_root is site-packages), Data/ under the working directory
+data_root = project_root if not __package__ else os.curdir
+
+from backtest import GATES, SCORE_COLUMNS, SentimentBacktester
+from batch_runner import load_manifest, manifest_from_directory
+from synthetic_data import make_ohlcv
+
+
+def synthetic_results(tickers, days, seed=0):
+    """
+    Daily frames shaped like MultiTickerSentimentEngine.run() output: random-walk prices
+    and sentiment on about half of the days, weakly predictive of the next day's return.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+    for i in range(tickers):
+        df = make_ohlcv(days + 1, seed=seed + i)
+        vader = np.where(rng.random(len(df)) < 0.5, rng.normal(0, 0.3, len(df)), 0.0)
+        df['Close'] *= np.exp(np.cumsum(np.roll(0.01 * vader, 1)))
+        df['Daily_Return'] = df['Close'].pct_change() * 100
+        df['VADER_Sentiment'] = vader
+        df['TextBlob_Sentiment'] = 0.5 * vader + np.where(vader != 0, rng.normal(0, 0.05, len(df)), 0.0)
+        results[f'T{i:03d}'] = df.dropna(subset=['Daily_Return'])
+        results[f'T{i:03d}'].attrs['sentiment_alignment'] = 'session' # Scores known at each close
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backtest sentiment threshold strategies over a parameter grid.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--manifest', help="JSON ({ticker: path}) or CSV (ticker,path) manifest of price files")
+    source.add_argument('--data-dir', default=os.path.join(data_root, 'Data', 'yfinance_data'),
+                        help="Directory of <TICKER>_historical_data.csv files (default: Data/yfinance_data)")
+    source.add_argument('--synthetic', type=int, metavar='TICKERS', help="Use this many synthetic tickers instead of files")
+    parser.add_argument('--news-file', default=os.path.join(data_root, 'Data', 'raw_analyst_ratings', 'raw_analyst_ratings.csv'),
+                        help="News CSV (default: Data/raw_analyst_ratings/raw_analyst_ratings.csv)")
+    parser.add_argument('--days', type=int, default=2_520, help="Trading days per synthetic ticker")
+    parser.add_argument('--columns', nargs='+', default=list(SCORE_COLUMNS), choices=SCORE_COLUMNS, help="Scores to trade on")
+    parser.add_argument('--thresholds', type=float, nargs='+', default=list(np.round(np.linspace(0, 0.5, 26), 2)),
+                        help="Score thresholds (long above, short below minus the threshold)")
+    parser.add_argument('--lags', type=int, nargs='+', default=list(range(0, 6)), help="Days between score and decision (>= 0)")
+    parser.add_argument('--gates', nargs='+', default=list(GATES), choices=GATES, help="RSI/MACD confirmation filters")
+    parser.add_argument('--long-only', action='store_true', help="Never go short")
+    parser.add_argument('--cost-bps', type=float, default=5.0, help="Cost per unit of position change, in basis points")
+    parser.add_argument('--workers', type=int, default=1, help="Processes for the grid (default: 1; 0 for all CPUs)")
+    parser.add_argument('--top', type=int, default=10, help="Best configurations to print")
+    parser.add_argument('--output', help="Write the per-ticker grid results to this CSV file")
+    args = parser.parse_args()
+    if min(args.lags) < 0:
+        parser.error("--lags must be >= 0 (a negative lag would trade on scores not yet known)")
+
+    if args.synthetic:
+        results = synthetic_results(args.synthetic, args.days)
+    else:
+        from market_sentiment import MultiTickerSentimentEngine # Only needed (and scoring models loaded) for real data
+        manifest = load_manifest(args.manifest) if args.manifest else manifest_from_directory(args.data_dir)
+        if not manifest or not os.path.exists(args.news_file):
+            print("Error: no price files or news file found (use --synthetic to try the backtester).")
+            sys.exit(1)
+        results = MultiTickerSentimentEngine(args.news_file, manifest, align='session').run()
+
+    backtester = SentimentBacktester.from_results(results, score_columns=args.columns)
+    grid = backtester.grid(columns=args.columns, thresholds=args.thresholds, lags=args.lags, gates=args.gates,
+                           long_only=args.long_only, cost_bps=args.cost_bps, max_workers=args.workers or None)
+    if args.output:
+        grid.to_csv(args.output, index=False)
+        print(f"Grid results written to {args.output}")
+
+    print(f"\nTop {args.top} configurations by mean Sharpe ratio across tickers:")
+    print(SentimentBacktester.summary(grid).head(args.top).round(4).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+
+# Get the directory of the current script (batch_stock_analysis.py)
+script_dir = os.path.dirname(__file__)
+
+# Construct the path to the project root (one level up from 'scripts')
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+from batch_runner import load_manifest, manifest_from_directory, run_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute technical indicators for many tickers in parallel.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--manifest', help="JSON ({ticker: path}) or CSV (ticker,path) manifest")
+    source.add_argument('--data-dir', help="Directory of <TICKER>_historical_data.csv files")
+    parser.add_argument('--workers', type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument('--output', default=None,
+                        help="Write a Parquet dataset partitioned by Ticker here (without it the indicators "
+                             "are only computed and timed, not kept)")
+    parser.add_argument('--use-cache', action='store_true', help="Use the Parquet cache for the price CSVs")
+    parser.add_argument('--timings', default=None, help="Optional CSV file for the per-ticker timings")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.manifest) if args.manifest else manifest_from_directory(args.data_dir)
+    if not manifest:
+        print("Error: the manifest is empty.")
+        sys.exit(1)
+
+    # Without --output nothing is shipped back to this process: workers report row counts only
+    results, timings = run_batch(manifest, max_workers=args.workers, output_dir=args.output,
+                                 use_cache=args.use_cache, collect=False)
+
+    print("\n--- Per-ticker timings (slowest first) ---")
+    print(timings.to_string(index=False))
+    if args.timings:
+        timings.to_csv(args.timings, index=False)
+    if args.output:
+        print(f"\nIndicators written to Parquet dataset: {results}")
+    else:
+        print(f"\nComputed {int(timings['rows'].sum())} (Ticker, Date) rows (pass --output to save them).")
+    if (timings['status'] != 'ok').any():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from correlation_engine import CorrelationEngine
+
+
+def make_panels(tickers, days, missing=0.2, seed=0):
+    """
+    Random (dates x tickers) sentiment and return panels; returns depend weakly on the
+    previous day's sentiment, and a share of the sentiment values is missing (no news).
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2010-01-04', periods=days, freq='B', name='Date')
+    columns = [f'T{i:04d}' for i in range(tickers)]
+    sentiment = rng.normal(0, 0.3, (days, tickers))
+    returns = rng.normal(0, 1.5, (days, tickers))
+    returns[1:] += 0.5 * sentiment[:-1]
+    sentiment[rng.random((days, tickers)) < missing] = np.nan
+    return pd.DataFrame(sentiment, index, columns), pd.DataFrame(returns, index, columns)
+
+
+def loop_lag_sweep(sentiment, returns, lags):
+    """
+    The notebook's original approach: per ticker and lag, add a shifted column,
+    drop incomplete rows and correlate.
+    """
+    out = {}
+    for ticker in sentiment.columns:
+        df = pd.DataFrame({'Sentiment': sentiment[ticker], 'Daily_Return': returns[ticker]})
+        for lag in lags:
+            df[f'Sentiment_Lag{lag}'] = df['Sentiment'].shift(lag)
+            temp = df.dropna(subset=[f'Sentiment_Lag{lag}', 'Daily_Return'])
+            out[(lag, ticker)] = temp[f'Sentiment_Lag{lag}'].corr(temp['Daily_Return'])
+    return pd.Series(out).unstack()
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the per-ticker lag loop with the batched correlation engine.")
+    parser.add_argument('--tickers', type=int, nargs='+', default=[10, 100, 500], help="Universe sizes to benchmark")
+    parser.add_argument('--days', type=int, default=2_500, help="Trading days per ticker")
+    parser.add_argument('--max-lag', type=int, default=10, help="Lags -max_lag..+max_lag are swept")
+    parser.add_argument('--loop-limit', type=int, default=100,
+                        help="Skip the (slow) per-ticker loop above this many tickers")
+    parser.add_argument('--n-boot', type=int, default=1_000, help="Bootstrap replicates")
+    args = parser.parse_args()
+    lags = range(-args.max_lag, args.max_lag + 1)
+
+    print(f"{'tickers':>8}{'loop s':>9}{'sweep s':>9}{'speedup':>9}{'max diff':>10}{'rolling s':>11}{'boot s':>8}")
+    for tickers in args.tickers:
+        sentiment, returns = make_panels(tickers, args.days)
+        engine = CorrelationEngine(sentiment, returns)
+        sweep, sweep_s = timed(engine.lag_sweep, lags)
+        _, rolling_s = timed(engine.rolling, 60, 1)
+        _, boot_s = timed(engine.bootstrap, (0, 1), args.n_boot, block_size=5)
+        if tickers <= args.loop_limit:
+            reference, loop_s = timed(loop_lag_sweep, sentiment, returns, lags)
+            diff = float(np.nanmax(np.abs(sweep.to_numpy() - reference.loc[list(lags), sweep.columns].to_numpy())))
+            loop_text, speedup_text, diff_text = f"{loop_s:>9.2f}", f"{loop_s / sweep_s:>8.1f}x", f"{diff:>10.1e}"
+        else:
+            loop_text, speedup_text, diff_text = f"{'-':>9}", f"{'-':>9}", f"{'-':>10}"
+        print(f"{tickers:>8,}{loop_text}{sweep_s:>9.3f}{speedup_text}{diff_text}{rolling_s:>11.3f}{boot_s:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from stock_analyzer import StockAnalyzer, build_price_figure
+
+
+def make_ohlcv(rows, freq='B', seed=0):
+    """
+    Random-walk OHLCV frame with 'rows' bars at the given pandas frequency.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    open_ = close * np.exp(rng.normal(0, 0.003, rows))
+    spread = np.abs(rng.normal(0, 0.005, rows)) * close
+    return pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + spread,
+                         'Low': np.minimum(open_, close) - spread, 'Close': close,
+                         'Volume': rng.integers(1_000, 1_000_000, rows)},
+                        index=pd.date_range('1990-01-02', periods=rows, freq=freq, name='Date'))
+
+
+def render(ticker, df, path, max_bars):
+    """
+    Builds and writes the price chart; returns (seconds, HTML size in bytes).
+    """
+    start = time.perf_counter()
+    build_price_figure(ticker, df, max_bars=max_bars).write_html(path, include_plotlyjs='cdn')
+    return time.perf_counter() - start, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full and downsampled candlestick chart size and render time.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[2_500, 10_000, 100_000, 500_000],
+                        help="History lengths to benchmark")
+    parser.add_argument('--max-bars', type=int, default=1_000, help="Candle budget of the downsampled chart")
+    parser.add_argument('--freq', default='B', help="Bar frequency of the synthetic data (B = daily, min = intraday)")
+    parser.add_argument('--output-dir', default='benchmark_output', help="Where the HTML files are written")
+    args = parser.parse_args()
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    print(f"{'rows':>9}{'full s':>9}{'full MB':>9}{'lod s':>8}{'lod MB':>8}{'size x':>8}{'time x':>8}")
+    for rows in args.rows:
+        analyzer = StockAnalyzer('SYN', '', data=make_ohlcv(rows, args.freq))
+        df = analyzer.calculate_indicators()
+        full_s, full_bytes = render('SYN', df, os.path.join(args.output_dir, f'full_{rows}.html'), None)
+        lod_s, lod_bytes = render('SYN', df, os.path.join(args.output_dir, f'lod_{rows}.html'), args.max_bars)
+        print(f"{rows:>9,}{full_s:>9.2f}{full_bytes / 1e6:>9.2f}{lod_s:>8.2f}{lod_bytes / 1e6:>8.2f}"
+              f"{full_bytes / lod_bytes:>7.1f}x{full_s / lod_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
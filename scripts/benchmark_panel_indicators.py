@@ -0,0 +1,94 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import talib
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from panel_indicators import PANEL_INDICATORS, compute_panel_indicators
+from stock_analyzer import StockAnalyzer
+
+
+def make_panel(days, tickers, seed=0):
+    """
+    Random-walk close panel with staggered listing dates, a few delisted tickers
+    and scattered missing bars, so the NaN handling is exercised.
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (days, tickers)), axis=0))
+    starts = rng.integers(0, days // 4, tickers)
+    for j, start in enumerate(starts):
+        close[:start, j] = np.nan
+        if j % 10 == 0:
+            close[rng.integers(days // 2, days):, j] = np.nan
+    close[rng.random((days, tickers)) < 0.01] = np.nan
+    dates = pd.bdate_range('2000-01-03', periods=days, name='Date')
+    return pd.DataFrame(close, index=dates, columns=[f'T{j:04d}' for j in range(tickers)])
+
+
+def loop_stock_analyzers(panel):
+    """
+    Baseline: one StockAnalyzer per ticker, indicators computed column by column.
+    """
+    results = {}
+    for ticker in panel.columns:
+        closes = panel[ticker].dropna()
+        analyzer = StockAnalyzer(ticker, '', data=closes.to_frame('Close'))
+        results[ticker] = analyzer.calculate_indicators()
+    return results
+
+
+def max_difference(panel, results):
+    """
+    Largest absolute difference between the panel output and per-ticker TA-Lib
+    (each ticker computed on its own non-missing closes).
+    """
+    worst = 0.0
+    for j, ticker in enumerate(panel.columns):
+        closes = panel[ticker].dropna()
+        values = closes.to_numpy()
+        macd, signal, _ = talib.MACD(values, fastperiod=12, slowperiod=26, signalperiod=9)
+        expected = {'SMA_20': talib.SMA(values, 20), 'SMA_50': talib.SMA(values, 50),
+                    'RSI': talib.RSI(values, 14), 'MACD': macd, 'MACD_signal': signal}
+        for name in PANEL_INDICATORS:
+            actual = results[name].loc[closes.index, ticker].to_numpy()
+            if not np.array_equal(np.isnan(actual), np.isnan(expected[name])):
+                return float('inf')
+            if (~np.isnan(actual)).any():
+                worst = max(worst, np.nanmax(np.abs(actual - expected[name])))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare panel-wide indicators with looping over StockAnalyzer.")
+    parser.add_argument('--days', type=int, default=2520, help="Trading days in the panel (default: 2520)")
+    parser.add_argument('--tickers', type=int, nargs='+', default=[10, 100, 500], help="Panel widths to benchmark")
+    args = parser.parse_args()
+
+    print(f"{'tickers':>8}{'loop s':>10}{'panel s':>10}{'speedup':>9}{'max |diff|':>13}")
+    for tickers in args.tickers:
+        panel = make_panel(args.days, tickers)
+
+        start = time.perf_counter()
+        loop_stock_analyzers(panel)
+        loop_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = compute_panel_indicators(panel)
+        panel_seconds = time.perf_counter() - start
+
+        difference = max_difference(panel, results)
+        print(f"{tickers:>8}{loop_seconds:>10.3f}{panel_seconds:>10.3f}"
+              f"{loop_seconds / panel_seconds:>8.1f}x{difference:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from correlation_engine import CorrelationEngine
+from data_analysis import NewsAnalyzer
+from instrumentation import PeakMemory
+from market_sentiment import MultiTickerSentimentEngine
+from sentiment import SentimentScorer
+from stock_analyzer import StockAnalyzer
+from synthetic_data import make_ohlcv, write_news_csv, write_ohlcv_csvs
+
+STAGES = ['load', 'textual_lengths', 'prepare_dates', 'calculate_indicators', 'sentiment', 'correlation']
+RESULTS_VERSION = 1
+
+
+def git_commit():
+    """
+    (commit hash, whether the working tree has uncommitted changes); (None, None) outside git.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=project_root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=project_root,
+                                capture_output=True, text=True, check=True).stdout
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+
+
+def prepare_files(data_dir, rows, tickers, days, seed):
+    """
+    Generates (once; files are reused across runs) the synthetic news CSV for a scale and
+    the daily price CSVs it refers to. Returns (news path, ticker -> price path).
+    """
+    price_dir = os.path.join(data_dir, f'prices_t{tickers}_d{days}_s{seed}')
+    price_paths = {f'T{i:03d}': os.path.join(price_dir, f'T{i:03d}_historical_data.csv') for i in range(tickers)}
+    if not all(os.path.exists(path) for path in price_paths.values()):
+        price_paths = write_ohlcv_csvs(price_dir, tickers=tickers, rows=days, seed=seed)
+    last_day = pd.bdate_range('2011-01-03', periods=days)[-1] + pd.Timedelta(days=1)
+
+    news_path = os.path.join(data_dir, f'news_{rows}_t{tickers}_d{days}_s{seed}.csv')
+    if not os.path.exists(news_path):
+        print(f"Generating {rows:,} synthetic headlines -> {news_path}")
+        write_news_csv(news_path + '.tmp', rows, tickers=tickers, start='2011-01-03', end=last_day, seed=seed)
+        os.replace(news_path + '.tmp', news_path)
+    return news_path, price_paths
+
+
+def run_stage(name, func, rows, verbose):
+    """
+    Runs one stage, returning its result and a record with wall time and memory.
+    The stage's own progress output is suppressed unless 'verbose'.
+    """
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    status, result = 'ok', None
+    with PeakMemory() as memory, output:
+        start = time.perf_counter()
+        try:
+            result = func()
+        except Exception as e:
+            status = f"failed: {e}"
+        seconds = time.perf_counter() - start
+    record = {'stage': name, 'rows': rows, 'seconds': round(seconds, 4), 'status': status,
+              'rss_start_mb': round(memory.start / 1e6, 1), 'peak_rss_mb': round(memory.peak / 1e6, 1),
+              'peak_delta_mb': round((memory.peak - memory.start) / 1e6, 1)}
+    return result, record
+
+
+def benchmark_scale(rows, args):
+    """
+    Times every pipeline stage on one synthetic dataset of 'rows' headlines (and as many
+    intraday price bars for the indicator stage). Returns the stage records.
+    """
+    news_path, price_paths = prepare_files(args.data_dir, rows, args.tickers, args.days, args.seed)
+    records = []
+
+    def stage(name, func, stage_rows=rows):
+        if name in args.skip:
+            return None
+        result, record = run_stage(name, func, stage_rows, args.verbose)
+        records.append(record)
+        print(f"{rows:>11,}  {name:<22}{record['seconds']:>9.3f}{record['peak_delta_mb']:>12.1f}"
+              f"{record['peak_rss_mb']:>10.1f}  {'' if record['status'] == 'ok' else record['status']}")
+        return result
+
+    analyzer = NewsAnalyzer(news_path)
+    stage('load', analyzer.load_data)
+    stage('textual_lengths', analyzer.textual_lengths)
+    stage('prepare_dates', analyzer.prepare_dates)
+
+    # Indicators: the same number of bars, as intraday series spread over the tickers
+    bars = max(rows // args.tickers, 1)
+    frames = [make_ohlcv(bars, freq='min', seed=args.seed + i) for i in range(args.tickers)]
+    stage('calculate_indicators',
+          lambda: [StockAnalyzer(f'T{i:03d}', '', data=df).calculate_indicators() for i, df in enumerate(frames)],
+          bars * args.tickers)
+    del frames
+
+    if rows > args.max_sentiment_rows:
+        print(f"{rows:>11,}  sentiment/correlation skipped (above --max-sentiment-rows)")
+        return records
+    scorer = SentimentScorer(max_workers=args.workers)
+    headlines = analyzer.df['headline'] if analyzer.df is not None else pd.Series(dtype=str)
+    stage('sentiment', lambda: scorer.score(headlines))
+
+    # Session-aligned daily sentiment joined to prices, then a -10..+10 lag sweep over all
+    # tickers; headlines are already scored, so this measures alignment and correlation
+    engine = MultiTickerSentimentEngine(news_path, price_paths, scorer=scorer, use_cache=False, align='session')
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine.load_news()
+    stage('correlation',
+          lambda: CorrelationEngine.from_results(engine.run(), 'VADER_Sentiment').lag_sweep(range(-10, 11)))
+    return records
+
+
+def compare(results, baseline_path, threshold, min_seconds):
+    """
+    Prints the time and peak-memory ratios against a previous results file and returns
+    the number of (scale, stage) pairs slower than 'threshold' times the baseline
+    (stages faster than 'min_seconds' in both runs are too noisy to be flagged).
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    previous = {(record['rows_scale'], record['stage']): record for record in baseline['results']}
+    print(f"\nCompared with {baseline_path} (commit {str(baseline.get('commit'))[:12]}):")
+    print(f"{'scale':>11}  {'stage':<22}{'time x':>9}{'memory x':>10}")
+    regressions = 0
+    for record in results:
+        old = previous.get((record['rows_scale'], record['stage']))
+        if old is None or old['seconds'] <= 0:
+            continue
+        time_ratio = record['seconds'] / old['seconds']
+        memory_ratio = record['peak_delta_mb'] / old['peak_delta_mb'] if old['peak_delta_mb'] > 0 else np.nan
+        noisy = max(record['seconds'], old['seconds']) < min_seconds
+        flag = '  <-- slower' if time_ratio > threshold and not noisy else ''
+        regressions += bool(flag)
+        print(f"{record['rows_scale']:>11,}  {record['stage']:<22}{time_ratio:>8.2f}x{memory_ratio:>9.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the analysis pipeline stages on synthetic data at several scales.")
+    parser.add_argument('--scales', type=int, nargs='+', default=[10_000, 100_000, 1_000_000],
+                        help="Numbers of news rows to benchmark (e.g. 10000 ... 10000000)")
+    parser.add_argument('--tickers', type=int, default=10, help="Number of tickers (price files)")
+    parser.add_argument('--days', type=int, default=2_520, help="Daily bars per price file")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the synthetic data")
+    parser.add_argument('--workers', type=int, default=None, help="Sentiment scoring processes (default: all CPUs)")
+    parser.add_argument('--max-sentiment-rows', type=int, default=1_000_000,
+                        help="Skip sentiment scoring and correlation above this many rows")
+    parser.add_argument('--skip', nargs='*', default=[], choices=STAGES, help="Stages to leave out")
+    parser.add_argument('--data-dir', default=os.path.join('benchmark_output', 'data'),
+                        help="Where synthetic inputs are generated and reused")
+    parser.add_argument('--output', help="Results JSON (default: benchmark_output/pipeline_<commit>.json)")
+    parser.add_argument('--compare', help="Previous results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=1.2, help="Slowdown ratio reported as a regression")
+    parser.add_argument('--min-seconds', type=float, default=0.05,
+                        help="Stages shorter than this are not flagged as regressions")
+    parser.add_argument('--verbose', action='store_true', help="Show the pipeline's own progress messages")
+    args = parser.parse_args()
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    commit, dirty = git_commit()
+    print(f"{'scale':>11}  {'stage':<22}{'seconds':>9}{'peak +MB':>12}{'RSS MB':>10}")
+    results = []
+    for rows in args.scales:
+        for record in benchmark_scale(rows, args):
+            results.append({'rows_scale': rows, **record})
+
+    output = args.output or os.path.join('benchmark_output', f"pipeline_{(commit or 'nogit')[:12]}.json")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'commit': commit,
+            'dirty': dirty,
+            'created': pd.Timestamp.now(tz='UTC').isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'packages': {'numpy': np.__version__, 'pandas': pd.__version__},
+            'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare', 'verbose')},
+            'results': results,
+        }, f, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold, args.min_seconds)
+        if regressions:
+            print(f"{regressions} stage(s) slower than {args.threshold}x the baseline.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
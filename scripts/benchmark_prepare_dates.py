@@ -0,0 +1,82 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from data_analysis import NewsAnalyzer
+
+DEFAULT_CSV = os.path.join(project_root, 'Data', 'raw_analyst_ratings', 'raw_analyst_ratings.csv')
+DERIVED_COLUMNS = ['year', 'month', 'day_of_week', 'date_only', 'hour']
+
+
+def make_dates(rows, seed=0):
+    """
+    Synthetic date column shaped like the analyst ratings file: a minority of
+    timestamps with a UTC offset, the rest naive.
+    """
+    rng = np.random.default_rng(seed)
+    stamps = pd.Timestamp('2011-01-01') + pd.to_timedelta(rng.integers(0, 10 * 365 * 86400, rows), unit='s')
+    text = pd.Series(stamps.strftime('%Y-%m-%d %H:%M:%S'))
+    with_offset = rng.random(rows) < 0.05
+    text[with_offset] = text[with_offset] + np.where(rng.random(with_offset.sum()) < 0.5, '-04:00', '-05:00')
+    return pd.DataFrame({'date': text})
+
+
+def legacy_prepare_dates(df, date_column='date'):
+    """
+    The previous implementation: format-less parsing, day names and Python date objects.
+    """
+    df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
+    df.dropna(subset=[date_column], inplace=True)
+    df['year'] = df[date_column].dt.year
+    df['month'] = df[date_column].dt.month
+    df['day_of_week'] = df[date_column].dt.day_name()
+    df['date_only'] = df[date_column].dt.date
+    df['hour'] = df[date_column].dt.hour
+    return df
+
+
+def measure(name, prepare, source):
+    df = source.copy()
+    start = time.perf_counter()
+    try:
+        df = prepare(df)
+        status = ''
+    except Exception as e:
+        status = f"failed: {e}"
+    elapsed = time.perf_counter() - start
+    present = [column for column in DERIVED_COLUMNS if column in df.columns]
+    derived_mb = df[present].memory_usage(deep=True, index=False).sum() / 1e6
+    print(f"{name:<8}{elapsed:>9.2f}{len(source) - len(df):>14,}{derived_mb:>12.1f}  {status}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewsAnalyzer.prepare_dates against the legacy parsing path.")
+    parser.add_argument('--csv', default=DEFAULT_CSV, help="News CSV with a 'date' column (default: the analyst ratings file)")
+    parser.add_argument('--rows', type=int, default=1_400_000, help="Synthetic rows used when the CSV is missing")
+    args = parser.parse_args()
+
+    if os.path.exists(args.csv):
+        source = pd.read_csv(args.csv, usecols=['date'])
+        print(f"Loaded {len(source):,} dates from {args.csv}")
+    else:
+        source = make_dates(args.rows)
+        print(f"'{args.csv}' not found; using {len(source):,} synthetic dates")
+
+    print(f"{'path':<8}{'seconds':>9}{'rows dropped':>14}{'derived MB':>12}")
+    measure('legacy', legacy_prepare_dates, source)
+    analyzer = NewsAnalyzer(args.csv)
+    measure('fast', analyzer.prepare_dates, source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from sentiment import SentimentScorer
+from synthetic_data import make_headlines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sentiment scoring throughput for several process-pool sizes.")
+    parser.add_argument('--rows', type=int, default=50_000, help="Number of headlines to score (default: 50,000)")
+    parser.add_argument('--csv', help="Optional news CSV to take headlines from instead of synthetic ones")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, os.cpu_count() or 1],
+                        help="Pool sizes to benchmark")
+    args = parser.parse_args()
+
+    if args.csv:
+        headlines = pd.read_csv(args.csv, usecols=['headline'], nrows=args.rows)['headline']
+    else:
+        # Synthetic headlines are nearly all distinct, so deduplication does not hide the scoring cost
+        headlines = make_headlines(args.rows)
+
+    print(f"{'workers':>8}{'seconds':>10}{'headlines/sec':>16}{'speedup':>9}")
+    baseline = None
+    for workers in sorted(set(args.workers)):
+        scorer = SentimentScorer(max_workers=workers) # No persistent cache: every run scores from scratch
+        start = time.perf_counter()
+        scorer.score(headlines)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>10.2f}{len(headlines) / elapsed:>16,.0f}{baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from synthetic_data import make_headlines
+from text_stats import headline_word_counts, text_stats, token_summary
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized headline text statistics against Series.apply.")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="Number of synthetic headlines (default: 1,000,000)")
+    parser.add_argument('--csv', help="Optional news CSV to benchmark instead of synthetic headlines")
+    args = parser.parse_args()
+
+    if args.csv:
+        headlines = pd.read_csv(args.csv, usecols=['headline'])['headline']
+    else:
+        headlines = make_headlines(args.rows)
+    print(f"Benchmarking on {len(headlines):,} headlines...")
+
+    baseline, t_apply = timed(lambda s: s.apply(lambda x: len(str(x).split())), headlines)
+    counts, t_counts = timed(headline_word_counts, headlines)
+    stats, t_stats = timed(text_stats, headlines)
+    summary, t_summary = timed(token_summary, headlines)
+
+    if not (baseline.to_numpy() == counts.to_numpy()).all() or not (baseline.to_numpy() == stats['word_count'].to_numpy()).all():
+        print("Error: vectorized word counts differ from the Series.apply baseline.")
+        sys.exit(1)
+
+    print(f"{'Series.apply (baseline)':<28}{t_apply:>8.3f}s")
+    print(f"{'headline_word_counts':<28}{t_counts:>8.3f}s  ({t_apply / t_counts:.1f}x)")
+    print(f"{'text_stats':<28}{t_stats:>8.3f}s  ({t_apply / t_stats:.1f}x)")
+    print(f"{'token_summary':<28}{t_summary:>8.3f}s")
+    print("Word counts match the baseline.")
+    print(f"Token summary: {summary}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import argparse
+import os
+import sys
+import time
+
+# Get the directory of the current script (build_bar_store.py)
+script_dir = os.path.dirname(__file__)
+
+# Construct the path to the project root (one level up from 'scripts')
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+# Default data paths: the repository's Data/ folder from a checkout; for the installed
+# commands (where project_root is site-packages), Data/ under the working directory
+data_root = project_root if not __package__ else os.curdir
+from bar_store import BarStore
+from batch_runner import load_manifest, manifest_from_directory
+from stock_analyzer import read_price_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert yfinance OHLCV CSVs into a memory-mapped bar store.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--manifest', help="JSON ({ticker: path}) or CSV (ticker,path) manifest")
+    source.add_argument('--data-dir', default=os.path.join(data_root, 'Data', 'yfinance_data'),
+                        help="Directory of <TICKER>_historical_data.csv files (default: Data/yfinance_data)")
+    parser.add_argument('--store', default=os.path.join(data_root, 'Data', 'bar_store'),
+                        help="Bar store directory (default: Data/bar_store)")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="Rewrite tickers already in the store instead of appending only newer bars")
+    args = parser.parse_args()
+
+    manifest = load_manifest(args.manifest) if args.manifest else manifest_from_directory(args.data_dir)
+    if not manifest:
+        print("Error: no price files found.")
+        sys.exit(1)
+
+    store = BarStore(args.store)
+    print(f"{'ticker':<8}{'action':<10}{'bars':>9}{'stored':>9}{'seconds':>9}")
+    for ticker, path in manifest.items():
+        start = time.perf_counter()
+        try:
+            df = read_price_csv(path)
+            if ticker in store and not args.rebuild:
+                bars = store.open(ticker, mode='r+')
+                action, added = 'append', bars.append(df)
+            else:
+                bars = store.write(ticker, df)
+                action, added = 'write', len(bars)
+            print(f"{ticker:<8}{action:<10}{added:>9,}{len(bars):>9,}{time.perf_counter() - start:>9.2f}")
+        except Exception as e:
+            print(f"{ticker:<8}{'FAILED':<10} {e}")
+    print(f"\nBar store ready at '{args.store}' ({len(store.tickers())} tickers).")
+
+
+if __name__ == "__main__":
+    main()
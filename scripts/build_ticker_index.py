@@ -0,0 +1,51 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+# Get the directory of the current script (build_ticker_index.py)
+script_dir = os.path.dirname(__file__)
+
+# Construct the path to the project root (one level up from 'scripts')
+project_root = os.path.abspath(os.path.join(script_dir, '..'))
+
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+# Default data paths: the repository's Data/ folder from a checkout; for the installed
+# commands (where project_root is site-packages), Data/ under the working directory
+data_root = project_root if not __package__ else os.curdir
+from ticker_index import TickerIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or update the ticker -> row index of a news CSV.")
+    parser.add_argument('--news-file', default=os.path.join(data_root, 'Data', 'raw_analyst_ratings', 'raw_analyst_ratings.csv'),
+                        help="News CSV (default: Data/raw_analyst_ratings/raw_analyst_ratings.csv)")
+    parser.add_argument('--aliases', help="JSON file mapping tickers to company names matched in headlines")
+    parser.add_argument('--index-dir', help="Index directory (default: .ticker_index next to the CSV)")
+    parser.add_argument('--no-symbols', action='store_true', help="Do not match ticker symbols in headlines")
+    parser.add_argument('--rebuild', action='store_true', help="Re-index the whole file")
+    parser.add_argument('--top', type=int, default=10, help="Tickers to list")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.news_file):
+        print(f"Error: The file '{args.news_file}' was not found.")
+        sys.exit(1)
+    aliases = None
+    if args.aliases:
+        with open(args.aliases) as f:
+            aliases = json.load(f)
+
+    start = time.perf_counter()
+    index = TickerIndex(args.news_file, index_dir=args.index_dir, aliases=aliases, match_symbols=not args.no_symbols)
+    added = index.rebuild() if args.rebuild else index.update()
+    print(f"Indexed {added:,} new rows in {time.perf_counter() - start:.2f}s; "
+          f"{len(index):,} rows and {len(index.tickers()):,} tickers in '{index.directory}'.")
+    print(index.counts().head(args.top).to_string())
+
+
+if __name__ == "__main__":
+    main()
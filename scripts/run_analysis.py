@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 
@@ -7,37 +8,74 @@ script_dir = os.path.dirname(__file__)
 # Construct the path to the project root (one level up from 'scripts')
 project_root = os.path.abspath(os.path.join(script_dir, '..'))
 
-# Add the 'src' directory to Python's module search path
-sys.path.insert(0, os.path.join(project_root, 'src'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+# Default data paths: the repository's Data/ folder from a checkout; for the installed
+# commands (where project_root is site-packages), Data/ under the working directory
+data_root = project_root if not __package__ else os.curdir
 
 # Now you can import directly from 'data_analysis' since 'src' is in sys.path
+import instrumentation
 from data_analysis import NewsAnalyzer
+from rendering import FigureRenderer
 
-if __name__ == "__main__":
-    # Define the data filepath relative to the project root
-    data_filepath = os.path.join(project_root, 'Data', 'raw_analyst_ratings', 'raw_analyst_ratings.csv')
 
-    analyzer = NewsAnalyzer(data_filepath)
+def main():
+    parser = argparse.ArgumentParser(description="Exploratory analysis of the analyst ratings news file.")
+    parser.add_argument('--news-file', default=os.path.join(data_root, 'Data', 'raw_analyst_ratings', 'raw_analyst_ratings.csv'),
+                        help="News CSV (default: Data/raw_analyst_ratings/raw_analyst_ratings.csv)")
+    parser.add_argument('--render-dir', help="Write figures to this directory in the background instead of showing them")
+    parser.add_argument('--formats', nargs='+', default=['png'], help="Figure formats when rendering (png, svg, pdf)")
+    parser.add_argument('--report', help="Also save the EDA report (all aggregates) to this JSON file")
+    parser.add_argument('--instrument', choices=instrumentation.OUTPUTS,
+                        help="Time every stage: print a summary table at the end, or write JSON lines")
+    parser.add_argument('--instrument-log', help="JSON lines file for --instrument json (default: stderr)")
+    parser.add_argument('--profile', choices=instrumentation.PROFILERS, help="Profile each stage (with --instrument)")
+    parser.add_argument('--profile-dir', help="Directory for the per-stage .prof files of --profile cprofile")
+    parser.add_argument('--memory', choices=instrumentation.MEMORY_MODES,
+                        help="Also sample each stage's peak RSS: top-level stages only, or all (with --instrument)")
+    args = parser.parse_args()
+    if args.instrument:
+        instrumentation.configure(output=args.instrument, log_path=args.instrument_log,
+                                  profile=args.profile, profile_dir=args.profile_dir, memory=args.memory)
+
+    renderer = FigureRenderer(args.render_dir, formats=args.formats) if args.render_dir else None
+    analyzer = NewsAnalyzer(args.news_file, renderer=renderer)
 
     print("--- Loading Data ---")
-    analyzer.load_data()
+    analyzer.load_data(use_cache=True) # Parquet cache makes repeat runs skip CSV parsing
 
     if analyzer.df is not None:
+        print("\n--- Building EDA Report ---")
+        report = analyzer.build_report() # One scan computes every aggregate used below
+        if args.report and report is not None:
+            report.save(args.report)
+
         print("\n--- Descriptive Statistics for Headline Lengths ---")
-        analyzer.textual_lengths()
         analyzer.descriptive_statistics()
         analyzer.headline_length_visualization()
 
         print("\n--- Articles per Publisher Analysis ---")
-        analyzer.articles_per_publisher()
         analyzer.top_publishers()
         analyzer.publisher_visualization()
 
         print("\n--- Date-Based Analyses ---")
-        analyzer.prepare_dates()
         analyzer.articles_by_day_of_week()
         analyzer.articles_over_time(resampling_freq='D')
         analyzer.articles_by_month()
         analyzer.articles_by_hour()
     else:
-        print("\nData could not be loaded. Exiting analysis.")
\ No newline at end of file
+        print("\nData could not be loaded. Exiting analysis.")
+
+    if renderer is not None:
+        print(renderer.close().to_string(index=False))
+
+    if args.instrument == 'table':
+        print("\n--- Stage Timings ---")
+        instrumentation.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 
@@ -8,8 +9,10 @@ script_dir = os.path.dirname(__file__)
 # Construct the path to the project root (one level up from 'scripts')
 project_root = os.path.abspath(os.path.join(script_dir, '..'))
 
-# Add the 'src' directory to Python's module search path
-sys.path.insert(0, os.path.join(project_root, 'src'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
 # Import the StockAnalyzer class from our custom module
 from stock_analyzer import StockAnalyzer
 
@@ -28,16 +31,19 @@ stock_files = {
 base_data_dir = "../../Data/yfinance_data/"
 
 def main():
+    parser = argparse.ArgumentParser(description="Print the financial metrics of each tracked stock.")
+    parser.add_argument('--data-dir', default=base_data_dir, help=f"Directory of the yfinance CSVs (default: {base_data_dir})")
+    args = parser.parse_args()
     print("Setup complete. StockAnalyzer class imported.")
 
     # Loop through each company and its CSV file
     for ticker, filename in stock_files.items():
         print(f"\n==============    {ticker} STOCK ANALYSIS    ==============")
         # Construct the full file path
-        full_data_path = os.path.join(base_data_dir, filename)
+        full_data_path = os.path.join(args.data_dir, filename)
         
         # Initialize StockAnalyzer with the ticker and the full file path
-        analyzer = StockAnalyzer(ticker, full_data_path)
+        analyzer = StockAnalyzer(ticker, full_data_path, use_cache=True)
         
         # # Display financial metrics
         analyzer.show_financial_metrics()
@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Add the 'src' directory to Python's module search path when running from a checkout
+# (the console entry points of an installed package import the modules directly)
+if not __package__:
+    sys.path.insert(0, os.path.join(project_root, 'src'))
+
+from streaming_pipeline import StreamingSentimentPipeline, tail_bars, tail_headlines
+from synthetic_data import make_headlines, make_ohlcv, ticker_names
+
+
+async def simulate_feeds(news_path, bars_path, closes, rate, duration, seed):
+    """
+    Appends synthetic headlines ('rate' per second, spread over the tickers of 'closes')
+    and one price bar per ticker per second, continuing from its last close, to the two
+    CSVs, as a live feed writer would.
+    """
+    rng = np.random.default_rng(seed)
+    names = list(closes)
+    tickers = len(names)
+    with open(news_path, 'a', newline='') as news_file, open(bars_path, 'a', newline='') as bars_file:
+        news, bars = csv.writer(news_file), csv.writer(bars_file)
+        start = time.monotonic()
+        second = 0
+        while time.monotonic() - start < duration:
+            for text in make_headlines(max(int(rate), 1), seed=seed + second):
+                news.writerow([text, names[rng.integers(tickers)], time.strftime('%Y-%m-%d %H:%M:%S')])
+                news_file.flush()
+                await asyncio.sleep(1 / rate)
+            for ticker in names:
+                closes[ticker] *= float(np.exp(rng.normal(0, 0.01)))
+                bars.writerow([ticker, time.strftime('%Y-%m-%d %H:%M:%S'), *[round(closes[ticker], 4)] * 4, 1000])
+            bars_file.flush()
+            second += 1
+
+
+async def run(args):
+    pipeline = StreamingSentimentPipeline(headline_window=args.headline_window, bar_window=args.bar_window,
+                                          max_queue=args.max_queue, batch_size=args.batch_size,
+                                          batch_delay=args.batch_delay, score_cache=args.score_cache,
+                                          memo_size=args.memo_size)
+    if args.print_signals:
+        pipeline.on_signal.append(lambda update: print(json.dumps(update, default=str)))
+
+    tail_options = {'poll_interval': args.poll_interval, 'from_start': args.from_start,
+                    'idle_timeout': args.idle_timeout}
+    tasks = []
+    if args.simulate:
+        for path, header in ((args.news_file, ['headline', 'stock', 'date']),
+                             (args.bars_file, ['Ticker', 'Date', 'Open', 'High', 'Low', 'Close', 'Volume'])):
+            with open(path, 'w', newline='') as f:
+                csv.writer(f).writerow(header)
+        # Warm the indicators up on a synthetic daily history, so RSI/MACD are live from the first bar
+        closes = {}
+        for i, ticker in enumerate(ticker_names(args.tickers)):
+            history = make_ohlcv(300, seed=args.seed + i)['Close']
+            pipeline.warm_up(ticker, history)
+            closes[ticker] = float(history.iloc[-1])
+        # Bars arrive about once per simulated second: stop a little after the feed does
+        tail_options['idle_timeout'] = max(3.0, 5 * args.poll_interval)
+        tasks.append(asyncio.create_task(simulate_feeds(args.news_file, args.bars_file, closes,
+                                                        args.rate, args.duration, args.seed)))
+    try:
+        await pipeline.run(tail_headlines(args.news_file, **tail_options), tail_bars(args.bars_file, **tail_options))
+        await asyncio.gather(*tasks)
+    finally:
+        pipeline.close()
+    return pipeline
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep per-ticker sentiment signals up to date from live headline and price feeds.")
+    parser.add_argument('--news-file', default=os.path.join('stream_output', 'headlines.csv'),
+                        help="Headline CSV being appended to (headline, stock, date columns)")
+    parser.add_argument('--bars-file', default=os.path.join('stream_output', 'bars.csv'),
+                        help="Price bar CSV being appended to (Ticker, Date, Open, High, Low, Close, Volume)")
+    parser.add_argument('--from-start', action='store_true', help="Process rows already in the files")
+    parser.add_argument('--idle-timeout', type=float, default=None,
+                        help="Stop after this many seconds without new rows (default: run until interrupted)")
+    parser.add_argument('--poll-interval', type=float, default=0.05, help="Seconds between checks for new rows")
+    parser.add_argument('--headline-window', type=int, default=50, help="Recent headlines per ticker in the rolling sentiment")
+    parser.add_argument('--bar-window', type=int, default=256, help="Recent bars kept per ticker")
+    parser.add_argument('--max-queue', type=int, default=1_000, help="Queued events before producers are slowed down")
+    parser.add_argument('--batch-size', type=int, default=64, help="Maximum headlines per scoring batch")
+    parser.add_argument('--batch-delay', type=float, default=0.01, help="Maximum seconds a headline waits for its batch")
+    parser.add_argument('--score-cache', default=None,
+                        help="SQLite file caching headline scores across runs (e.g. cache/sentiment_scores.sqlite)")
+    parser.add_argument('--memo-size', type=int, default=10_000,
+                        help="Distinct headline scores kept in memory (older repeats come from --score-cache)")
+    parser.add_argument('--print-signals', action='store_true', help="Print every signal update as a JSON line")
+    parser.add_argument('--simulate', action='store_true',
+                        help="Write synthetic feeds to --news-file/--bars-file while processing them")
+    parser.add_argument('--tickers', type=int, default=5, help="Simulated tickers")
+    parser.add_argument('--rate', type=float, default=200, help="Simulated headlines per second")
+    parser.add_argument('--duration', type=float, default=10, help="Seconds of simulated feed")
+    parser.add_argument('--seed', type=int, default=0, help="Seed of the simulated feed")
+    args = parser.parse_args()
+    if args.simulate:
+        for path in (args.news_file, args.bars_file):
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    elif not os.path.exists(args.news_file) and not os.path.exists(args.bars_file):
+        print(f"Warning: neither '{args.news_file}' nor '{args.bars_file}' exists yet; waiting for them.")
+
+    try:
+        pipeline = asyncio.run(run(args))
+    except KeyboardInterrupt:
+        return
+
+    print("\nArrival-to-signal latency:")
+    for kind, stats in pipeline.latency_summary().items():
+        print(f"  {kind:<9}" + "  ".join(f"{key}={value}" for key, value in stats.items()))
+    print("\nLatest signals:")
+    for ticker, update in sorted(pipeline.latest.items()):
+        print(f"  {ticker:<6} signal={update['signal']:+d} VADER_mean={update['VADER_mean']:.3f} "
+              f"headlines={update['headlines']} bars={update['bars']} RSI={update['RSI']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from instrumentation import log
+from panel_indicators import compute_panel_indicators
+
+GATES = ('none', 'rsi', 'macd', 'rsi_macd')
+SCORE_COLUMNS = ('VADER_Sentiment', 'TextBlob_Sentiment')
+METRIC_COLUMNS = ['days', 'total_return', 'annual_return', 'sharpe', 'max_drawdown', 'turnover', 'exposure', 'trades']
+TRADING_DAYS = 252
+# Upper bound on the number of float64 elements of one (gates x thresholds x dates x
+# tickers) position cube (about 64 MB); larger grids are split into ticker blocks.
+BATCH_ELEMENTS = 8_000_000
+
+
+def _check_lags(lags):
+    """
+    Rejects negative lags: lag -1 would trade on the decision day's own score (lookahead)
+    and lags below that on future scores.
+    """
+    negative = [lag for lag in lags if lag < 0]
+    if negative:
+        raise ValueError(f"Lags must be >= 0 (got {negative}): a negative lag trades on scores "
+                         f"that are not known at the decision close")
+
+
+def _shift(values, periods):
+    """values[t - periods] aligned on row t (NaN where it does not exist), along axis 0."""
+    out = np.full(values.shape, np.nan)
+    if 0 < periods < len(values):
+        out[periods:] = values[:-periods]
+    elif periods == 0:
+        out[:] = values
+    return out
+
+
+def _day_index(index):
+    """Tz-naive, normalized DatetimeIndex (price and indicator frames may carry a timezone)."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize()
+
+
+def _gate_masks(rsi, macd, macd_signal, gates, rsi_overbought, rsi_oversold):
+    """
+    (allow long, allow short) boolean panels per gate, evaluated on the decision day.
+    A gate needs its indicator: while RSI/MACD are still in their lookback, the gated
+    strategies stay flat.
+    """
+    with np.errstate(invalid='ignore'):
+        rsi_long, rsi_short = rsi < rsi_overbought, rsi > rsi_oversold
+        macd_long, macd_short = macd > macd_signal, macd < macd_signal
+    always = np.ones(rsi.shape, dtype=bool)
+    masks = {'none': (always, always), 'rsi': (rsi_long, rsi_short), 'macd': (macd_long, macd_short),
+             'rsi_macd': (rsi_long & macd_long, rsi_short & macd_short)}
+    return np.stack([masks[gate][0] for gate in gates]), np.stack([masks[gate][1] for gate in gates])
+
+
+def _positions(score, allow_long, allow_short, thresholds, lag, long_only):
+    """
+    Position cube (gates x thresholds x dates x tickers) held over each day: +1 when the
+    score of 'lag' days before the decision day is above the threshold, -1 when below
+    minus the threshold (unless long_only), 0 otherwise. The decision is taken at the
+    previous close, so day d uses the score of day d - 1 - lag and the gates of day d - 1.
+    """
+    signal = _shift(score, 1 + lag)[None, None]
+    allow_long = _shift(allow_long.swapaxes(0, 1), 1).swapaxes(0, 1) == 1
+    allow_short = _shift(allow_short.swapaxes(0, 1), 1).swapaxes(0, 1) == 1
+    th = np.asarray(thresholds, dtype=float)[None, :, None, None]
+    with np.errstate(invalid='ignore'):
+        position = ((signal > th) & allow_long[:, None]).astype(float)
+        if not long_only:
+            position -= (signal < -th) & allow_short[:, None]
+    return position
+
+
+def _metrics(position, returns, valid, cost):
+    """
+    Per-(gate, threshold, ticker) statistics of a position cube, reduced along the date
+    axis: daily PnL is position x return minus 'cost' per unit of position change.
+    Works in place on a few cube-sized buffers (the cube dominates memory and time).
+    """
+    # Position changes; dropping to flat after a ticker's last bar is not a trade
+    change = np.empty_like(position)
+    change[:, :, 0] = position[:, :, 0]
+    np.subtract(position[:, :, 1:], position[:, :, :-1], out=change[:, :, 1:])
+    np.abs(change, out=change)
+    change *= valid
+    pnl = position * returns
+    pnl -= cost * change
+    days = valid.sum(axis=0)
+    pnl_sum = pnl.sum(axis=2)
+    pnl_squares = np.einsum('gktn,gktn->gkn', pnl, pnl)
+    exposure = np.abs(position).sum(axis=2)
+    trades = np.count_nonzero(np.logical_and(change, position), axis=2)
+    turnover = change.sum(axis=2)
+
+    # Equity curve and drawdown (reusing the PnL and change buffers)
+    pnl += 1.0
+    equity = np.cumprod(pnl, axis=2, out=pnl)
+    peak = np.maximum.accumulate(equity, axis=2, out=change)
+    np.divide(equity, peak, out=peak)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = pnl_sum / days
+        std = np.sqrt(np.maximum(pnl_squares / days - mean * mean, 0.0) * days / (days - 1))
+        total = equity[:, :, -1] - 1.0
+        return {
+            'days': np.broadcast_to(days, total.shape),
+            'total_return': total,
+            'annual_return': np.where(total > -1, (1.0 + total) ** (TRADING_DAYS / days) - 1.0, -1.0),
+            'sharpe': np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS), np.nan),
+            'max_drawdown': peak.min(axis=2) - 1.0,
+            'turnover': turnover / days,
+            'exposure': exposure / days,
+            'trades': trades,
+        }
+
+
+def _run_block(panels, tickers, columns, thresholds, lags, gates, long_only, cost, rsi_overbought, rsi_oversold):
+    """
+    Every configuration of the grid on one block of tickers (runs in pool workers).
+    Returns the per-(configuration, ticker) metrics as a long DataFrame.
+    """
+    returns = panels['returns']
+    valid = ~np.isnan(returns)
+    returns = np.where(valid, returns, 0.0)
+    allow_long, allow_short = _gate_masks(panels['RSI'], panels['MACD'], panels['MACD_signal'], gates,
+                                          rsi_overbought, rsi_oversold)
+    allow_long, allow_short = allow_long.astype(float), allow_short.astype(float)
+
+    frames = []
+    shape = (len(gates), len(thresholds), len(tickers))
+    for column, lag in itertools.product(columns, lags):
+        position = _positions(panels[column], allow_long, allow_short, thresholds, lag, long_only)
+        position[:, :, ~valid] = 0.0 # No position on days without a bar
+        metrics = _metrics(position, returns, valid, cost)
+        gate_index, threshold_index, ticker_index = np.indices(shape).reshape(3, -1)
+        frame = pd.DataFrame({'column': column, 'lag': lag,
+                              'threshold': np.asarray(thresholds, dtype=float)[threshold_index],
+                              'gate': np.asarray(gates, dtype=object)[gate_index],
+                              'ticker': np.asarray(tickers, dtype=object)[ticker_index]})
+        for name in METRIC_COLUMNS:
+            frame[name] = metrics[name].reshape(-1)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+class SentimentBacktester:
+    """
+    Vectorized backtest of sentiment threshold strategies on the daily price/sentiment
+    frames of MultiTickerSentimentEngine.run().
+
+    Each day's position comes from the previous close: long when the (lagged) mean
+    VADER or TextBlob score is above a threshold, short when it is below minus the
+    threshold, optionally gated by RSI (no longs when overbought, no shorts when
+    oversold) and/or MACD (trade with the MACD/signal crossover). Data is held as
+    (dates x tickers) panels, and a whole grid of thresholds and gates is evaluated as
+    one (gates x thresholds x dates x tickers) position cube per score column and lag:
+    PnL, turnover, equity and drawdown are array reductions along the date axis, with
+    no per-day loop. Returns are close-to-close (Daily_Return / 100); 'cost_bps' is
+    charged per unit of position change.
+
+    The scores must be session-aligned (MultiTickerSentimentEngine(align='session')): a
+    day's score may only contain news published before that day's close. With the
+    engine's default align='calendar', a day's UTC-calendar score also holds news from
+    after the close, so trading on it at that close would use future information.
+    """
+    def __init__(self, scores: dict, returns: pd.DataFrame, indicators: dict):
+        """
+        'scores' maps score columns to (dates x tickers) panels, 'returns' holds daily
+        returns as fractions and 'indicators' the RSI/MACD/MACD_signal panels, all on
+        the same index and columns. Use from_results() to build them.
+        """
+        self.scores = scores
+        self.returns = returns
+        self.indicators = indicators
+        self.tickers = list(returns.columns)
+        self.dates = returns.index
+
+    @classmethod
+    def from_results(cls, results: dict, indicators: dict = None, score_columns=SCORE_COLUMNS,
+                     return_column: str = 'Daily_Return'):
+        """
+        Builds the panels from a ticker -> frame dict such as MultiTickerSentimentEngine.run()
+        ('Daily_Return' in percent). 'indicators' is an optional ticker -> frame dict with
+        RSI/MACD/MACD_signal columns, e.g. {ticker: StockAnalyzer(...).calculate_indicators()};
+        without it they are computed from the frames' Close column with
+        panel_indicators.compute_panel_indicators (the same TA-Lib definitions).
+
+        Raises ValueError for frames that MultiTickerSentimentEngine built with
+        align='calendar' (see the class docstring); frames that do not record their
+        alignment are assumed to be session-aligned, with a warning.
+        """
+        alignments = {df.attrs.get('sentiment_alignment') for df in results.values()}
+        if 'calendar' in alignments:
+            raise ValueError("Sentiment aligned to calendar days includes news published after the decision "
+                             "close; build the results with MultiTickerSentimentEngine(..., align='session').")
+        if None in alignments:
+            log("Warning: the results do not record how sentiment was aligned to trading days; "
+                "assuming session alignment (MultiTickerSentimentEngine(align='session')).")
+        frames = {ticker: df.set_axis(_day_index(df.index)) for ticker, df in results.items()}
+        returns = pd.DataFrame({ticker: df[return_column] for ticker, df in frames.items()}).sort_index() / 100
+        scores = {column: pd.DataFrame({ticker: df[column] for ticker, df in frames.items()})
+                  .reindex(index=returns.index, columns=returns.columns) for column in score_columns}
+        if indicators is None:
+            close = pd.DataFrame({ticker: df['Close'] for ticker, df in frames.items()}).reindex(
+                index=returns.index, columns=returns.columns)
+            panels = compute_panel_indicators(close)
+        else:
+            indicators = {ticker: df.set_axis(_day_index(df.index)) for ticker, df in indicators.items()}
+            panels = {name: pd.DataFrame({ticker: df[name] for ticker, df in indicators.items()})
+                      .reindex(index=returns.index, columns=returns.columns) for name in ('RSI', 'MACD', 'MACD_signal')}
+        return cls(scores, returns, {name: panels[name] for name in ('RSI', 'MACD', 'MACD_signal')})
+
+    def _block_panels(self, columns, block):
+        panels = {column: self.scores[column].iloc[:, block].to_numpy(dtype=float) for column in columns}
+        panels['returns'] = self.returns.iloc[:, block].to_numpy(dtype=float)
+        for name, panel in self.indicators.items():
+            panels[name] = panel.iloc[:, block].to_numpy(dtype=float)
+        return panels
+
+    def run(self, column='VADER_Sentiment', threshold=0.05, lag=0, gate='none', long_only=False, cost_bps=0.0,
+            rsi_overbought=70, rsi_oversold=30) -> dict:
+        """
+        One configuration on every ticker. Returns a dict of (dates x tickers) DataFrames
+        ('position', 'pnl', 'equity', 'drawdown') and the per-ticker 'metrics'.
+        'lag' must be >= 0 (0 trades at a day's close on that day's score).
+        """
+        if gate not in GATES:
+            raise ValueError(f"gate must be one of {GATES}")
+        _check_lags([lag])
+        panels = self._block_panels([column], slice(None))
+        returns = panels['returns']
+        valid = ~np.isnan(returns)
+        returns = np.where(valid, returns, 0.0)
+        allow_long, allow_short = _gate_masks(panels['RSI'], panels['MACD'], panels['MACD_signal'], [gate],
+                                              rsi_overbought, rsi_oversold)
+        position = _positions(panels[column], allow_long.astype(float), allow_short.astype(float), [threshold],
+                              lag, long_only)
+        position[:, :, ~valid] = 0.0
+        cost = cost_bps / 10_000
+        metrics = _metrics(position, returns, valid, cost)
+
+        position = position[0, 0]
+        pnl = position * returns - cost * np.abs(np.diff(position, axis=0, prepend=0.0)) * valid
+        equity = np.cumprod(1.0 + pnl, axis=0)
+        panel = lambda values: pd.DataFrame(values, index=self.dates, columns=self.tickers)
+        return {
+            'position': panel(position),
+            'pnl': panel(pnl),
+            'equity': panel(equity),
+            'drawdown': panel(equity / np.maximum.accumulate(equity, axis=0) - 1.0),
+            'metrics': pd.DataFrame({name: metrics[name][0, 0] for name in METRIC_COLUMNS}, index=self.tickers)
+                         .rename_axis('ticker'),
+        }
+
+    def grid(self, columns=SCORE_COLUMNS, thresholds=(0.05,), lags=(0,), gates=GATES, long_only=False,
+             cost_bps=0.0, rsi_overbought=70, rsi_oversold=30, max_workers=1) -> pd.DataFrame:
+        """
+        Evaluates every combination of score column, threshold, lag and gate on every
+        ticker. Tickers are split into blocks sized so a position cube stays under
+        BATCH_ELEMENTS; with max_workers > 1 (None: all CPUs) the blocks run in a process
+        pool. Returns one row per (column, lag, threshold, gate, ticker) with its metrics
+        (see summary() to aggregate over tickers). Lags must be >= 0.
+        """
+        unknown = set(gates) - set(GATES)
+        if unknown:
+            raise ValueError(f"Unknown gates {sorted(unknown)}; use {GATES}")
+        _check_lags(lags)
+        max_workers = max_workers or os.cpu_count() or 1
+        start = time.perf_counter()
+        per_ticker = len(gates) * len(thresholds) * len(self.dates)
+        block_size = max(1, BATCH_ELEMENTS // max(per_ticker, 1))
+        if max_workers > 1: # Enough blocks to keep every worker busy
+            block_size = min(block_size, -(-len(self.tickers) // max_workers))
+        blocks = [slice(i, i + block_size) for i in range(0, len(self.tickers), block_size)]
+        options = (list(columns), list(thresholds), list(lags), list(gates), long_only, cost_bps / 10_000,
+                   rsi_overbought, rsi_oversold)
+
+        if max_workers == 1 or len(blocks) == 1:
+            frames = [_run_block(self._block_panels(columns, block), self.tickers[block], *options)
+                      for block in blocks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(_run_block, self._block_panels(columns, block), self.tickers[block], *options)
+                           for block in blocks]
+                frames = [future.result() for future in futures]
+        results = pd.concat(frames, ignore_index=True)
+        configurations = len(columns) * len(thresholds) * len(lags) * len(gates)
+        log(f"Backtested {configurations} configurations x {len(self.tickers)} tickers "
+            f"in {time.perf_counter() - start:.2f}s.")
+        return results
+
+    @staticmethod
+    def summary(grid_results: pd.DataFrame, sort_by='sharpe') -> pd.DataFrame:
+        """
+        Aggregates grid() results over tickers: mean of each metric per configuration,
+        plus the share of tickers with a positive total return; best 'sort_by' first.
+        """
+        keys = ['column', 'lag', 'threshold', 'gate']
+        table = grid_results.groupby(keys, sort=False)[METRIC_COLUMNS].mean()
+        table['positive_share'] = grid_results.assign(positive=grid_results['total_return'] > 0) \
+            .groupby(keys, sort=False)['positive'].mean()
+        return table.sort_values(sort_by, ascending=False).reset_index()
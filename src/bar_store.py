@@ -0,0 +1,274 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Bump when the on-disk layout changes.
+STORE_FORMAT_VERSION = 1
+BAR_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+DATE_DTYPE = np.dtype('datetime64[ns]')
+
+
+def _file_name(column, generation):
+    return f"{column.lower()}.{generation}.npy"
+
+
+def _next_generation(directory):
+    """
+    One above the highest generation of column files in 'directory' (including files
+    left behind by a crash, so they are never reused while half-written).
+    """
+    generations = [int(name.split('.')[-2]) for name in os.listdir(directory)
+                   if name.endswith('.npy') and name.count('.') == 2 and name.split('.')[-2].isdigit()]
+    return max(generations, default=0) + 1
+
+
+def _remove_stale_files(directory, generation):
+    """
+    Deletes column files of generations other than 'generation'. Files still mapped by a
+    reader cannot be deleted on Windows; they are left in place and retried next time.
+    """
+    for name in os.listdir(directory):
+        if name.endswith(('.npy', '.npy.tmp')) and not name.endswith(f'.{generation}.npy'):
+            try:
+                os.remove(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def _write_columns(directory, generation, arrays, capacity, length):
+    """
+    Writes one new file per column (name -> (values, dtype)) holding 'length' bars and
+    room for 'capacity'. New files never overwrite mapped ones, which Windows forbids.
+    """
+    for column, (values, dtype) in arrays.items():
+        array = np.lib.format.open_memmap(os.path.join(directory, _file_name(column, generation)),
+                                          mode='w+', dtype=dtype, shape=(capacity,))
+        array[:length] = values[:length]
+        array.flush()
+        del array
+
+
+def _cast_column(column, values, dtype):
+    """
+    Converts new values to a stored column's dtype. Integer columns (Volume) only accept
+    whole, finite numbers: a NaN or fractional volume raises ValueError instead of being
+    stored as an arbitrary integer.
+    """
+    values = np.asarray(values)
+    if np.issubdtype(dtype, np.integer) and not np.issubdtype(values.dtype, np.integer):
+        as_float = values.astype(float)
+        if not np.isfinite(as_float).all() or (as_float != np.round(as_float)).any():
+            raise ValueError(f"'{column}' is stored as {dtype} and cannot hold missing or fractional values")
+        return as_float.astype(dtype)
+    return values.astype(dtype, copy=False)
+
+
+def _write_meta(directory, meta):
+    """
+    Writes meta.json atomically; it is written after the arrays, so a crash mid-append
+    leaves the previous (consistent) length in place.
+    """
+    tmp_path = os.path.join(directory, 'meta.json.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(meta, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, 'meta.json'))
+
+
+def _bar_arrays(bars: pd.DataFrame):
+    """
+    Date (datetime64[ns], timezone dropped) and OHLCV arrays of a Date-indexed frame,
+    sorted by date with duplicate dates removed (last row wins).
+    """
+    index = pd.DatetimeIndex(bars.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    bars = bars.set_axis(index.as_unit('ns'))
+    bars = bars[~bars.index.isna()].sort_index(kind='stable')
+    bars = bars[~bars.index.duplicated(keep='last')]
+    return bars.index.to_numpy(), {column: bars[column].to_numpy() for column in BAR_COLUMNS}
+
+
+class TickerBars:
+    """
+    One ticker's bars in a BarStore: a date array (sorted, which also serves as the date
+    index) and one array per OHLCV column, each a memory-mapped .npy file.
+
+    Opening reads only a small JSON header and maps the files, so it costs the same for
+    ten bars or ten million; pages are read from disk only when touched. slice() finds a
+    date range with two binary searches and returns views into the mapped files (no
+    copy). Files are allocated with spare capacity, so append() writes new bars in
+    place and only grows (re-allocates) a file when the capacity is exhausted.
+    """
+    def __init__(self, directory, mode='r'):
+        """
+        'mode' is 'r' (read-only) or 'r+' (allows append()).
+        """
+        with open(os.path.join(directory, 'meta.json')) as f:
+            meta = json.load(f)
+        if meta.get('version') != STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported bar store version in '{directory}': {meta.get('version')}")
+        self.directory = directory
+        self.mode = mode
+        self.meta = meta
+        self._map_files()
+
+    def _map_files(self):
+        generation = self.meta['generation']
+        self._arrays = {column: np.load(os.path.join(self.directory, _file_name(column, generation)),
+                                        mmap_mode=self.mode)
+                        for column in ['Date'] + BAR_COLUMNS}
+
+    @property
+    def ticker(self):
+        return self.meta['ticker']
+
+    @property
+    def capacity(self):
+        return self.meta['capacity']
+
+    def __len__(self):
+        return self.meta['length']
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Dates of all stored bars (a view)."""
+        return self._arrays['Date'][:len(self)]
+
+    def column(self, name) -> np.ndarray:
+        """One column of all stored bars (a view)."""
+        return self._arrays[name][:len(self)]
+
+    def _bounds(self, start=None, end=None):
+        """
+        Row range [lo, hi) of the bars dated within [start, end] (binary search).
+        """
+        dates = self.dates
+        lo = 0 if start is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(start), 'ns'), side='left'))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, np.datetime64(pd.Timestamp(end), 'ns'), side='right'))
+        return lo, max(lo, hi)
+
+    def slice(self, start=None, end=None) -> dict:
+        """
+        Bars dated within [start, end] (inclusive; None leaves a side open) as a dict of
+        'Date' and OHLCV arrays. The arrays are views into the mapped files.
+        """
+        lo, hi = self._bounds(start, end)
+        return {column: array[lo:hi] for column, array in self._arrays.items()}
+
+    def to_frame(self, start=None, end=None) -> pd.DataFrame:
+        """
+        The bars within [start, end] as a Date-indexed OHLCV DataFrame whose columns are
+        backed by the mapped arrays (read-only unless opened with mode='r+').
+        """
+        bars = self.slice(start, end)
+        index = pd.DatetimeIndex(bars.pop('Date'), name='Date')
+        return pd.DataFrame(bars, index=index, copy=False)
+
+    def _grow(self, capacity):
+        """
+        Re-allocates every column with room for 'capacity' bars as a new generation of
+        files, copying the stored bars, then switches meta.json to it. The old files are
+        never replaced while mapped (by this object or by frames from to_frame()); they are
+        deleted once nothing maps them any more.
+        """
+        length = len(self)
+        generation = _next_generation(self.directory)
+        _write_columns(self.directory, generation,
+                       {column: (array, array.dtype) for column, array in self._arrays.items()}, capacity, length)
+        self.meta.update(generation=generation, capacity=capacity)
+        _write_meta(self.directory, self.meta)
+        self._arrays = {} # Drop this object's maps of the old generation before deleting it
+        self._map_files()
+        _remove_stale_files(self.directory, generation)
+
+    def append(self, bars: pd.DataFrame) -> int:
+        """
+        Appends new bars (a Date-indexed frame with OHLCV columns) in place. Bars dated
+        at or before the last stored bar are skipped, so re-running an update with
+        overlapping data is harmless. Grows the files (doubling the capacity) when needed.
+        Raises ValueError, without writing anything, if a value does not fit its column
+        (e.g. a NaN Volume for an integer Volume column). Returns the number of bars appended.
+        """
+        if self.mode != 'r+':
+            raise ValueError("Bar store opened read-only; open it with mode='r+' to append")
+        dates, columns = _bar_arrays(bars)
+        length = len(self)
+        if length:
+            new = dates > self._arrays['Date'][length - 1]
+            dates, columns = dates[new], {column: values[new] for column, values in columns.items()}
+        count = len(dates)
+        if count == 0:
+            return 0
+
+        columns = {column: _cast_column(column, values, self._arrays[column].dtype)
+                   for column, values in columns.items()} # Validated before anything is written
+        if length + count > self.capacity:
+            self._grow(max(2 * self.capacity, length + count))
+
+        self._arrays['Date'][length:length + count] = dates
+        for column, values in columns.items():
+            self._arrays[column][length:length + count] = values
+        for array in self._arrays.values():
+            array.flush()
+        self.meta['length'] = length + count
+        _write_meta(self.directory, self.meta)
+        return count
+
+
+class BarStore:
+    """
+    A directory of per-ticker binary bar files (see TickerBars):
+    '<root>/<TICKER>/{date,open,high,low,close,volume}.<generation>.npy' plus a 'meta.json'
+    header with the current generation, the number of stored bars and the allocated
+    capacity. Rewriting or growing a ticker writes a new generation and then switches
+    meta.json to it, so files that readers still map are never overwritten.
+    """
+    def __init__(self, root):
+        self.root = root
+
+    def _directory(self, ticker):
+        return os.path.join(self.root, ticker)
+
+    def tickers(self) -> list:
+        """Tickers present in the store, sorted."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root)
+                      if os.path.exists(os.path.join(self.root, name, 'meta.json')))
+
+    def __contains__(self, ticker):
+        return os.path.exists(os.path.join(self._directory(ticker), 'meta.json'))
+
+    def open(self, ticker, mode='r') -> TickerBars:
+        """
+        Maps a ticker's bars (O(1) in the history length). Raises FileNotFoundError if
+        the ticker is not in the store.
+        """
+        if ticker not in self:
+            raise FileNotFoundError(f"Ticker '{ticker}' not found in bar store '{self.root}'")
+        return TickerBars(self._directory(ticker), mode=mode)
+
+    def write(self, ticker, bars: pd.DataFrame, spare=0.25) -> TickerBars:
+        """
+        Creates (or replaces) a ticker from a Date-indexed OHLCV frame, allocating
+        'spare' (a fraction of the history, at least 256 bars) extra room for appends.
+        Returns the ticker opened with mode='r+'.
+        """
+        dates, columns = _bar_arrays(bars)
+        length = len(dates)
+        capacity = length + max(256, int(length * spare))
+        directory = self._directory(ticker)
+        os.makedirs(directory, exist_ok=True)
+
+        arrays = {'Date': (dates, DATE_DTYPE)}
+        for column in BAR_COLUMNS:
+            values = columns[column]
+            dtype = np.dtype('int64') if column == 'Volume' and np.issubdtype(values.dtype, np.integer) else np.dtype('float64')
+            arrays[column] = (values, dtype)
+        generation = _next_generation(directory)
+        _write_columns(directory, generation, arrays, capacity, length)
+        _write_meta(directory, {'version': STORE_FORMAT_VERSION, 'ticker': ticker, 'generation': generation,
+                                'length': length, 'capacity': capacity, 'columns': BAR_COLUMNS})
+        _remove_stale_files(directory, generation)
+        return TickerBars(directory, mode='r+')
@@ -0,0 +1,133 @@
+import glob
+import json
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import pandas as pd
+from stock_analyzer import StockAnalyzer
+
+
+def load_manifest(manifest_path: str) -> dict:
+    """
+    Reads a ticker -> CSV path manifest from a JSON object ({"AAPL": "AAPL.csv", ...})
+    or a CSV file with 'ticker' and 'path' columns. Relative paths are resolved
+    against the manifest's directory.
+    """
+    if manifest_path.lower().endswith('.json'):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+    else:
+        rows = pd.read_csv(manifest_path)
+        manifest = dict(zip(rows['ticker'].astype(str), rows['path'].astype(str)))
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    return {ticker: path if os.path.isabs(path) else os.path.join(base_dir, path)
+            for ticker, path in manifest.items()}
+
+
+def manifest_from_directory(data_dir: str, pattern: str = '*_historical_data.csv') -> dict:
+    """
+    Builds a manifest from yfinance files named '<TICKER>_historical_data.csv'.
+    """
+    paths = sorted(glob.glob(os.path.join(data_dir, pattern)))
+    return {os.path.basename(path).split('_')[0]: path for path in paths}
+
+
+def _to_long(ticker: str, indicators: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns one ticker's Date-indexed indicator frame into long (Ticker, Date) rows.
+    """
+    long_df = indicators.reset_index()
+    long_df.insert(0, 'Ticker', ticker)
+    return long_df
+
+
+def analyze_ticker(ticker: str, data_path: str, output_dir: str = None, use_cache: bool = False,
+                   collect: bool = True) -> tuple:
+    """
+    Loads one ticker and runs calculate_indicators (executed inside pool workers).
+    Returns (timing record, long-format frame). When 'output_dir' is set the frame is
+    written as a 'Ticker=<ticker>' partition of a Parquet dataset and None is returned
+    in its place, so results never accumulate in the parent process; with collect=False
+    the frame is dropped in the worker and only the timing record is sent back.
+    The ticker's partition from an earlier run is removed first, so a failed ticker has
+    no partition rather than stale rows that read back as current.
+    """
+    record = {'ticker': ticker, 'rows': 0, 'load_s': 0.0, 'indicators_s': 0.0, 'write_s': 0.0,
+              'status': 'ok', 'error': ''}
+    start = time.perf_counter()
+    partition = os.path.join(output_dir, f'Ticker={ticker}') if output_dir is not None else None
+    try:
+        if partition is not None:
+            shutil.rmtree(partition, ignore_errors=True)
+        analyzer = StockAnalyzer(ticker, data_path, use_cache=use_cache, fallback_to_dummy=False)
+        loaded = time.perf_counter()
+        long_df = _to_long(ticker, analyzer.calculate_indicators())
+        computed = time.perf_counter()
+        record.update(rows=len(long_df), load_s=loaded - start, indicators_s=computed - loaded)
+        if partition is not None:
+            os.makedirs(partition, exist_ok=True)
+            long_df.drop(columns='Ticker').to_parquet(os.path.join(partition, 'part-0.parquet'), index=False)
+            record['write_s'] = time.perf_counter() - computed
+        if output_dir is not None or not collect:
+            long_df = None
+    except Exception as e:
+        record.update(status='error', error=str(e))
+        long_df = None
+        if partition is not None:
+            shutil.rmtree(partition, ignore_errors=True) # Also drops a partly written file
+    record['total_s'] = time.perf_counter() - start
+    return record, long_df
+
+
+def run_batch(manifest: dict, max_workers: int = None, output_dir: str = None, use_cache: bool = False,
+              max_pending: int = None, collect: bool = True) -> tuple:
+    """
+    Runs load + calculate_indicators for every ticker of a ticker -> path manifest across
+    a process pool. At most 'max_pending' tickers (default 2 x workers) are in flight at
+    once, so hundreds of tickers do not queue hundreds of results.
+
+    Returns (results, timings): 'results' is a single long-format DataFrame with one row
+    per (Ticker, Date), the dataset directory when 'output_dir' is given, or None with
+    collect=False (indicators are computed and timed but not kept, e.g. for a dry run);
+    'timings' is a per-ticker DataFrame with load/indicator/write/total seconds and rows.
+    Collecting keeps every ticker's frame in the parent, so for many tickers prefer 'output_dir'.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+    tickers = list(manifest.items())
+    records, frames = [], []
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pending = set()
+        next_index = 0
+        while next_index < len(tickers) or pending:
+            while next_index < len(tickers) and len(pending) < max_pending:
+                ticker, path = tickers[next_index]
+                pending.add(pool.submit(analyze_ticker, ticker, path, output_dir, use_cache, collect))
+                next_index += 1
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record, long_df = future.result()
+                records.append(record)
+                if long_df is not None:
+                    frames.append(long_df)
+                status = 'ok' if record['status'] == 'ok' else f"FAILED ({record['error']})"
+                print(f"[{len(records)}/{len(tickers)}] {record['ticker']}: {record['rows']} rows "
+                      f"in {record['total_s']:.2f}s {status}")
+
+    timings = pd.DataFrame(records)
+    if not timings.empty:
+        timings = timings.sort_values('total_s', ascending=False).reset_index(drop=True)
+    print(f"Processed {len(tickers)} tickers with {max_workers} workers in {time.perf_counter() - start:.2f}s.")
+
+    if output_dir is not None:
+        return output_dir, timings
+    if not collect:
+        return None, timings
+    if not frames:
+        return pd.DataFrame(), timings
+    results = pd.concat(frames, ignore_index=True)
+    results['Ticker'] = results['Ticker'].astype('category')
+    return results.set_index(['Ticker', 'Date']).sort_index(), timings
@@ -0,0 +1,192 @@
+import numpy as np
+import pandas as pd
+
+# Upper bound on the number of float64 elements materialized per batch (about 64 MB),
+# so lag sweeps are split into ticker blocks on large universes.
+BATCH_ELEMENTS = 8_000_000
+
+
+def _masked_corr(x, y, axis=-1, min_periods=2):
+    """
+    Pearson correlation along 'axis' using only positions where both x and y are present
+    (pairwise-complete, like Series.corr). Two-pass: means first, then centered sums.
+    Returns (correlation, observation count); NaN where fewer than 'min_periods' pairs.
+    """
+    mask = ~(np.isnan(x) | np.isnan(y))
+    n = mask.sum(axis=axis)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.where(mask, x, 0.0).sum(axis=axis, keepdims=True) / np.expand_dims(n, axis)
+        mean_y = np.where(mask, y, 0.0).sum(axis=axis, keepdims=True) / np.expand_dims(n, axis)
+        dx = np.where(mask, x - mean_x, 0.0)
+        dy = np.where(mask, y - mean_y, 0.0)
+        corr = (dx * dy).sum(axis=axis) / np.sqrt((dx * dx).sum(axis=axis) * (dy * dy).sum(axis=axis))
+    return np.where(n >= min_periods, corr, np.nan), n
+
+
+def _lagged(values, lag):
+    """
+    values[t - lag] aligned on row t (NaN where it does not exist); a positive lag pairs
+    earlier sentiment with the current return, like Series.shift(lag).
+    """
+    out = np.full(values.shape, np.nan)
+    rows = len(values)
+    if 0 <= lag < rows:
+        out[lag:] = values[:rows - lag]
+    elif -rows < lag < 0:
+        out[:rows + lag] = values[-lag:]
+    return out
+
+
+def _centered_pairs(x, y):
+    """
+    Pair mask (as floats) and x/y centered on their paired means, with 0 where a pair is
+    incomplete, so sums over any subset of rows give that subset's paired moments.
+    Centering does not change correlations but limits cancellation in one-pass formulas.
+    """
+    mask = ~(np.isnan(x) | np.isnan(y))
+    pairs = np.maximum(mask.sum(axis=0), 1)
+    x = np.where(mask, x - np.where(mask, x, 0.0).sum(axis=0) / pairs, 0.0)
+    y = np.where(mask, y - np.where(mask, y, 0.0).sum(axis=0) / pairs, 0.0)
+    return mask.astype(float), x, y
+
+
+def _moment_corr(n, sx, sy, sxx, syy, sxy, min_periods):
+    """
+    Pearson correlation from pair counts and raw moment sums (NaN below 'min_periods'
+    pairs or without variance).
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = n * sxy - sx * sy
+        var = (n * sxx - sx * sx) * (n * syy - sy * sy)
+        corr = np.clip(cov / np.sqrt(np.where(var > 0, var, np.nan)), -1.0, 1.0)
+    corr[n < max(min_periods, 2)] = np.nan
+    return corr
+
+
+class CorrelationEngine:
+    """
+    Sentiment-vs-return correlations for a whole universe of tickers at once.
+
+    Both inputs are (dates x tickers) panels; missing values are excluded pairwise, as
+    CorrelationCalculator does per ticker with shift/dropna/corr. Lags are handled as
+    row-offset views of one NaN-padded sentiment matrix instead of shifted columns, so the
+    frames are never copied or extended, and every statistic is computed with batched
+    NumPy reductions over the time axis for all tickers (and lags/replicates) together:
+    lag_sweep() for a lag range, rolling() for rolling-window correlations from cumulative
+    sums and bootstrap() for (block) bootstrap confidence intervals.
+    """
+    def __init__(self, sentiment: pd.DataFrame, returns: pd.DataFrame):
+        """
+        'sentiment' and 'returns' are Date-indexed DataFrames with one column per ticker.
+        They are aligned on the union of dates and the common tickers.
+        """
+        tickers = [ticker for ticker in sentiment.columns if ticker in returns.columns]
+        index = sentiment.index.union(returns.index)
+        self.sentiment = sentiment.reindex(index=index, columns=tickers)
+        self.returns = returns.reindex(index=index, columns=tickers)
+        self.tickers = tickers
+        self._x = self.sentiment.to_numpy(dtype=float)
+        self._y = self.returns.to_numpy(dtype=float)
+
+    @classmethod
+    def from_results(cls, results: dict, sentiment_column: str, return_column: str = 'Daily_Return'):
+        """
+        Builds the panels from a ticker -> frame dict such as MultiTickerSentimentEngine.run().
+        """
+        sentiment = pd.DataFrame({ticker: df[sentiment_column] for ticker, df in results.items()})
+        returns = pd.DataFrame({ticker: df[return_column] for ticker, df in results.items()})
+        return cls(sentiment.sort_index(), returns.sort_index())
+
+    def _ticker_blocks(self, per_ticker):
+        """
+        Column slices holding at most BATCH_ELEMENTS // per_ticker tickers each.
+        """
+        size = max(1, BATCH_ELEMENTS // max(per_ticker, 1))
+        return [slice(start, start + size) for start in range(0, len(self.tickers), size)]
+
+    def lag_sweep(self, lags=range(-10, 11), min_periods=2) -> pd.DataFrame:
+        """
+        Correlation of sentiment lagged by each of 'lags' (rows) with returns for every
+        ticker (columns). Lag k pairs sentiment of row t - k with the return of row t.
+
+        Rows are the engine's union-of-dates index: when a ticker has no row on some dates
+        that other tickers trade (interior gaps), lag k still means k rows of the shared
+        panel, so it can differ from Series.shift(k) on that ticker's own, gap-free series.
+        """
+        lags = np.asarray(list(lags), dtype=int)
+        rows = len(self._x)
+        pad = int(np.abs(lags).max()) if len(lags) else 0
+        out = np.full((len(lags), len(self.tickers)), np.nan)
+        # _masked_corr keeps a handful of (tickers x rows) temporaries alive per lag
+        for block in self._ticker_blocks(8 * rows):
+            x = self._x[:, block]
+            padded = np.full((rows + 2 * pad, x.shape[1]), np.nan)
+            padded[pad:pad + rows] = x
+            y = self._y[:, block]
+            for i, lag in enumerate(lags):
+                # A basic slice of the padded block, so each lag is a view rather than a shifted copy
+                shifted = padded[pad - lag:pad - lag + rows]
+                out[i, block], _ = _masked_corr(shifted, y, axis=0, min_periods=min_periods)
+        return pd.DataFrame(out, index=pd.Index(lags, name='Lag'), columns=self.tickers)
+
+    def rolling(self, window=60, lag=0, min_periods=None) -> pd.DataFrame:
+        """
+        Rolling-window correlation (dates x tickers) of sentiment lagged by 'lag' with
+        returns, from cumulative sums of the paired moments: O(1) work per date whatever
+        the window length. 'min_periods' defaults to the window length.
+        """
+        min_periods = window if min_periods is None else min_periods
+        mask, x, y = _centered_pairs(_lagged(self._x, lag), self._y)
+        start = np.maximum(np.arange(1, len(x) + 1) - window, 0)
+
+        def window_sums(values):
+            cumulative = np.vstack([np.zeros((1, values.shape[1])), np.cumsum(values, axis=0)])
+            return cumulative[1:] - cumulative[start]
+
+        corr = _moment_corr(window_sums(mask), window_sums(x), window_sums(y),
+                            window_sums(x * x), window_sums(y * y), window_sums(x * y), min_periods)
+        return pd.DataFrame(corr, index=self.sentiment.index, columns=self.tickers)
+
+    def _bootstrap_weights(self, rng, n_boot, rows, block_size):
+        """
+        (n_boot, rows) matrix counting how often each row is drawn in each replicate:
+        i.i.d. rows, or a moving-block bootstrap (random contiguous blocks, preserving
+        short-range autocorrelation).
+        """
+        if not block_size or block_size <= 1:
+            indices = rng.integers(0, rows, size=(n_boot, rows))
+        else:
+            blocks = -(-rows // block_size)
+            starts = rng.integers(0, max(rows - block_size, 0) + 1, size=(n_boot, blocks))
+            indices = np.minimum(starts[:, :, np.newaxis] + np.arange(block_size), rows - 1).reshape(n_boot, -1)[:, :rows]
+        flat = (indices + rows * np.arange(n_boot)[:, np.newaxis]).ravel()
+        return np.bincount(flat, minlength=n_boot * rows).reshape(n_boot, rows).astype(float)
+
+    def bootstrap(self, lags=(0, 1), n_boot=1000, ci=0.95, block_size=None, seed=0, min_periods=2) -> pd.DataFrame:
+        """
+        Bootstrap confidence intervals of the lagged correlations. A replicate is a weight
+        vector over the dates (how often each is drawn), so the paired moments of all
+        replicates and all tickers come from a few (replicates x dates) @ (dates x tickers)
+        matrix products, with one shared set of resampled dates. Returns a frame indexed
+        by (Ticker, Lag) with the point estimate 'corr', the percentile interval
+        'ci_low'/'ci_high' and the pair count 'n'.
+        """
+        rng = np.random.default_rng(seed)
+        weights = self._bootstrap_weights(rng, n_boot, len(self._x), block_size)
+        alpha = (1 - ci) / 2
+        frames = []
+        for lag in lags:
+            mask, x, y = _centered_pairs(_lagged(self._x, lag), self._y)
+            ones = np.ones(len(x))
+            corr = _moment_corr(ones @ mask, ones @ x, ones @ y, ones @ (x * x), ones @ (y * y), ones @ (x * y),
+                                min_periods)
+            samples = _moment_corr(weights @ mask, weights @ x, weights @ y, weights @ (x * x),
+                                   weights @ (y * y), weights @ (x * y), min_periods) # (replicates, tickers)
+            low = np.full(len(self.tickers), np.nan)
+            high = np.full(len(self.tickers), np.nan)
+            has_samples = ~np.isnan(samples).all(axis=0)
+            if has_samples.any():
+                low[has_samples], high[has_samples] = np.nanquantile(samples[:, has_samples], [alpha, 1 - alpha], axis=0)
+            frames.append(pd.DataFrame({'Ticker': self.tickers, 'Lag': lag, 'corr': corr, 'ci_low': low,
+                                        'ci_high': high, 'n': mask.sum(axis=0).astype(int)}))
+        return pd.concat(frames, ignore_index=True).set_index(['Ticker', 'Lag']).sort_index(level='Ticker', sort_remaining=False)
@@ -1,105 +1,354 @@
+import os
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+from data_cache import ParquetCache
+from date_parsing import DATE_PARSER_VERSION, EXCHANGE_TZ, parse_dates
+from eda_report import DAY_ORDER, MONTH_ORDER, EDAReport, calendar_codes
+from instrumentation import instrumented, log, log_error, set_rows
+from rendering import draw_bar, draw_histogram, draw_line
+from text_stats import headline_word_counts
+from ticker_index import TickerIndex
+
+# Columns read in streaming mode when no explicit 'usecols' is given.
+# 'url' and the unnamed index column are skipped since no analysis uses them.
+NEWS_COLUMNS = ['headline', 'publisher', 'date', 'stock']
+CATEGORICAL_COLUMNS = ['publisher', 'stock']
+
+
+def _parse_dates(values):
+    """
+    Parses a column of date strings into timezone-aware (UTC) timestamps.
+    The feed mixes offset and naive (exchange time) timestamps; see date_parsing.parse_dates.
+    Unparseable values become NaT.
+    """
+    return parse_dates(values)
+
+
+def _date_fields(dates):
+    """
+    Derives compact calendar fields from timezone-aware timestamps (already converted to
+    the analysis timezone): small integers for year/month/hour, an ordered categorical
+    for the day of the week and the local calendar day as a datetime64 (midnight).
+    Uses the same integer arithmetic as EDAReport (eda_report.calendar_codes).
+    """
+    local = dates.dt.tz_localize(None).dt.as_unit('ns').to_numpy()
+    days, weekday, month, hour = calendar_codes(local)
+    fields = pd.DataFrame(index=dates.index)
+    fields['year'] = (days.astype('datetime64[Y]').astype('int64') + 1970).astype('int16')
+    fields['month'] = (month + 1).astype('int8')
+    fields['day_of_week'] = pd.Categorical.from_codes(weekday, categories=DAY_ORDER, ordered=True)
+    fields['date_only'] = days.astype('datetime64[ns]') # For daily trends
+    fields['hour'] = hour.astype('int8')
+    return fields
+
+
+def _typed_read_kwargs(usecols):
+    """
+    Builds pd.read_csv keyword arguments that keep only 'usecols' (all columns if None)
+    and read 'publisher'/'stock' as categoricals.
+    """
+    kwargs = {'dtype': {column: 'category' for column in CATEGORICAL_COLUMNS}}
+    if usecols is not None:
+        wanted = set(usecols)
+        kwargs['usecols'] = lambda column: column in wanted
+    return kwargs
+
 
 class NewsAnalyzer:
-    def __init__(self, filepath):
+    def __init__(self, filepath, renderer=None):
+        """
+        'renderer' is an optional rendering.FigureRenderer: when set, the visualization
+        methods write their figures to files in the background instead of displaying them.
+        """
         self.filepath = filepath
+        self.renderer = renderer
         self.df = None
         self.publisher_counts = None
-
-    def load_data(self):
+        # Streaming mode state (see load_data(chunksize=...))
+        self.chunksize = None
+        self.usecols = None
+        self.date_parse_failures = None
+        self.report = None # Single-pass EDA aggregates (see build_report(); all that streaming mode keeps)
+        self.ticker_index = None # Ticker -> row offsets (see build_ticker_index())
+
+    @instrumented('news.load')
+    def load_data(self, chunksize=None, usecols=None, use_cache=False, cache_dir=None):
         """
         Loads the CSV file into a pandas DataFrame.
+        If 'chunksize' is given, the file is not loaded at once: the analysis methods then
+        stream it in chunks of that many rows into an EDAReport (see build_report()), so
+        peak memory depends on the chunk size rather than on the file size.
+        'usecols' restricts the columns that are read.
+        With use_cache=True, the typed frame (categorical publisher/stock, parsed dates) is
+        kept in a Parquet cache (see data_cache.ParquetCache) that is rebuilt whenever the
+        CSV changes.
         Handles FileNotFoundError and other potential exceptions during loading.
         """
+        if chunksize is not None:
+            if not os.path.exists(self.filepath):
+                log_error(f"Error: The file '{self.filepath}' was not found.")
+                return
+            self.df = None
+            self.report = None # Rebuilt from the chunks on first use
+            self.chunksize = chunksize
+            self.usecols = usecols
+            log(f"Streaming mode enabled: '{self.filepath}' will be read in chunks of {chunksize} rows.")
+            return
+
+        try:
+            self.chunksize = None
+            if use_cache:
+                options = {'reader': 'news', 'usecols': sorted(usecols) if usecols else None,
+                           'dates': DATE_PARSER_VERSION}
+                self.df = ParquetCache(cache_dir).load(self.filepath, lambda: self._read_typed(usecols), options)
+            else:
+                self.df = pd.read_csv(self.filepath, usecols=usecols)
+            set_rows(len(self.df))
+            log("CSV file loaded successfully.")
+        except FileNotFoundError:
+            log_error(f"Error: The file '{self.filepath}' was not found.")
+        except Exception as e:
+            log_error(f"An error occurred while loading the CSV file: {e}")
+
+    def iter_chunks(self):
+        """
+        Yields the CSV file chunk by chunk (streaming mode).
+        Only the requested columns are kept, 'publisher'/'stock' are read as categoricals
+        and the 'date' column is parsed while reading.
+        """
+        reader = pd.read_csv(self.filepath, chunksize=self.chunksize,
+                             **_typed_read_kwargs(self.usecols or NEWS_COLUMNS))
+        for chunk in reader:
+            if 'date' in chunk.columns:
+                chunk['date'] = _parse_dates(chunk['date'])
+            yield chunk
+
+    def _read_typed(self, usecols=None):
+        """
+        Reads the whole CSV with categorical publisher/stock and a parsed 'date' column.
+        """
+        df = pd.read_csv(self.filepath, **_typed_read_kwargs(usecols))
+        if 'date' in df.columns:
+            df['date'] = _parse_dates(df['date'])
+        return df
+
+    @instrumented('news.ticker_index')
+    def build_ticker_index(self, aliases=None, index_dir=None, **options):
+        """
+        Opens the ticker index persisted next to the CSV (see ticker_index.TickerIndex),
+        building it on first use and indexing only the rows appended since the last call
+        afterwards. 'aliases' maps tickers to company names matched in headlines (e.g.
+        {'AAPL': ['Apple']}); other 'options' are passed to TickerIndex.
+        """
         try:
-            self.df = pd.read_csv(self.filepath)
-            print("CSV file loaded successfully.")
+            index = TickerIndex(self.filepath, index_dir=index_dir, aliases=aliases, **options)
+            added = index.update()
+            self.ticker_index = index
+            set_rows(added)
+            log(f"Ticker index ready: {len(index)} rows, {len(index.tickers())} tickers ({added} rows newly indexed).")
         except FileNotFoundError:
-            print(f"Error: The file '{self.filepath}' was not found.")
+            log_error(f"Error: The file '{self.filepath}' was not found.")
         except Exception as e:
-            print(f"An error occurred while loading the CSV file: {e}")
+            log_error(f"An error occurred while building the ticker index: {e}")
+        return self.ticker_index
 
+    @instrumented('news.subset')
+    def subset(self, tickers, mentions=True):
+        """
+        Returns the rows of self.df about one ticker or a list of tickers (a copy, in file
+        order), looked up in the ticker index instead of scanning the 'stock' column
+        (self.df's index must still hold the file row numbers, as read by load_data()):
+        rows tagged with them and, with mentions=True, rows whose headline mentions them.
+        Builds the index on first use.
+        """
+        if self.df is None:
+            log_error("Error: DataFrame not loaded. Please run load_data() first.")
+            return None
+        if self.ticker_index is None and self.build_ticker_index() is None:
+            return None
+        if not pd.api.types.is_integer_dtype(self.df.index):
+            log_error("Error: subset() needs the file row numbers as the DataFrame index (as read by load_data()).")
+            return None
+        rows = self.ticker_index.rows(tickers, mentions=mentions)
+        if len(self.df) and self.df.index.max() >= len(self.ticker_index):
+            log("Warning: the loaded DataFrame has rows the ticker index does not cover; "
+                "re-run build_ticker_index() after the file changes.")
+        # Looked up by label: rows dropped since loading (e.g. by prepare_dates) do not shift the others
+        return self.df[self.df.index.isin(rows)].copy()
+
+    @instrumented('news.report')
+    def build_report(self, df_to_analyze=None, date_column='date', timezone=EXCHANGE_TZ):
+        """
+        Computes every EDA aggregate (articles per publisher, day of week, month, hour and
+        calendar day, plus the headline length histogram) in one scan of the data, or of the
+        chunk stream in streaming mode. The result is stored in self.report (an EDAReport,
+        serializable with to_dict()/save()) and returned; the statistics and visualization
+        methods then read from it instead of reprocessing the rows.
+        """
+        try:
+            report = EDAReport(timezone=timezone)
+            if self._is_streaming(df_to_analyze):
+                for chunk in self.iter_chunks():
+                    report.update(chunk, date_column=date_column)
+            else:
+                target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+                if target_df is None:
+                    log_error("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
+                    return None
+                report.update(target_df, date_column=date_column)
+            self.report = report
+            self.publisher_counts = report.publisher_counts()
+            self.date_parse_failures = report.date_parse_failures
+            set_rows(report.rows)
+            log(f"EDA report built over {report.rows} rows "
+                  f"({report.date_parse_failures} rows without a parseable date).")
+        except Exception as e:
+            log_error(f"An error occurred while building the EDA report: {e}")
+        return self.report
+
+    def _from_report(self, df_to_analyze, view):
+        """
+        Returns one count table of self.report (e.g. 'hour_counts') when no explicit
+        DataFrame is given and build_report() has run; None otherwise. In streaming mode
+        the report is built on first use (one pass over the chunks serves every method).
+        """
+        if df_to_analyze is not None:
+            return None
+        if self.report is None and self._is_streaming(df_to_analyze):
+            self.build_report()
+        if self.report is None:
+            return None
+        return getattr(self.report, view)()
+
+    def _show_figure(self, name, draw, data, figsize, **options):
+        """
+        Displays a figure drawn by draw(ax, data, **options), or queues it on the
+        renderer (written to '<name>.<format>') when one is set.
+        Returns a short description of what happened for the status message.
+        """
+        if self.renderer is not None:
+            self.renderer.submit(name, draw, data, figsize=figsize, **options)
+            return "queued for rendering"
+        import matplotlib.pyplot as plt # Imported on first display: loading and statistics do not need it
+        fig = plt.figure(figsize=figsize)
+        draw(fig.gca(), data, **options)
+        plt.tight_layout()
+        plt.show()
+        plt.close(fig)
+        return "displayed"
+
+    def _is_streaming(self, df_to_analyze):
+        """
+        True when the analysis should run over chunks instead of an in-memory DataFrame.
+        """
+        return df_to_analyze is None and self.df is None and self.chunksize is not None
+
+    @instrumented('news.text_stats')
     def textual_lengths(self, df_to_analyze=None): # MODIFIED
         """
         Calculates the length of headlines (number of words) and stores it in a new column.
         Operates on df_to_analyze if provided, otherwise on self.df.
+        In streaming mode, returns the word count -> frequency Series of the EDA report
+        (see build_report()) instead.
         """
+        if self._is_streaming(df_to_analyze):
+            return self._from_report(df_to_analyze, 'headline_length_counts')
+
         target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
 
         if target_df is None:
-            print("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
+            log_error("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
             return target_df # Return the potentially modified DataFrame
 
         try:
             # Ensure 'headline' column exists and is string type
             if 'headline' not in target_df.columns:
-                print("Error: 'headline' column not found in the DataFrame.")
+                log_error("Error: 'headline' column not found in the DataFrame.")
                 return target_df
 
-            target_df['headline_length'] = target_df['headline'].apply(lambda x: len(str(x).split()))
-            print("Headline lengths calculated successfully.")
+            # Vectorized equivalent of .apply(lambda x: len(str(x).split()))
+            target_df['headline_length'] = headline_word_counts(target_df['headline'])
+            log("Headline lengths calculated successfully.")
         except Exception as e:
-            print(f"An error occurred while calculating textual lengths: {e}")
+            log_error(f"An error occurred while calculating textual lengths: {e}")
         return target_df # Return the modified DataFrame
 
     def descriptive_statistics(self, df_to_analyze=None): # MODIFIED
         """
         Prints descriptive statistics for the 'headline_length' column.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
+        summary = self._from_report(df_to_analyze, 'headline_length_summary')
+        if summary is not None or self._is_streaming(df_to_analyze):
+            if summary is not None: # Otherwise build_report() has reported the error
+                print("\nDescriptive Statistics for Headline Lengths:")
+                print(summary)
+            return
+
         target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
 
         if target_df is None or 'headline_length' not in target_df.columns:
-            print("Error: 'headline_length' data not available. Please run textual_lengths() first.")
+            log_error("Error: 'headline_length' data not available. Please run textual_lengths() first.")
             return
         try:
             print("\nDescriptive Statistics for Headline Lengths:")
             print(target_df['headline_length'].describe())
         except Exception as e:
-            print(f"An error occurred while generating descriptive statistics: {e}")
+            log_error(f"An error occurred while generating descriptive statistics: {e}")
 
+    @instrumented('news.plot.headline_length')
     def headline_length_visualization(self, df_to_analyze=None): # MODIFIED
         """
         Generates and displays a histogram of headline lengths.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
-        target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
-
-        if target_df is None or 'headline_length' not in target_df.columns:
-            print("Error: 'headline_length' data not available. Please run textual_lengths() first.")
+        length_counts = self._from_report(df_to_analyze, 'headline_length_counts')
+        if length_counts is None and self._is_streaming(df_to_analyze):
             return
+        if length_counts is None:
+            target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+
+            if target_df is None or 'headline_length' not in target_df.columns:
+                log_error("Error: 'headline_length' data not available. Please run textual_lengths() first.")
+                return
+            # Plot (and send to the renderer) the length -> frequency counts, not every row
+            length_counts = target_df['headline_length'].value_counts(sort=False).sort_index()
         try:
-            plt.figure(figsize=(10, 6))
-            sns.histplot(target_df['headline_length'], bins=30, kde=True)
-            plt.title("Distribution of Headline Lengths")
-            plt.xlabel("Number of Words")
-            plt.ylabel("Frequency")
-            plt.grid(axis='y', alpha=0.75)
-            plt.show()
-            print("Headline length visualization displayed.")
+            status = self._show_figure('headline_lengths', draw_histogram, length_counts.index.to_numpy(), (10, 6),
+                                       weights=length_counts.to_numpy(), bins=30, kde=True,
+                                       title="Distribution of Headline Lengths", xlabel="Number of Words",
+                                       ylabel="Frequency")
+            log(f"Headline length visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during headline length visualization: {e}")
+            log_error(f"An error occurred during headline length visualization: {e}")
 
+    @instrumented('news.publishers')
     def articles_per_publisher(self, df_to_analyze=None): # MODIFIED
         """
         Calculates the number of articles per publisher.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report, which
+        streaming mode always uses). Reuses self.report when build_report() has run.
         """
+        publisher_counts = self._from_report(df_to_analyze, 'publisher_counts')
+        if publisher_counts is not None:
+            self.publisher_counts = publisher_counts
+            log("Articles per publisher taken from the EDA report.")
+            return
+        if self._is_streaming(df_to_analyze):
+            return
+
         target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
 
         if target_df is None:
-            print("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
+            log_error("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
             return
         try:
             if 'publisher' not in target_df.columns:
-                print("Error: 'publisher' column not found in the DataFrame.")
+                log_error("Error: 'publisher' column not found in the DataFrame.")
                 return
             self.publisher_counts = target_df['publisher'].value_counts() # Still stores in self.publisher_counts
-            print("Articles per publisher calculated successfully.")
+            log("Articles per publisher calculated successfully.")
         except Exception as e:
-            print(f"An error occurred while calculating articles per publisher: {e}")
+            log_error(f"An error occurred while calculating articles per publisher: {e}")
 
     # top_publishers and publisher_visualization will still use self.publisher_counts,
     # so ensure articles_per_publisher is run on the correct filtered data first.
@@ -109,169 +358,188 @@ class NewsAnalyzer:
         Prints the top 10 publishers by the number of articles.
         """
         if self.publisher_counts is None:
-            print("Error: Publisher counts not available. Please run articles_per_publisher() first.")
+            log_error("Error: Publisher counts not available. Please run articles_per_publisher() first.")
             return
         try:
             print("\nTop 10 Publishers:")
             print(self.publisher_counts.head(10))
         except Exception as e:
-            print(f"An error occurred while retrieving top publishers: {e}")
+            log_error(f"An error occurred while retrieving top publishers: {e}")
 
+    @instrumented('news.plot.publishers')
     def publisher_visualization(self):
         """
         Generates and displays a bar plot of the top 10 publishers.
         """
         if self.publisher_counts is None:
-            print("Error: Publisher counts not available. Please run articles_per_publisher() first.")
+            log_error("Error: Publisher counts not available. Please run articles_per_publisher() first.")
             return
         try:
-            plt.figure(figsize=(12, 7))
-            self.publisher_counts.head(10).plot(kind='bar')
-            plt.title("Top 10 Publishers by Number of Articles")
-            plt.xlabel("Publisher")
-            plt.ylabel("Number of Articles")
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
-            print("Publisher visualization displayed.")
+            status = self._show_figure('top_publishers', draw_bar, self.publisher_counts.head(10), (12, 7),
+                                       title="Top 10 Publishers by Number of Articles",
+                                       xlabel="Publisher", ylabel="Number of Articles")
+            log(f"Publisher visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during publisher visualization: {e}")
+            log_error(f"An error occurred during publisher visualization: {e}")
 
-    def prepare_dates(self, df_to_analyze=None, date_column='date'): # MODIFIED
+    @instrumented('news.parse_dates')
+    def prepare_dates(self, df_to_analyze=None, date_column='date', timezone=EXCHANGE_TZ): # MODIFIED
         """
         Converts the specified date column to datetime objects and extracts time components.
         Operates on df_to_analyze if provided, otherwise on self.df.
+        Dates are parsed with a per-shape inferred fixed format (see date_parsing.parse_dates;
+        naive timestamps are exchange time) and converted to 'timezone', in which the
+        year/month/hour (small ints), day_of_week (categorical) and date_only (local day,
+        datetime64) columns are derived. Rows whose date is missing or cannot be parsed are
+        dropped; their number is reported and kept in self.date_parse_failures.
+        In streaming mode, the chunks are folded into an EDA report instead (see
+        build_report(); its per day of week, month, hour and calendar day counts feed the
+        date plots), which is returned.
         """
+        if self._is_streaming(df_to_analyze):
+            if self.report is None or self.report.timezone != timezone:
+                self.build_report(date_column=date_column, timezone=timezone)
+            return self.report
+
         target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
 
         if target_df is None:
-            print("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
+            log_error("Error: DataFrame not loaded. Please run load_data() first or provide a DataFrame.")
             return target_df # Return the potentially modified DataFrame
         if date_column not in target_df.columns:
-            print(f"Error: '{date_column}' column not found in the DataFrame.")
+            log_error(f"Error: '{date_column}' column not found in the DataFrame.")
             return target_df
 
         try:
-            target_df[date_column] = pd.to_datetime(target_df[date_column], errors='coerce')
+            target_df[date_column] = parse_dates(target_df[date_column], exchange_tz=timezone).dt.tz_convert(timezone)
+            self.date_parse_failures = int(target_df[date_column].isna().sum())
             # Drop rows where date conversion failed
             target_df.dropna(subset=[date_column], inplace=True)
 
-            target_df['year'] = target_df[date_column].dt.year
-            target_df['month'] = target_df[date_column].dt.month
-            target_df['day_of_week'] = target_df[date_column].dt.day_name()
-            target_df['date_only'] = target_df[date_column].dt.date # For daily trends
-            target_df['hour'] = target_df[date_column].dt.hour
+            fields = _date_fields(target_df[date_column])
+            for column in fields.columns:
+                target_df[column] = fields[column]
 
-            print(f"Date column '{date_column}' processed successfully.")
+            log(f"Date column '{date_column}' processed successfully "
+                  f"({self.date_parse_failures} rows with a missing or unparseable date dropped).")
         except Exception as e:
-            print(f"An error occurred while preparing dates: {e}")
+            log_error(f"An error occurred while preparing dates: {e}")
         return target_df # Return the modified DataFrame
 
+    @instrumented('news.plot.day_of_week')
     def articles_by_day_of_week(self, df_to_analyze=None, date_column='date'): # MODIFIED
         """
         Analyzes and visualizes the number of articles published on each day of the week.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
-        target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
-
-        if target_df is None or 'day_of_week' not in target_df.columns:
-            print("Error: Date data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+        articles_dow = self._from_report(df_to_analyze, 'day_of_week_counts')
+        if articles_dow is None and self._is_streaming(df_to_analyze):
             return
+        elif articles_dow is None:
+            target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+
+            if target_df is None or 'day_of_week' not in target_df.columns:
+                log_error("Error: Date data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+                return
+            articles_dow = None
         try:
-            day_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-            articles_dow = target_df['day_of_week'].value_counts().reindex(day_order)
-
-            plt.figure(figsize=(10, 6))
-            sns.barplot(x=articles_dow.index, y=articles_dow.values, hue=articles_dow.index, palette='viridis', legend=False)
-            plt.title("Number of Articles by Day of the Week")
-            plt.xlabel("Day of the Week")
-            plt.ylabel("Number of Articles")
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
-            print("Articles by day of week visualization displayed.")
+            if articles_dow is None:
+                articles_dow = target_df['day_of_week'].value_counts()
+            articles_dow = articles_dow.reindex(DAY_ORDER)
+
+            status = self._show_figure('articles_by_day_of_week', draw_bar, articles_dow, (10, 6), palette='viridis',
+                                       title="Number of Articles by Day of the Week",
+                                       xlabel="Day of the Week", ylabel="Number of Articles")
+            log(f"Articles by day of week visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during day of week analysis: {e}")
+            log_error(f"An error occurred during day of week analysis: {e}")
 
+    @instrumented('news.plot.over_time')
     def articles_over_time(self, df_to_analyze=None, resampling_freq='D', date_column='date'): # MODIFIED
         """
         Analyzes and visualizes the number of articles published over time.
         'resampling_freq' can be 'D' for daily, 'W' for weekly, 'M' for monthly.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
-        target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
-
-        if target_df is None or date_column not in target_df.columns:
-            print(f"Error: Date column '{date_column}' not available or data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+        daily_counts = self._from_report(df_to_analyze, 'daily_counts')
+        if daily_counts is None and self._is_streaming(df_to_analyze):
             return
+        elif daily_counts is None:
+            target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+
+            if target_df is None or date_column not in target_df.columns:
+                log_error(f"Error: Date column '{date_column}' not available or data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+                return
+            daily_counts = None
 
         try:
-            df_time = target_df.set_index(date_column)
-            articles_over_time = df_time.resample(resampling_freq).size()
-
-            plt.figure(figsize=(14, 7))
-            articles_over_time.plot(kind='line')
-            plt.title(f"Number of Articles Over Time ({resampling_freq} Frequency)")
-            plt.xlabel("Date")
-            plt.ylabel("Number of Articles")
-            plt.grid(True)
-            plt.tight_layout()
-            plt.show()
-            print(f"Articles over time ({resampling_freq} frequency) visualization displayed.")
+            if daily_counts is None:
+                df_time = target_df.set_index(date_column)
+                articles_over_time = df_time.resample(resampling_freq).size()
+            else:
+                articles_over_time = daily_counts.resample(resampling_freq).sum()
+
+            status = self._show_figure(f'articles_over_time_{resampling_freq}', draw_line, articles_over_time, (14, 7),
+                                       title=f"Number of Articles Over Time ({resampling_freq} Frequency)",
+                                       xlabel="Date", ylabel="Number of Articles")
+            log(f"Articles over time ({resampling_freq} frequency) visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during articles over time analysis: {e}")
+            log_error(f"An error occurred during articles over time analysis: {e}")
 
+    @instrumented('news.plot.month')
     def articles_by_month(self, df_to_analyze=None, date_column='date'): # MODIFIED
         """
         Analyzes and visualizes the number of articles published per month.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
-        target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
-
-        if target_df is None or 'month' not in target_df.columns:
-            print("Error: Date data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+        articles_by_month = self._from_report(df_to_analyze, 'month_counts')
+        if articles_by_month is None and self._is_streaming(df_to_analyze):
             return
+        elif articles_by_month is None:
+            target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+
+            if target_df is None or 'month' not in target_df.columns:
+                log_error("Error: Date data not prepared. Please run prepare_dates() first or provide a DataFrame.")
+                return
+            month_counts = target_df['month'].value_counts() # Counted on the integer month, no name column needed
         try:
-            month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                           'July', 'August', 'September', 'October', 'November', 'December']
-            target_df['month_name'] = target_df[date_column].dt.month_name()
-            articles_by_month = target_df['month_name'].value_counts().reindex(month_order)
-
-            plt.figure(figsize=(12, 6))
-            sns.barplot(x=articles_by_month.index, y=articles_by_month.values, hue=articles_by_month.index, palette='cubehelix', legend=False)
-            plt.title("Number of Articles by Month")
-            plt.xlabel("Month")
-            plt.ylabel("Number of Articles")
-            plt.xticks(rotation=45, ha='right')
-            plt.tight_layout()
-            plt.show()
-            print("Articles by month visualization displayed.")
+            if articles_by_month is None:
+                articles_by_month = month_counts.rename(index=lambda month: MONTH_ORDER[month - 1]).reindex(MONTH_ORDER)
+
+            status = self._show_figure('articles_by_month', draw_bar, articles_by_month, (12, 6), palette='cubehelix',
+                                       title="Number of Articles by Month",
+                                       xlabel="Month", ylabel="Number of Articles")
+            log(f"Articles by month visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during articles by month analysis: {e}")
+            log_error(f"An error occurred during articles by month analysis: {e}")
 
+    @instrumented('news.plot.hour')
     def articles_by_hour(self, df_to_analyze=None): # MODIFIED
         """
         Analyzes and visualizes the number of articles published per hour of the day.
-        Operates on df_to_analyze if provided, otherwise on self.df.
+        Operates on df_to_analyze if provided, otherwise on self.df (or self.report).
         """
-        target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
-
-        if target_df is None or 'hour' not in target_df.columns:
-            print("Error: 'hour' data not available. Please run prepare_dates() first and ensure your date column has time information.")
+        hour_counts = self._from_report(df_to_analyze, 'hour_counts')
+        if hour_counts is None and self._is_streaming(df_to_analyze):
             return
+        elif hour_counts is None:
+            target_df = df_to_analyze if df_to_analyze is not None else self.df # Use the provided or self.df
+
+            if target_df is None or 'hour' not in target_df.columns:
+                log_error("Error: 'hour' data not available. Please run prepare_dates() first and ensure your date column has time information.")
+                return
+            hour_counts = None
 
         try:
-            articles_hourly = target_df['hour'].value_counts().sort_index()
-
-            plt.figure(figsize=(12, 6))
-            sns.barplot(x=articles_hourly.index, y=articles_hourly.values, hue=articles_hourly.index, palette='viridis', legend=False)
-            plt.title("Number of Articles by Hour of Day")
-            plt.xlabel("Hour of Day (24-hour format)")
-            plt.ylabel("Number of Articles")
-            plt.xticks(range(0, 24)) # Ensure all 24 hours are shown
-            plt.grid(axis='y', alpha=0.75)
-            plt.tight_layout()
-            plt.show()
-            print("Articles by hour visualization displayed.")
+            if hour_counts is None:
+                hour_counts = target_df['hour'].value_counts()
+            articles_hourly = hour_counts.sort_index()
+
+            status = self._show_figure('articles_by_hour', draw_bar, articles_hourly, (12, 6), palette='viridis',
+                                       title="Number of Articles by Hour of Day",
+                                       xlabel="Hour of Day (24-hour format)", ylabel="Number of Articles",
+                                       rotation=0, xticks=range(0, 24), # Ensure all 24 hours are shown
+                                       grid_axis='y')
+            log(f"Articles by hour visualization {status}.")
         except Exception as e:
-            print(f"An error occurred during articles by hour analysis: {e}")
\ No newline at end of file
+            log_error(f"An error occurred during articles by hour analysis: {e}")
\ No newline at end of file
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import os
+import time
+import pandas as pd
+
+# Bump when the way cached frames are produced changes, so old entries are rebuilt.
+CACHE_FORMAT_VERSION = 1
+CACHE_DIR_NAME = '.parquet_cache'
+
+
+def content_hash(filepath, block_size=1 << 20):
+    """
+    Returns the BLAKE2b digest of a file's contents, read in blocks.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParquetCache:
+    """
+    Caches parsed CSV files as Parquet so later runs skip CSV parsing.
+
+    Each entry is keyed on the source file's absolute path, size, mtime, content hash
+    and the parsing options. A small JSON manifest next to the Parquet file remembers
+    the last seen size/mtime, so the content hash is only recomputed when those change
+    (e.g. a touched file with identical contents is re-validated, not re-parsed).
+    Dtypes such as parsed dates and categoricals survive the round trip, and the
+    Parquet file is read with memory mapping. Only the latest entry per source file and
+    option set is kept, so loading the same CSV with different options (e.g. 'usecols')
+    keeps one entry for each instead of evicting the other.
+    """
+    def __init__(self, cache_dir=None):
+        """
+        'cache_dir' defaults to a '.parquet_cache' folder next to each source file.
+        """
+        self.cache_dir = cache_dir
+
+    def _paths(self, source_path, options_key):
+        """
+        Returns the manifest path and Parquet path prefix for a source file and option set.
+        """
+        cache_dir = self.cache_dir or os.path.join(os.path.dirname(source_path), CACHE_DIR_NAME)
+        entry_id = hashlib.blake2b(f"{source_path}|{options_key}".encode('utf-8'), digest_size=8).hexdigest()
+        prefix = os.path.join(cache_dir, f"{os.path.basename(source_path)}.{entry_id}")
+        return cache_dir, prefix + '.json', prefix
+
+    def load(self, filepath, parse_fn, options=None):
+        """
+        Returns the DataFrame for 'filepath', from the cache if it is still valid,
+        otherwise by calling parse_fn() and writing its result to the cache.
+        'options' must describe everything that affects parse_fn's output.
+        Cold (parse) and warm (cache) load times are reported.
+        """
+        source_path = os.path.abspath(filepath)
+        stat = os.stat(source_path) # Raises FileNotFoundError for missing sources
+        options_key = json.dumps({'version': CACHE_FORMAT_VERSION, 'options': options or {}},
+                                 sort_keys=True, default=str)
+        cache_dir, manifest_path, prefix = self._paths(source_path, options_key)
+
+        manifest = None
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path) as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = None
+
+        if manifest is not None and manifest.get('options') == options_key \
+                and os.path.exists(manifest.get('parquet_path', '')):
+            stat_matches = manifest['size'] == stat.st_size and manifest['mtime_ns'] == stat.st_mtime_ns
+            if stat_matches or manifest['content_hash'] == content_hash(source_path):
+                if not stat_matches:
+                    manifest.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                    self._write_manifest(manifest_path, manifest)
+                start = time.perf_counter()
+                df = pd.read_parquet(manifest['parquet_path'], memory_map=True)
+                warm = time.perf_counter() - start
+                cold = manifest.get('cold_seconds')
+                speedup = f", {cold / warm:.1f}x faster than parsing ({cold:.2f}s)" if cold and warm > 0 else ""
+                print(f"Cache hit for '{filepath}': loaded in {warm:.2f}s{speedup}.")
+                return df
+
+        # Hash before parsing: a file rewritten while it is parsed then fails the check below
+        # instead of being cached under the digest of its newer contents
+        digest = content_hash(source_path)
+        start = time.perf_counter()
+        df = parse_fn()
+        cold = time.perf_counter() - start
+
+        after = os.stat(source_path)
+        if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            print(f"Warning: '{filepath}' changed while it was parsed; not caching it.")
+            return df
+
+        key = hashlib.blake2b(f"{source_path}|{stat.st_size}|{stat.st_mtime_ns}|{digest}|{options_key}".encode('utf-8'),
+                              digest_size=8).hexdigest()
+        parquet_path = f"{prefix}.{key}.parquet"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            df.to_parquet(parquet_path)
+            if manifest is not None and manifest.get('parquet_path') not in (None, parquet_path) \
+                    and os.path.exists(manifest['parquet_path']):
+                os.remove(manifest['parquet_path']) # Drop the stale entry
+            self._write_manifest(manifest_path, {
+                'source_path': source_path,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'content_hash': digest,
+                'options': options_key,
+                'parquet_path': parquet_path,
+                'cold_seconds': cold,
+            })
+            print(f"Cache miss for '{filepath}': parsed in {cold:.2f}s and cached to '{parquet_path}'.")
+        except Exception as e:
+            # A cache that cannot be written (e.g. pyarrow missing) must not break loading
+            print(f"Warning: could not write cache for '{filepath}': {e}")
+        return df
+
+    @staticmethod
+    def _write_manifest(manifest_path, manifest):
+        """
+        Writes the manifest atomically so a crashed run never leaves a half-written file.
+        """
+        tmp_path = manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
@@ -0,0 +1,137 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Timestamps without an offset are taken to be exchange (US/Eastern) wall-clock time.
+EXCHANGE_TZ = 'America/New_York'
+# Part of the cache options of parsed frames: bump when parse_dates() results change.
+DATE_PARSER_VERSION = 3
+
+# Candidate formats for the part of a timestamp before any UTC offset, tried in order.
+BASE_FORMATS = ['%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%dT%H:%M:%S.%f',
+                '%Y-%m-%d %H:%M', '%Y-%m-%d', '%m/%d/%Y %H:%M:%S', '%m/%d/%Y %H:%M', '%m/%d/%Y']
+# Recognised offset suffixes: regex and suffix length
+OFFSET_SUFFIXES = [(re.compile(r'[+-]\d\d:\d\d$'), 6), (re.compile(r'[+-]\d{4}$'), 5), (re.compile(r'Z$'), 1)]
+ANY_OFFSET = r'(?:[+-]\d\d:?\d\d|Z)$'
+
+
+def _offset_minutes(suffix):
+    """
+    Minutes east of UTC for an offset suffix such as '-04:00', '+0530' or 'Z'
+    (NaN for a malformed suffix).
+    """
+    if suffix == 'Z':
+        return 0
+    if not any(pattern.fullmatch(suffix) for pattern, _ in OFFSET_SUFFIXES):
+        return np.nan
+    digits = suffix[1:].replace(':', '')
+    minutes = int(digits[:2]) * 60 + int(digits[2:])
+    return -minutes if suffix[0] == '-' else minutes
+
+
+def infer_format(sample, min_share=0.5):
+    """
+    Infers how a sample of same-shaped timestamp strings is written.
+    Returns (base format, offset suffix length), the suffix length being 0 for naive
+    timestamps, or None if no candidate format parses at least 'min_share' of the
+    sample (a few malformed rows do not prevent inference; they simply fail to parse).
+    """
+    sample = list(sample)
+    suffix_length = 0
+    for pattern, length in OFFSET_SUFFIXES:
+        if np.mean([bool(pattern.search(text)) for text in sample]) >= min_share:
+            suffix_length = length
+            break
+    base = pd.Series([text[:len(text) - suffix_length] for text in sample])
+    best, best_share = None, 0.0
+    for fmt in BASE_FORMATS:
+        share = pd.to_datetime(base, format=fmt, errors='coerce').notna().mean()
+        if share > best_share:
+            best, best_share = fmt, share
+        if share == 1.0:
+            break
+    return (best, suffix_length) if best_share >= min_share else None
+
+
+def _localize_exchange(naive, exchange_tz):
+    """
+    Interprets naive timestamps as exchange wall-clock time and converts them to UTC.
+    Ambiguous times (DST fall-back hour) are taken as standard time; nonexistent ones
+    (spring-forward gap) are shifted forward.
+    """
+    ambiguous = np.zeros(len(naive), dtype=bool)
+    return naive.dt.tz_localize(exchange_tz, ambiguous=ambiguous, nonexistent='shift_forward').dt.tz_convert('UTC')
+
+
+def _parse_group(texts, fmt, suffix_length, exchange_tz):
+    """
+    Parses strings that share one inferred format. Offsets are not parsed per element:
+    the fixed-format part is parsed as naive time and the (few distinct) offset
+    suffixes are converted once each and subtracted, which is far faster than '%z'.
+    """
+    if suffix_length == 0:
+        return _localize_exchange(pd.to_datetime(texts, format=fmt, errors='coerce'), exchange_tz)
+    local = pd.to_datetime(texts.str.slice(0, -suffix_length), format=fmt, errors='coerce')
+    codes, suffixes = pd.factorize(texts.str.slice(-suffix_length))
+    offsets = pd.to_timedelta(np.array([_offset_minutes(suffix) for suffix in suffixes], dtype=float), unit='min')
+    return (local - offsets[codes]).dt.tz_localize('UTC')
+
+
+def _utc_ns(parsed):
+    """UTC timestamps as a naive datetime64[ns] array (NaT kept)."""
+    return parsed.dt.tz_localize(None).dt.as_unit('ns').to_numpy(copy=True)
+
+
+def _parse_fallback(texts, exchange_tz):
+    """
+    Element-wise ISO 8601 parsing for strings that match no inferred format: values with
+    an offset are converted with it, naive ones are taken as exchange wall-clock time.
+    Returns UTC times as a naive datetime64[ns] array.
+    """
+    has_offset = texts.str.contains(ANY_OFFSET).to_numpy(dtype=bool, na_value=False)
+    utc_values = np.full(len(texts), np.datetime64('NaT'), dtype='datetime64[ns]')
+    if has_offset.any():
+        utc_values[has_offset] = _utc_ns(pd.to_datetime(texts[has_offset], format='ISO8601', errors='coerce',
+                                                        utc=True))
+    if not has_offset.all():
+        naive = pd.to_datetime(texts[~has_offset], format='ISO8601', errors='coerce')
+        utc_values[~has_offset] = _utc_ns(_localize_exchange(naive, exchange_tz))
+    return utc_values
+
+
+def parse_dates(values, exchange_tz=EXCHANGE_TZ, sample_size=200):
+    """
+    Parses a column of timestamp strings into timezone-aware UTC timestamps.
+
+    Rows are grouped by string length (a cheap proxy for their shape); the format of each
+    group is inferred from a sample of up to 'sample_size' strings (see infer_format) and
+    the whole group is then parsed with that fixed format in one vectorized call.
+    Timestamps with a UTC offset are converted with it; naive ones are taken as
+    'exchange_tz' wall-clock time. Groups with no recognised format, and the rows of a
+    group that its format does not parse, fall back to element-wise ISO 8601 parsing
+    (with the same offset/naive rules). Missing or unparseable values become NaT.
+    """
+    values = pd.Series(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        if values.dt.tz is None:
+            return _localize_exchange(values, exchange_tz)
+        return values.dt.tz_convert('UTC')
+
+    texts = values.astype('string')
+    utc_values = np.full(len(texts), np.datetime64('NaT'), dtype='datetime64[ns]')
+    lengths = texts.str.len()
+    for length in lengths.dropna().unique():
+        positions = np.flatnonzero((lengths == length).to_numpy(dtype=bool, na_value=False))
+        group = texts.iloc[positions]
+        step = max(len(group) // sample_size, 1)
+        inferred = infer_format(group.iloc[::step].iloc[:sample_size])
+        if inferred is None:
+            utc_values[positions] = _parse_fallback(group, exchange_tz)
+            continue
+        parsed = _utc_ns(_parse_group(group, *inferred, exchange_tz))
+        # Same-length strings written in another format (e.g. 'T' instead of ' ')
+        leftovers = np.isnat(parsed)
+        if leftovers.any():
+            parsed[leftovers] = _parse_fallback(group[leftovers], exchange_tz)
+        utc_values[positions] = parsed
+    return pd.Series(utc_values, index=values.index, name=values.name).dt.tz_localize('UTC')
@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+
+
+def slice_range(df: pd.DataFrame, start=None, end=None) -> pd.DataFrame:
+    """
+    Restricts a Date-indexed (sorted) frame to the [start, end] range; None leaves a side open.
+    """
+    if start is None and end is None:
+        return df
+    return df.loc[start:end]
+
+
+def resample_ohlcv(df: pd.DataFrame, max_bars: int) -> pd.DataFrame:
+    """
+    Merges consecutive rows of a Date-indexed OHLCV frame so that at most 'max_bars'
+    bars remain: each bar covers the same number of source rows and takes the first
+    Open, the highest High, the lowest Low, the last Close and the summed Volume.
+    Bars are labelled with the timestamp of their first row. Binning by row count
+    (not by calendar period) keeps the bar count bounded for daily and intraday data
+    alike, and skips weekends and holidays naturally.
+    """
+    n = len(df)
+    if max_bars is None or n <= max_bars:
+        return df[['Open', 'High', 'Low', 'Close', 'Volume']]
+    size = -(-n // max_bars) # Rows per bar (ceil)
+    starts = np.arange(0, n, size)
+    ends = np.minimum(starts + size, n) - 1
+    padding = len(starts) * size - n
+
+    def binned(column, fill):
+        values = df[column].to_numpy(dtype=float)
+        return np.concatenate([values, np.full(padding, fill)]).reshape(len(starts), size)
+
+    with np.errstate(invalid='ignore'):
+        bars = {
+            'Open': df['Open'].to_numpy(dtype=float)[starts],
+            'High': np.nanmax(binned('High', np.nan), axis=1),
+            'Low': np.nanmin(binned('Low', np.nan), axis=1),
+            'Close': df['Close'].to_numpy(dtype=float)[ends],
+            'Volume': np.nansum(binned('Volume', 0.0), axis=1),
+        }
+    return pd.DataFrame(bars, index=df.index[starts])
+
+
+def lttb(x, y, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling: returns the sorted positions of at most
+    'threshold' points of (x, y) that preserve the visual shape of the line. The first
+    and last points are always kept; from every bucket in between the point forming the
+    largest triangle with the previously kept point and the next bucket's mean is kept.
+    'x' must be increasing (datetimes are compared as int64 nanoseconds).
+    """
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype('int64')
+    x = x.astype(float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n:
+        return np.arange(n)
+    if threshold < 3:
+        raise ValueError("LTTB needs a threshold of at least 3 points")
+
+    # Bucket boundaries for the n - 2 interior points
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < threshold - 1:
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+            mean_x, mean_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        else:
+            mean_x, mean_y = x[-1], y[-1]
+        # Twice the triangle area for every candidate in the bucket
+        area = np.abs((x[previous] - mean_x) * (y[lo:hi] - y[previous])
+                      - (x[previous] - x[lo:hi]) * (mean_y - y[previous]))
+        previous = lo + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def downsample_line(series: pd.Series, threshold: int) -> pd.Series:
+    """
+    LTTB-downsamples a time-indexed Series (e.g. an SMA overlay) to at most 'threshold'
+    points. Missing values (such as an indicator's warm-up period) are dropped first.
+    Thresholds below 3 keep 3 points (the first, the last and one in between), the fewest
+    LTTB can select.
+    """
+    series = series.dropna()
+    if threshold is None or len(series) <= max(threshold, 3):
+        return series
+    threshold = max(threshold, 3)
+    index = series.index
+    x = index.asi8 if isinstance(index, pd.DatetimeIndex) else index.to_numpy() # asi8 also covers tz-aware dates
+    return series.iloc[lttb(x, series.to_numpy(), threshold)]
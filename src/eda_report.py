@@ -0,0 +1,222 @@
+import json
+import numpy as np
+import pandas as pd
+from date_parsing import EXCHANGE_TZ, parse_dates
+from text_stats import headline_word_counts
+
+DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+MONTH_ORDER = ['January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December']
+REPORT_VERSION = 1
+
+
+def _bincount(values, length):
+    """
+    Counts the small non-negative integers in 'values' into a fixed-length int64 array.
+    """
+    return np.bincount(values, minlength=length).astype('int64')
+
+
+def calendar_codes(local):
+    """
+    Calendar codes of local wall-clock times (datetime64[ns] array without NaT): the day
+    (datetime64[D]), the weekday (Monday = 0), the month (January = 0) and the hour, by
+    integer arithmetic instead of the slower .dt accessors.
+    """
+    days = local.astype('datetime64[D]')
+    weekday = (days.astype('int64') + 3) % 7 # 1970-01-01 was a Thursday
+    month = days.astype('datetime64[M]').astype('int64') % 12
+    hour = (local - days).astype('int64') // 3_600_000_000_000
+    return days, weekday, month, hour
+
+
+def _merge_series(total, counts):
+    """
+    Adds two label -> count Series (the first may be empty).
+    """
+    if total.empty:
+        return counts.astype('int64')
+    return total.add(counts, fill_value=0).astype('int64')
+
+
+class EDAReport:
+    """
+    All aggregates behind the NewsAnalyzer EDA, built in a single pass over the rows.
+
+    Each update(chunk) scans a chunk once and folds it into running counts: articles per
+    publisher, per day of week, per month, per hour and per calendar day, plus the
+    headline length (word count) histogram and the number of rows without a parseable
+    date. Calendar fields use the exchange timezone. Updates can come from one in-memory
+    frame or from a chunked CSV stream, and partial reports can be merge()d.
+
+    The report only holds these small count tables, so it is cheap to keep, plot from
+    and serialize (to_dict()/from_dict(), save()/load() as JSON).
+    """
+    def __init__(self, timezone=EXCHANGE_TZ):
+        self.timezone = timezone
+        self.rows = 0
+        self.date_parse_failures = 0
+        self.day_of_week = np.zeros(7, dtype='int64') # Monday = 0
+        self.month = np.zeros(12, dtype='int64') # January = 0
+        self.hour = np.zeros(24, dtype='int64')
+        self.headline_lengths = np.zeros(0, dtype='int64') # Index = number of words
+        self.publishers = pd.Series(dtype='int64')
+        self.daily = pd.Series(dtype='int64') # Local calendar day -> count
+
+    def update(self, chunk, headline_column='headline', publisher_column='publisher', date_column='date'):
+        """
+        Folds one chunk (DataFrame) into the report. Missing columns are skipped; the date
+        column may hold strings (parsed with date_parsing.parse_dates) or timestamps.
+        Returns self.
+        """
+        self.rows += len(chunk)
+        if headline_column in chunk.columns:
+            lengths = headline_word_counts(chunk[headline_column]).to_numpy(dtype='int64')
+            counts = np.bincount(lengths) if len(lengths) else np.zeros(0, dtype='int64')
+            size = max(len(counts), len(self.headline_lengths))
+            self.headline_lengths = (np.pad(self.headline_lengths, (0, size - len(self.headline_lengths)))
+                                     + np.pad(counts, (0, size - len(counts))))
+        if publisher_column in chunk.columns:
+            counts = chunk[publisher_column].value_counts()
+            counts.index = counts.index.astype(str)
+            self.publishers = _merge_series(self.publishers, counts[counts > 0])
+        if date_column in chunk.columns:
+            self._update_dates(chunk[date_column])
+        return self
+
+    def _update_dates(self, values):
+        """
+        Counts one chunk's dates per weekday, month, hour and local day.
+        """
+        dates = parse_dates(values, exchange_tz=self.timezone)
+        valid = dates.notna().to_numpy()
+        self.date_parse_failures += int((~valid).sum())
+        local = dates[valid].dt.tz_convert(self.timezone).dt.tz_localize(None).dt.as_unit('ns').to_numpy()
+        days, weekday, month, hour = calendar_codes(local)
+        self.day_of_week += _bincount(weekday, 7)
+        self.hour += _bincount(hour, 24)
+        self.month += _bincount(month, 12)
+        unique_days, counts = np.unique(days, return_counts=True)
+        daily = pd.Series(counts, index=pd.DatetimeIndex(unique_days.astype('datetime64[ns]')))
+        self.daily = _merge_series(self.daily, daily).sort_index()
+
+    def merge(self, other):
+        """
+        Adds another report's counts (e.g. built over a different file or chunk range). Returns self.
+        """
+        self.rows += other.rows
+        self.date_parse_failures += other.date_parse_failures
+        self.day_of_week += other.day_of_week
+        self.month += other.month
+        self.hour += other.hour
+        size = max(len(self.headline_lengths), len(other.headline_lengths))
+        self.headline_lengths = (np.pad(self.headline_lengths, (0, size - len(self.headline_lengths)))
+                                 + np.pad(other.headline_lengths, (0, size - len(other.headline_lengths))))
+        self.publishers = _merge_series(self.publishers, other.publishers)
+        self.daily = _merge_series(self.daily, other.daily).sort_index()
+        return self
+
+    # --- Views used by the NewsAnalyzer plotting methods
+
+    def publisher_counts(self):
+        """Articles per publisher, most active first."""
+        counts = self.publishers.sort_values(ascending=False, kind='stable')
+        counts.index.name = 'publisher'
+        return counts.rename('count')
+
+    def headline_length_counts(self):
+        """Word count -> number of headlines (lengths that occur only)."""
+        counts = pd.Series(self.headline_lengths, name='count')
+        counts.index.name = 'headline_length'
+        return counts[counts > 0]
+
+    def headline_length_summary(self):
+        """
+        The statistics of Series.describe() over the headline lengths, computed from the
+        histogram (same linear interpolation between order statistics as pandas).
+        """
+        counts = self.headline_length_counts()
+        values = counts.index.to_numpy(dtype=float)
+        weights = counts.to_numpy(dtype=float)
+        n = weights.sum()
+        if n == 0:
+            return pd.Series([0.0] + [np.nan] * 7, index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'],
+                             name='headline_length')
+        mean = (values * weights).sum() / n
+        std = np.sqrt(((values - mean) ** 2 * weights).sum() / (n - 1)) if n > 1 else np.nan
+        cumulative = np.cumsum(weights)
+
+        def value_at(position):
+            return values[np.searchsorted(cumulative, position, side='right')]
+
+        quantiles = []
+        for q in (0.25, 0.5, 0.75):
+            position = q * (n - 1)
+            lower = np.floor(position)
+            upper = min(lower + 1, n - 1)
+            quantiles.append(value_at(lower) + (value_at(upper) - value_at(lower)) * (position - lower))
+        return pd.Series([n, mean, std, values[0], *quantiles, values[-1]],
+                         index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'], name='headline_length')
+
+    def day_of_week_counts(self):
+        """Articles per day of the week, Monday first."""
+        return pd.Series(self.day_of_week, index=pd.Index(DAY_ORDER, name='day_of_week'), name='count')
+
+    def month_counts(self):
+        """Articles per month name, January first."""
+        return pd.Series(self.month, index=pd.Index(MONTH_ORDER, name='month'), name='count')
+
+    def hour_counts(self):
+        """Articles per hour of the day (0-23)."""
+        return pd.Series(self.hour, index=pd.RangeIndex(24, name='hour'), name='count')
+
+    def daily_counts(self):
+        """Articles per local calendar day (days without articles omitted)."""
+        return self.daily.rename('count')
+
+    # --- Serialization
+
+    def to_dict(self):
+        """
+        Returns the report as a JSON-serializable dict.
+        """
+        return {
+            'version': REPORT_VERSION,
+            'timezone': self.timezone,
+            'rows': self.rows,
+            'date_parse_failures': self.date_parse_failures,
+            'day_of_week': self.day_of_week.tolist(),
+            'month': self.month.tolist(),
+            'hour': self.hour.tolist(),
+            'headline_lengths': self.headline_lengths.tolist(),
+            'publishers': {str(name): int(count) for name, count in self.publishers.items()},
+            'daily': {day.strftime('%Y-%m-%d'): int(count) for day, count in self.daily.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Restores a report from to_dict() output.
+        """
+        if state.get('version') != REPORT_VERSION:
+            raise ValueError(f"Unsupported EDA report version: {state.get('version')}")
+        report = cls(timezone=state['timezone'])
+        report.rows = state['rows']
+        report.date_parse_failures = state['date_parse_failures']
+        for key in ('day_of_week', 'month', 'hour', 'headline_lengths'):
+            setattr(report, key, np.array(state[key], dtype='int64'))
+        report.publishers = pd.Series(state['publishers'], dtype='int64')
+        report.daily = pd.Series(list(state['daily'].values()), dtype='int64',
+                                 index=pd.DatetimeIndex(list(state['daily'].keys())).as_unit('ns'))
+        return report
+
+    def save(self, path):
+        """Writes the report to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Restores a report from a JSON file written by save()."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
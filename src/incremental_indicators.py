@@ -0,0 +1,180 @@
+import json
+import math
+from collections import deque
+
+# Column names used by StockAnalyzer.calculate_indicators (with the default periods)
+INDICATOR_COLUMNS = ['SMA_20', 'SMA_50', 'RSI', 'MACD', 'MACD_signal']
+
+
+def _is_zero(value):
+    """
+    TA-Lib's TA_IS_ZERO test.
+    """
+    return -0.00000001 < value < 0.00000001
+
+
+class IncrementalIndicators:
+    """
+    Keeps the rolling state behind StockAnalyzer.calculate_indicators (SMA_20, SMA_50,
+    RSI(14) and MACD(12, 26, 9)) so that each new daily close is processed in O(1):
+    running window sums for the SMAs, Wilder-smoothed average gain/loss for RSI and
+    EMA states for MACD. The warm-up (SMA seeds, NaN lookback periods) follows TA-Lib,
+    so the values match talib's batch output to floating-point tolerance.
+
+    The state is plain JSON (to_dict()/from_dict(), save()/load()), so a process can
+    resume after the last processed bar without replaying history.
+    """
+    def __init__(self, sma_periods=(20, 50), rsi_period=14, fast_period=12, slow_period=26, signal_period=9):
+        self.sma_periods = tuple(sma_periods)
+        self.rsi_period = rsi_period
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+
+        self.count = 0 # Bars processed so far
+        # SMA: the last max(sma_periods) closes and one running sum per period
+        self.window = deque(maxlen=max(self.sma_periods))
+        self.sma_sums = [0.0] * len(self.sma_periods)
+        # RSI: previous close and Wilder-smoothed average gain/loss (sums during warm-up)
+        self.prev_close = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        # MACD: EMA states (sums of the seed windows during warm-up)
+        self.fast_ema = 0.0
+        self.slow_ema = 0.0
+        self.signal_ema = 0.0
+        columns = [self._sma_name(period) for period in self.sma_periods] + ['RSI', 'MACD', 'MACD_signal']
+        self.last = {column: math.nan for column in columns}
+
+    def _sma_name(self, period):
+        return f'SMA_{period}'
+
+    def update(self, close):
+        """
+        Processes one new close and returns the latest indicator values as a dict
+        (NaN while an indicator is still inside its lookback period).
+        """
+        close = float(close)
+        index = self.count # Position of this bar in the series
+        values = {}
+
+        # --- SMA: add the new close, drop the one leaving each window
+        for i, period in enumerate(self.sma_periods):
+            self.sma_sums[i] += close
+            if len(self.window) >= period:
+                self.sma_sums[i] -= self.window[-period]
+            values[self._sma_name(period)] = self.sma_sums[i] / period if index >= period - 1 else math.nan
+        self.window.append(close)
+
+        # --- RSI (Wilder smoothing, seeded with the mean gain/loss of the first period)
+        rsi = math.nan
+        if self.prev_close is not None:
+            change = close - self.prev_close
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if index <= self.rsi_period:
+                self.avg_gain += gain
+                self.avg_loss += loss
+                if index == self.rsi_period:
+                    self.avg_gain /= self.rsi_period
+                    self.avg_loss /= self.rsi_period
+            else:
+                self.avg_gain = (self.avg_gain * (self.rsi_period - 1) + gain) / self.rsi_period
+                self.avg_loss = (self.avg_loss * (self.rsi_period - 1) + loss) / self.rsi_period
+            if index >= self.rsi_period:
+                total = self.avg_gain + self.avg_loss
+                rsi = 100.0 * (self.avg_gain / total) if not _is_zero(total) else 0.0
+        self.prev_close = close
+        values['RSI'] = rsi
+
+        # --- MACD: both EMAs are seeded with an SMA ending at bar slow_period - 1,
+        # the signal EMA with the SMA of the first signal_period MACD values
+        macd_start = self.slow_period - 1
+        fast_k = 2.0 / (self.fast_period + 1)
+        slow_k = 2.0 / (self.slow_period + 1)
+        signal_k = 2.0 / (self.signal_period + 1)
+        macd = signal = math.nan
+        if index < macd_start:
+            self.slow_ema += close
+            if index >= macd_start - self.fast_period + 1:
+                self.fast_ema += close
+        else:
+            if index == macd_start:
+                self.slow_ema = (self.slow_ema + close) / self.slow_period
+                self.fast_ema = (self.fast_ema + close) / self.fast_period
+            else:
+                self.fast_ema = (close - self.fast_ema) * fast_k + self.fast_ema
+                self.slow_ema = (close - self.slow_ema) * slow_k + self.slow_ema
+            line = self.fast_ema - self.slow_ema
+            signal_index = index - macd_start
+            if signal_index < self.signal_period - 1:
+                self.signal_ema += line
+            else:
+                if signal_index == self.signal_period - 1:
+                    self.signal_ema = (self.signal_ema + line) / self.signal_period
+                else:
+                    self.signal_ema = (line - self.signal_ema) * signal_k + self.signal_ema
+                # TA-Lib only reports the MACD line once the signal line exists
+                macd, signal = line, self.signal_ema
+        values['MACD'] = macd
+        values['MACD_signal'] = signal
+
+        self.count += 1
+        self.last = values
+        return values
+
+    @classmethod
+    def from_history(cls, closes, **params):
+        """
+        Builds an engine warmed up on an existing close series (replayed once).
+        """
+        engine = cls(**params)
+        for close in closes:
+            engine.update(close)
+        return engine
+
+    def to_dict(self):
+        """
+        Returns the full state as a JSON-serializable dict.
+        """
+        return {
+            'params': {'sma_periods': list(self.sma_periods), 'rsi_period': self.rsi_period,
+                       'fast_period': self.fast_period, 'slow_period': self.slow_period,
+                       'signal_period': self.signal_period},
+            'count': self.count,
+            'window': list(self.window),
+            'sma_sums': self.sma_sums,
+            'prev_close': self.prev_close,
+            'avg_gain': self.avg_gain,
+            'avg_loss': self.avg_loss,
+            'fast_ema': self.fast_ema,
+            'slow_ema': self.slow_ema,
+            'signal_ema': self.signal_ema,
+            'last': {key: (None if math.isnan(value) else value) for key, value in self.last.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        """
+        Restores an engine from to_dict() output.
+        """
+        engine = cls(**state['params'])
+        engine.count = state['count']
+        engine.window.extend(state['window'])
+        engine.sma_sums = list(state['sma_sums'])
+        engine.prev_close = state['prev_close']
+        for key in ('avg_gain', 'avg_loss', 'fast_ema', 'slow_ema', 'signal_ema'):
+            setattr(engine, key, state[key])
+        engine.last = {key: (math.nan if value is None else value) for key, value in state['last'].items()}
+        return engine
+
+    def save(self, path):
+        """Writes the state to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path):
+        """Restores an engine from a JSON file written by save()."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,362 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+import pandas as pd
+
+try:
+    import psutil
+except ImportError: # Falls back to /proc (Linux) or the process-lifetime peak
+    psutil = None
+
+OUTPUTS = ('table', 'json')
+PROFILERS = ('cprofile', 'tracemalloc')
+MEMORY_MODES = ('top', 'all')
+
+
+def current_rss():
+    """
+    Resident set size of this process in bytes.
+    """
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 # Peak, in KB on Linux
+
+
+class PeakMemory:
+    """
+    Context manager sampling the RSS in a background thread every 'interval' seconds
+    and keeping the start and peak values (bytes), so a stage's memory high-water mark
+    is captured even when its temporaries are freed before it returns.
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.start = self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self.start = self.peak = current_rss()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+        return False
+
+
+class _Settings:
+    """Process-wide instrumentation settings (see configure())."""
+    enabled = False
+    output = 'table'
+    stream = None
+    profile = None
+    profile_dir = None
+    memory = None
+    memory_interval = 0.005
+
+
+_settings = _Settings()
+_local = threading.local() # Per-thread stack of open spans
+_records = []
+_lock = threading.Lock()
+
+
+def configure(enabled=True, output='table', log_path=None, profile=None, profile_dir=None, memory=None,
+              memory_interval=0.005):
+    """
+    Turns span instrumentation on or off for the process.
+
+    With output='table', span records are only collected (print_summary() shows them);
+    with output='json', each finished span is also written as one JSON line to
+    'log_path' (appended) or to stderr. In both modes the analyzers' progress messages
+    are attached to their span instead of being printed; errors are still printed.
+    'profile' adds a capture to every top-level span: 'cprofile' (the slowest functions,
+    plus a .prof file per span in 'profile_dir' if given) or 'tracemalloc' (peak traced
+    memory and the largest allocation sites still held when the span ends). Both slow the profiled code down.
+    Every span records the RSS at its start and end. 'memory' adds a sampling thread
+    (every 'memory_interval' seconds) that also captures the peak RSS: 'top' for
+    top-level spans only, 'all' for every span (the thread's overhead then dominates
+    spans of a few milliseconds). Without it, 'peak_rss_mb' is None.
+    When disabled (the default) spans cost one flag check and messages are printed.
+    """
+    if output not in OUTPUTS:
+        raise ValueError(f"output must be one of {OUTPUTS}")
+    if profile is not None and profile not in PROFILERS:
+        raise ValueError(f"profile must be one of {PROFILERS} or None")
+    if memory is not None and memory not in MEMORY_MODES:
+        raise ValueError(f"memory must be one of {MEMORY_MODES} or None")
+    if _settings.stream is not None and _settings.stream is not sys.stderr:
+        _settings.stream.close()
+    _settings.enabled = enabled
+    _settings.output = output
+    _settings.stream = (open(log_path, 'a') if log_path else sys.stderr) if enabled and output == 'json' else None
+    _settings.profile = profile
+    _settings.profile_dir = profile_dir
+    _settings.memory = memory
+    _settings.memory_interval = memory_interval
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+
+
+def is_enabled():
+    return _settings.enabled
+
+
+def _stack():
+    if not hasattr(_local, 'spans'):
+        _local.spans = []
+    return _local.spans
+
+
+def _top_functions(profiler, limit=10):
+    """
+    The 'limit' functions with the largest cumulative time, as short text lines.
+    """
+    stats = pstats.Stats(profiler).stats # (file, line, function) -> (calls, primitive, tottime, cumtime, callers)
+    top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+    return [f"{os.path.basename(file)}:{line}({function}) calls={calls} cum={cumulative:.4f}s"
+            for (file, line, function), (calls, _, _, cumulative, _) in top]
+
+
+class _NullSpan:
+    """Span returned when instrumentation is disabled: every operation is a no-op."""
+    @property
+    def rows(self):
+        return None
+
+    @rows.setter
+    def rows(self, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **fields):
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """
+    One timed pipeline stage. Use through span() or @instrumented; 'rows' can be set
+    while the span is open (or via set_rows()), extra fields via set().
+    """
+    def __init__(self, name, rows=None, **fields):
+        self.name = name
+        self.rows = rows
+        self.fields = fields
+        self.messages = []
+        self.status = 'ok'
+        self._memory = None
+        self._rss_start = None
+        self._profiler = None
+        self._started_tracing = False
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+    def __enter__(self):
+        stack = _stack()
+        self.parent = stack[-1].name if stack else None
+        self.depth = len(stack)
+        stack.append(self)
+        if self.depth == 0 and _settings.profile == 'cprofile':
+            self._profiler = cProfile.Profile()
+        elif self.depth == 0 and _settings.profile == 'tracemalloc':
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if _settings.memory == 'all' or (_settings.memory == 'top' and self.depth == 0):
+            self._memory = PeakMemory(_settings.memory_interval).__enter__()
+            self._rss_start = self._memory.start
+        else:
+            self._rss_start = current_rss()
+        self.started = time.time()
+        self._start = time.perf_counter()
+        if self._profiler is not None:
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        seconds = time.perf_counter() - self._start
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._memory is not None:
+            self._memory.__exit__(None, None, None)
+        rss_end = current_rss()
+        peak = max(self._memory.peak, rss_end) if self._memory is not None else None
+        _stack().pop()
+        if exc is not None:
+            self.status = f"error: {exc_type.__name__}: {exc}"
+
+        record = {'event': 'span', 'name': self.name, 'parent': self.parent, 'depth': self.depth,
+                  'started': round(self.started, 6), 'seconds': round(seconds, 6), 'rows': self.rows,
+                  'rows_per_s': round(self.rows / seconds, 1) if self.rows and seconds > 0 else None,
+                  'rss_start_mb': round(self._rss_start / 1e6, 1),
+                  'rss_delta_mb': round((rss_end - self._rss_start) / 1e6, 1),
+                  'peak_rss_mb': round(peak / 1e6, 1) if peak is not None else None,
+                  'peak_delta_mb': round((peak - self._rss_start) / 1e6, 1) if peak is not None else None,
+                  'status': self.status, **self.fields}
+        if self._profiler is not None:
+            record['profile'] = _top_functions(self._profiler)
+            if _settings.profile_dir:
+                path = os.path.join(_settings.profile_dir, f"{self.name}-{int(self.started * 1000)}.prof")
+                self._profiler.dump_stats(path)
+                record['profile_path'] = path
+        elif self.depth == 0 and _settings.profile == 'tracemalloc':
+            record['traced_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / 1e6, 1)
+            top = tracemalloc.take_snapshot().statistics('lineno')[:5]
+            record['top_allocations'] = [f"{stat.traceback[0].filename}:{stat.traceback[0].lineno} "
+                                         f"{stat.size / 1e6:.1f} MB" for stat in top]
+            if self._started_tracing:
+                tracemalloc.stop()
+        if self.messages:
+            record['messages'] = self.messages
+        _emit(record)
+        return False
+
+
+def _emit(record):
+    with _lock:
+        _records.append(record)
+        if _settings.stream is not None:
+            _settings.stream.write(json.dumps(record, default=str) + '\n')
+            _settings.stream.flush()
+
+
+def span(name, rows=None, **fields):
+    """
+    Context manager timing a pipeline stage ('with span("news.load") as s: ...').
+    Records wall time, row count, RSS at start and end (and the peak, see configure()),
+    status and any extra fields.
+    Returns a shared no-op object when instrumentation is disabled.
+    """
+    if not _settings.enabled:
+        return _NULL_SPAN
+    return Span(name, rows, **fields)
+
+
+def _row_count(result):
+    """Rows of a returned DataFrame/Series (None for anything else)."""
+    return len(result) if isinstance(result, (pd.DataFrame, pd.Series)) else None
+
+
+def instrumented(name, fields=None):
+    """
+    Decorator wrapping every call of a function or method in span(name). The row count
+    defaults to the length of a returned DataFrame/Series; set_rows() overrides it.
+    'fields' is an optional callable receiving the call's arguments and returning extra
+    fields for the record (e.g. lambda self, *args, **kwargs: {'ticker': self.ticker}).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _settings.enabled:
+                return func(*args, **kwargs)
+            with Span(name, **(fields(*args, **kwargs) if fields else {})) as current:
+                result = func(*args, **kwargs)
+                if current.rows is None:
+                    current.rows = _row_count(result)
+                return result
+        return wrapper
+    return decorator
+
+
+def set_rows(rows):
+    """Sets the row count of the innermost open span (no-op when disabled)."""
+    if _settings.enabled and _stack():
+        _stack()[-1].rows = rows
+
+
+def log(message):
+    """
+    Progress message: printed when instrumentation is disabled, otherwise attached to
+    the innermost open span (or written as a 'log' event outside of any span).
+    """
+    if not _settings.enabled:
+        print(message)
+    elif _stack():
+        _stack()[-1].messages.append(message)
+    elif _settings.stream is not None:
+        _emit({'event': 'log', 'started': round(time.time(), 6), 'message': message})
+    else:
+        print(message)
+
+
+def log_error(message):
+    """
+    Error message: always printed, and marks the innermost open span as failed, so errors
+    the analyzers catch and report still show up in the span records.
+    """
+    print(message)
+    if _settings.enabled and _stack():
+        current = _stack()[-1]
+        current.status = f"error: {message}"
+        current.messages.append(message)
+
+
+def records():
+    """Copy of the span records collected so far."""
+    with _lock:
+        return list(_records)
+
+
+def reset():
+    """Clears the collected span records."""
+    with _lock:
+        _records.clear()
+
+
+def summary() -> pd.DataFrame:
+    """
+    Span records aggregated per name: calls, total/mean/max seconds, rows, throughput,
+    the largest RSS increase from start to end and to the peak (NaN unless sampled) and
+    the number of failed calls; slowest first.
+    """
+    spans = pd.DataFrame([record for record in records() if record['event'] == 'span'])
+    if spans.empty:
+        return pd.DataFrame(columns=['name', 'calls', 'total_s', 'mean_s', 'max_s', 'rows', 'rows_per_s',
+                                     'rss_delta_mb', 'peak_delta_mb', 'errors'])
+    spans['rows'] = pd.to_numeric(spans['rows'], errors='coerce')
+    spans['peak_delta_mb'] = pd.to_numeric(spans['peak_delta_mb'], errors='coerce')
+    spans['failed'] = spans['status'] != 'ok'
+    table = spans.groupby('name', sort=False).agg(
+        calls=('seconds', 'size'), total_s=('seconds', 'sum'), mean_s=('seconds', 'mean'), max_s=('seconds', 'max'),
+        rows=('rows', 'sum'), rss_delta_mb=('rss_delta_mb', 'max'), peak_delta_mb=('peak_delta_mb', 'max'),
+        errors=('failed', 'sum'))
+    table['rows_per_s'] = (table['rows'] / table['total_s']).where(table['rows'] > 0).round(0)
+    table['rows'] = table['rows'].astype('Int64')
+    table[['total_s', 'mean_s', 'max_s']] = table[['total_s', 'mean_s', 'max_s']].round(4)
+    table = table[['calls', 'total_s', 'mean_s', 'max_s', 'rows', 'rows_per_s', 'rss_delta_mb', 'peak_delta_mb',
+                   'errors']]
+    return table.sort_values('total_s', ascending=False).reset_index()
+
+
+def print_summary():
+    """Prints summary() as a table."""
+    table = summary()
+    print("No instrumented spans recorded." if table.empty else table.to_string(index=False))
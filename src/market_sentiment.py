@@ -0,0 +1,184 @@
+import os
+import time
+import numpy as np
+import pandas as pd
+from data_analysis import _parse_dates
+from data_cache import ParquetCache
+from date_parsing import DATE_PARSER_VERSION, EXCHANGE_TZ
+from sentiment import SentimentScorer, SCORE_COLUMNS
+from session_alignment import assign_sessions, build_sessions
+from stock_analyzer import read_price_csv
+
+
+def ticker_from_path(stock_filepath):
+    """
+    Derives the ticker from a yfinance file name such as 'AAPL_historical_data.csv'.
+    """
+    return os.path.basename(stock_filepath).split('_')[0]
+
+
+class MultiTickerSentimentEngine:
+    """
+    Builds the daily price/sentiment frame for many tickers from a single news load.
+
+    The news file is read once (optionally through the Parquet cache), every unique
+    headline is scored once, and per-(ticker, day) sentiment aggregates are built with
+    vectorized groupby reductions (mean/sum/count). All price files are then stacked
+    into one long (ticker, Date) frame and joined to the aggregates in a single merge,
+    so N tickers cost one news load plus N cheap price reads.
+    """
+    def __init__(self, news_filepath, stock_filepaths, scorer=None, use_cache=True,
+                 headline_column='headline', date_column='date', ticker_column='stock',
+                 align='calendar', session_options=None):
+        """
+        'stock_filepaths' is either a ticker -> path dict or a list of yfinance file paths
+        (tickers are then taken from the file names). Tickers must match the news 'stock' column.
+        'align' chooses how headlines are mapped to price rows: 'calendar' uses the day of
+        publication in the exchange timezone; 'session' assigns each headline to its
+        effective trading session (see session_alignment; after-close and weekend news rolls
+        forward), with 'session_options' passed to build_sessions (market_open, market_close,
+        cutoff, ...).
+        """
+        if align not in ('calendar', 'session'):
+            raise ValueError("align must be 'calendar' or 'session'")
+        if isinstance(stock_filepaths, dict):
+            self.stock_filepaths = dict(stock_filepaths)
+        else:
+            self.stock_filepaths = {ticker_from_path(path): path for path in stock_filepaths}
+        self.news_filepath = news_filepath
+        self.scorer = scorer or SentimentScorer()
+        self.use_cache = use_cache
+        self.headline_column = headline_column
+        self.date_column = date_column
+        self.ticker_column = ticker_column
+        self.align = align
+        self.session_options = session_options or {}
+        self.prices = None
+        self.news_df = None
+        self.daily_sentiment = None
+        self.results = {}
+
+    def _read_news(self):
+        """
+        Reads only the headline, date and ticker columns, with the ticker as a categorical.
+        """
+        df = pd.read_csv(self.news_filepath,
+                         usecols=[self.headline_column, self.date_column, self.ticker_column],
+                         dtype={self.ticker_column: 'category'})
+        df[self.date_column] = _parse_dates(df[self.date_column])
+        return df.dropna(subset=[self.date_column])
+
+    def load_news(self):
+        """Loads the news file once for all tickers, keeping only the requested tickers."""
+        start = time.perf_counter()
+        if self.use_cache:
+            options = {'reader': 'market_sentiment',
+                       'columns': [self.headline_column, self.date_column, self.ticker_column],
+                       'dates': DATE_PARSER_VERSION}
+            news_df = ParquetCache().load(self.news_filepath, self._read_news, options)
+        else:
+            news_df = self._read_news()
+        news_df = news_df[news_df[self.ticker_column].isin(list(self.stock_filepaths))].reset_index(drop=True)
+        news_df[self.ticker_column] = news_df[self.ticker_column].cat.remove_unused_categories()
+        self.news_df = news_df
+        print(f"Loaded {len(self.news_df)} headlines for {len(self.stock_filepaths)} tickers "
+              f"in {time.perf_counter() - start:.2f}s.")
+        return self.news_df
+
+    def _news_days(self):
+        """
+        Calendar day of every headline in the exchange timezone (as naive midnight, like
+        the price Dates), so evening news stays on its US trading day.
+        """
+        return self.news_df[self.date_column].dt.tz_convert(EXCHANGE_TZ).dt.tz_localize(None).dt.normalize()
+
+    def _news_sessions(self):
+        """
+        Effective trading session of every headline, from the trading dates of its own
+        ticker's price file (so news is never mapped to a day that ticker has no row for).
+        """
+        if self.prices is None:
+            self.prices = self._load_prices()
+        sessions = np.full(len(self.news_df), np.datetime64('NaT'), dtype='datetime64[ns]')
+        positions = self.news_df.groupby(self.ticker_column, observed=True).indices
+        for ticker, dates in self.prices.groupby('Ticker', sort=False)['Date']:
+            own = positions.get(ticker)
+            if own is not None:
+                table = build_sessions(dates.unique(), **self.session_options)
+                sessions[own] = assign_sessions(self.news_df[self.date_column].iloc[own], table).to_numpy()
+        return pd.Series(sessions, index=self.news_df.index, name='Session')
+
+    def build_daily_sentiment(self):
+        """
+        Scores the headlines (each unique headline once) and aggregates them per ticker
+        and day (calendar day or trading session, see 'align'): mean scores, summed scores
+        and the article count.
+        """
+        if self.news_df is None:
+            self.load_news()
+        scores = self.scorer.score(self.news_df[self.headline_column])
+        scores[self.ticker_column] = self.news_df[self.ticker_column].to_numpy()
+        days = self._news_sessions() if self.align == 'session' else self._news_days()
+        scores['Date'] = days.to_numpy()
+        scores = scores.dropna(subset=['Date']) # Session mode: news after the last session
+
+        grouped = scores.groupby([self.ticker_column, 'Date'], observed=True)[SCORE_COLUMNS]
+        means = grouped.mean()
+        sums = grouped.sum().add_suffix('_Sum')
+        counts = grouped.size().rename('Article_Count')
+        self.daily_sentiment = pd.concat([means, sums, counts], axis=1)
+        self.daily_sentiment.index = self.daily_sentiment.index.set_names(['Ticker', 'Date'])
+        return self.daily_sentiment
+
+    def _load_prices(self):
+        """
+        Reads every price file and stacks them into one long frame with a 'Ticker' column.
+        """
+        cache = ParquetCache() if self.use_cache else None
+        frames = []
+        for ticker, path in self.stock_filepaths.items():
+            # Same parse (and cache entry) as StockAnalyzer(use_cache=True)
+            if cache:
+                stock_df = cache.load(path, lambda path=path: read_price_csv(path), {'reader': 'ohlcv'})
+            else:
+                stock_df = read_price_csv(path)
+            stock_df = stock_df.reset_index()[['Date', 'Open', 'High', 'Low', 'Close', 'Volume']]
+            stock_df['Date'] = pd.to_datetime(stock_df['Date'], errors='coerce').dt.tz_localize(None).dt.normalize()
+            stock_df['Ticker'] = ticker
+            frames.append(stock_df.dropna(subset=['Date']))
+        prices = pd.concat(frames, ignore_index=True)
+        return prices.sort_values(['Ticker', 'Date'], kind='stable')
+
+    def run(self):
+        """
+        Runs the pipeline for all tickers and returns a ticker -> DataFrame dict.
+        Each frame is indexed by trading Date and holds the OHLCV columns, Daily_Return (%)
+        and the day's sentiment aggregates (0 on days without news). The 'align' mode is
+        recorded in each frame's attrs['sentiment_alignment'] (checked by backtest).
+        """
+        if self.daily_sentiment is None:
+            self.build_daily_sentiment()
+        start = time.perf_counter()
+        if self.prices is None:
+            self.prices = self._load_prices()
+        prices = self.prices
+
+        daily = self.daily_sentiment.reset_index()
+        daily['Ticker'] = daily['Ticker'].astype(str)
+        # Left join: only trading days are kept; headlines on other days are not attached
+        # (with align="session" they have already been rolled forward to the next session)
+        merged = prices.merge(daily, on=['Ticker', 'Date'], how='left')
+        sentiment_columns = [column for column in daily.columns if column not in ('Ticker', 'Date')]
+        merged[sentiment_columns] = merged[sentiment_columns].fillna(0)
+        merged['Article_Count'] = merged['Article_Count'].astype('int64')
+
+        merged['Close'] = pd.to_numeric(merged['Close'], errors='coerce')
+        merged['Daily_Return'] = merged.groupby('Ticker', sort=False)['Close'].pct_change(fill_method=None) * 100
+        merged = merged.dropna(subset=['Daily_Return'])
+
+        self.results = {ticker: frame.drop(columns='Ticker').set_index('Date')
+                        for ticker, frame in merged.groupby('Ticker', sort=False)}
+        for frame in self.results.values():
+            frame.attrs['sentiment_alignment'] = self.align
+        print(f"Joined prices and sentiment for {len(self.results)} tickers in {time.perf_counter() - start:.2f}s.")
+        return self.results
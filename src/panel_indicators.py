@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+PANEL_INDICATORS = ['SMA_20', 'SMA_50', 'RSI', 'MACD', 'MACD_signal']
+
+
+def _compact(close):
+    """
+    Moves each column's valid (non-NaN) values to the top, preserving their order.
+    Returns the compacted matrix and the row permutation used, so results can be
+    scattered back. After compaction every ticker's history starts at row 0, which
+    lets all columns share the same warm-up rows.
+    """
+    valid = ~np.isnan(close)
+    order = np.argsort(~valid, axis=0, kind='stable')
+    return np.take_along_axis(close, order, axis=0), order, valid
+
+
+def _scatter(values, order, valid):
+    """
+    Inverse of _compact: puts compacted results back on the original rows (NaN on gaps).
+    """
+    out = np.empty_like(values)
+    np.put_along_axis(out, order, values, axis=0)
+    out[~valid] = np.nan
+    return out
+
+
+def _sma(compact, period):
+    """
+    Simple moving average of every column from a cumulative sum along the time axis.
+    """
+    out = np.full(compact.shape, np.nan)
+    if compact.shape[0] < period:
+        return out
+    cumulative = np.cumsum(compact, axis=0)
+    out[period - 1] = cumulative[period - 1]
+    out[period:] = cumulative[period:] - cumulative[:-period]
+    out[period - 1:] /= period
+    return out
+
+
+def _ema(values, period, start):
+    """
+    TA-Lib style EMA of every column: seeded at row 'start' with the mean of the
+    'period' rows ending there, then the recurrence ema += k * (x - ema) row by row
+    (vectorized across columns).
+    """
+    out = np.full(values.shape, np.nan)
+    if values.shape[0] <= start or start < period - 1:
+        return out
+    k = 2.0 / (period + 1)
+    ema = values[start - period + 1:start + 1].mean(axis=0)
+    out[start] = ema
+    for t in range(start + 1, values.shape[0]):
+        ema = (values[t] - ema) * k + ema
+        out[t] = ema
+    return out
+
+
+def _rsi(compact, period):
+    """
+    Wilder RSI of every column, seeded with the mean gain/loss of the first 'period' changes.
+    """
+    out = np.full(compact.shape, np.nan)
+    if compact.shape[0] <= period:
+        return out
+    change = np.diff(compact, axis=0)
+    gains = np.where(change > 0, change, 0.0)
+    losses = np.where(change < 0, -change, 0.0)
+    gains[np.isnan(change)] = np.nan
+    losses[np.isnan(change)] = np.nan
+
+    avg_gain = gains[:period].sum(axis=0) / period
+    avg_loss = losses[:period].sum(axis=0) / period
+    for t in range(period, compact.shape[0]):
+        if t > period:
+            avg_gain = (avg_gain * (period - 1) + gains[t - 1]) / period
+            avg_loss = (avg_loss * (period - 1) + losses[t - 1]) / period
+        total = avg_gain + avg_loss
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # TA-Lib returns 0 when both averages are (close to) zero
+            out[t] = np.where(np.abs(total) < 1e-8, 0.0, 100.0 * avg_gain / total)
+    return out
+
+
+def _macd(compact, fast_period, slow_period, signal_period):
+    """
+    MACD line and signal of every column with TA-Lib's alignment: both EMAs are seeded at
+    row slow_period - 1 and values are reported once the signal EMA exists.
+    """
+    start = slow_period - 1
+    line = _ema(compact, fast_period, start) - _ema(compact, slow_period, start)
+    signal = np.full(compact.shape, np.nan)
+    if compact.shape[0] > start:
+        signal[start:] = _ema(line[start:], signal_period, signal_period - 1)
+    line[np.isnan(signal)] = np.nan
+    return line, signal
+
+
+def compute_panel_indicators(close, sma_periods=(20, 50), rsi_period=14,
+                             fast_period=12, slow_period=26, signal_period=9):
+    """
+    Computes SMA, RSI and MACD for every ticker of a (dates x tickers) close-price panel
+    in one vectorized pass along the time axis.
+
+    'close' is a 2-D NumPy array or a DataFrame (index: dates, columns: tickers). NaNs mark
+    dates on which a ticker has no bar, whether before its history starts, after it ends or
+    as gaps in between: each ticker is computed over its own bars only, exactly as TA-Lib
+    would on that ticker's series, and indicators are NaN on the missing dates.
+    (Unlike StockAnalyzer.calculate_indicators, short histories are not blanked entirely;
+    each indicator starts after its own lookback.)
+
+    Returns a dict indicator name -> panel of the same shape and type as 'close'.
+    """
+    is_frame = isinstance(close, pd.DataFrame)
+    values = close.to_numpy(dtype=float) if is_frame else np.asarray(close, dtype=float)
+    if values.ndim != 2:
+        raise ValueError("close must be a 2-D (dates x tickers) panel")
+
+    compact, order, valid = _compact(values)
+    results = {f'SMA_{period}': _sma(compact, period) for period in sma_periods}
+    results['RSI'] = _rsi(compact, rsi_period)
+    results['MACD'], results['MACD_signal'] = _macd(compact, fast_period, slow_period, signal_period)
+
+    results = {name: _scatter(panel, order, valid) for name, panel in results.items()}
+    if is_frame:
+        results = {name: pd.DataFrame(panel, index=close.index, columns=close.columns)
+                   for name, panel in results.items()}
+    return results
+
+
+def close_panel(frames, column='Close'):
+    """
+    Builds a (dates x tickers) panel from a ticker -> Date-indexed DataFrame dict,
+    e.g. {ticker: StockAnalyzer(...).data}. Missing dates become NaN.
+    """
+    return pd.DataFrame({ticker: df[column] for ticker, df in frames.items()}).sort_index()
@@ -0,0 +1,209 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, ALL_COMPLETED, FIRST_COMPLETED
+import pandas as pd
+
+MATPLOTLIB_FORMATS = ('png', 'svg', 'pdf')
+PLOTLY_FORMATS = ('html', 'json', 'png', 'svg') # png/svg need the optional 'kaleido' package
+
+
+# --- Draw functions: fill a Matplotlib Axes from precomputed aggregates.
+# They only use the object-oriented API (no pyplot state), so they are safe to run in
+# pool workers, and the interactive path in NewsAnalyzer reuses them unchanged.
+
+def draw_histogram(ax, values, weights=None, bins=30, kde=True, title='', xlabel='', ylabel=''):
+    """
+    Histogram of 'values' (optionally weighted, e.g. value -> frequency counts).
+    """
+    import seaborn as sns # Plotting libraries are imported on first use
+    sns.histplot(x=values, weights=weights, bins=bins, kde=kde, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(axis='y', alpha=0.75)
+
+
+def draw_bar(ax, counts, title='', xlabel='', ylabel='', palette=None, rotation=45, xticks=None, grid_axis=None):
+    """
+    Bar chart of a label -> count Series. Uses a seaborn palette when given,
+    otherwise pandas' default bar style.
+    """
+    if palette is None:
+        counts.plot(kind='bar', ax=ax)
+    else:
+        import seaborn as sns
+        sns.barplot(x=counts.index, y=counts.values, hue=counts.index, palette=palette, legend=False, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    if xticks is not None:
+        ax.set_xticks(xticks)
+    if rotation:
+        ax.tick_params(axis='x', labelrotation=rotation)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+    if grid_axis:
+        ax.grid(axis=grid_axis, alpha=0.75)
+
+
+def draw_line(ax, series, title='', xlabel='', ylabel=''):
+    """
+    Line chart of a time-indexed Series.
+    """
+    series.plot(kind='line', ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+
+
+def _file_record(path):
+    return path, os.path.getsize(path)
+
+
+def render_matplotlib(path_base, formats, draw, data, figsize, options):
+    """
+    Builds a Figure (Agg, outside pyplot), draws it, saves it once per format and
+    releases it. Runs in pool workers; returns the written files and timings.
+    """
+    from matplotlib.figure import Figure
+    start = time.perf_counter()
+    fig = Figure(figsize=figsize)
+    try:
+        draw(fig.add_subplot(), data, **options)
+        fig.tight_layout()
+        built = time.perf_counter()
+        files = []
+        for fmt in formats:
+            path = f'{path_base}.{fmt}'
+            fig.savefig(path, format=fmt)
+            files.append(_file_record(path))
+    finally:
+        fig.clear() # Drop artists right away; the figure is never registered with pyplot
+    return {'build_s': built - start, 'save_s': time.perf_counter() - built, 'files': files}
+
+
+def render_plotly(path_base, formats, build, args, kwargs):
+    """
+    Builds a Plotly figure with build(*args, **kwargs) and writes it once per format.
+    Runs in pool workers; returns the written files and timings.
+    """
+    import plotly.io as pio
+
+    start = time.perf_counter()
+    fig = build(*args, **kwargs)
+    built = time.perf_counter()
+    files = []
+    for fmt in formats:
+        path = f'{path_base}.{fmt}'
+        if fmt == 'html':
+            fig.write_html(path, include_plotlyjs='cdn', auto_open=False)
+        elif fmt == 'json':
+            pio.write_json(fig, path)
+        else:
+            fig.write_image(path, format=fmt)
+        files.append(_file_record(path))
+    return {'build_s': built - start, 'save_s': time.perf_counter() - built, 'files': files}
+
+
+class FigureRenderer:
+    """
+    Renders figures to files in the background instead of displaying them.
+
+    Callers hand over a draw/build function plus the (small) precomputed aggregates it
+    plots; the figure is built, written in every requested format and released inside a
+    worker pool, so the pipeline never blocks on plt.show()/fig.show() and no figure
+    outlives its render. At most 'max_pending' figures are in flight at once. Each
+    completed figure is reported with its build/save time and file sizes, and close()
+    returns the per-figure timings as a DataFrame.
+
+    Use it as a context manager, or call close() to wait for outstanding figures.
+    """
+    def __init__(self, output_dir, formats=('png',), plotly_formats=('html',), max_workers=None,
+                 use_processes=True, max_pending=None):
+        """
+        'formats' apply to Matplotlib figures, 'plotly_formats' to Plotly figures.
+        With use_processes=False a thread pool is used instead (no pickling of the
+        data, but rendering then shares the GIL with the caller).
+        """
+        unknown = (set(formats) - set(MATPLOTLIB_FORMATS)) | (set(plotly_formats) - set(PLOTLY_FORMATS))
+        if unknown:
+            raise ValueError(f"Unsupported output format(s): {', '.join(sorted(unknown))}")
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.plotly_formats = tuple(plotly_formats)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 2 * self.max_workers
+        executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self.pool = executor(max_workers=self.max_workers)
+        self.records = []
+        self._pending = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def _submit(self, name, fn, *args):
+        while len(self._pending) >= self.max_pending:
+            self._collect(return_when=FIRST_COMPLETED)
+        future = self.pool.submit(fn, os.path.join(self.output_dir, name), *args)
+        self._pending[future] = (name, time.perf_counter())
+        return future
+
+    def submit(self, name, draw, data, figsize=(10, 6), **options):
+        """
+        Queues a Matplotlib figure: draw(ax, data, **options) is called on a fresh
+        Figure of 'figsize' in a worker and written as '<output_dir>/<name>.<format>'.
+        """
+        return self._submit(name, render_matplotlib, self.formats, draw, data, figsize, options)
+
+    def submit_plotly(self, name, build, *args, **kwargs):
+        """
+        Queues a Plotly figure returned by build(*args, **kwargs), written as
+        '<output_dir>/<name>.<format>' for every format in 'plotly_formats'.
+        """
+        return self._submit(name, render_plotly, self.plotly_formats, build, args, kwargs)
+
+    def _collect(self, return_when=FIRST_COMPLETED):
+        done, _ = wait(list(self._pending), return_when=return_when)
+        for future in done:
+            name, queued = self._pending.pop(future)
+            record = {'figure': name, 'status': 'ok', 'error': '', 'build_s': 0.0, 'save_s': 0.0,
+                      'bytes': 0, 'files': ''}
+            try:
+                result = future.result()
+                record.update(build_s=result['build_s'], save_s=result['save_s'],
+                              bytes=sum(size for _, size in result['files']),
+                              files=', '.join(path for path, _ in result['files']))
+                status = f"{record['build_s'] + record['save_s']:.2f}s, {record['bytes'] / 1024:,.0f} KB"
+            except Exception as e:
+                record.update(status='error', error=str(e))
+                status = f"FAILED ({e})"
+            record['wall_s'] = time.perf_counter() - queued
+            self.records.append(record)
+            print(f"Rendered figure '{name}': {status}")
+
+    def timings(self):
+        """
+        Per-figure build/save/wall-clock seconds and output sizes of the figures completed so far.
+        """
+        return pd.DataFrame(self.records, columns=['figure', 'status', 'error', 'build_s', 'save_s',
+                                                   'wall_s', 'bytes', 'files'])
+
+    def close(self):
+        """
+        Waits for all queued figures, shuts the pool down and returns timings().
+        """
+        if self._pending:
+            self._collect(return_when=ALL_COMPLETED)
+        self.pool.shutdown()
+        timings = self.timings()
+        if not timings.empty:
+            print(f"Rendered {len(timings)} figures to '{self.output_dir}' "
+                  f"({(timings['status'] != 'ok').sum()} failed, "
+                  f"{(timings['build_s'] + timings['save_s']).sum():.2f}s of render time).")
+        return timings
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
@@ -0,0 +1,214 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from textblob import TextBlob
+from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+# Part of every cache key: bump when the scoring functions change so old scores are not reused.
+SCORER_VERSION = 'textblob+vader-v2'
+SCORE_COLUMNS = ['TextBlob_Sentiment', 'VADER_Sentiment']
+
+# One VADER analyzer per process, created lazily (in pool workers by the initializer).
+_vader_analyzer = None
+
+
+def _init_worker():
+    """
+    Loads the VADER lexicon once per worker process.
+    """
+    global _vader_analyzer
+    _vader_analyzer = SentimentIntensityAnalyzer()
+
+
+def _score_text(text):
+    """
+    Returns (TextBlob polarity, VADER compound) for one headline; empty or
+    non-string values score 0.0 on both.
+    """
+    if not isinstance(text, str) or not text.strip():
+        return 0.0, 0.0
+    return TextBlob(text).sentiment.polarity, _vader_analyzer.polarity_scores(text)['compound']
+
+
+def score_batch(texts):
+    """
+    Scores a batch of headlines, returning a (len(texts), 2) float array of
+    TextBlob and VADER scores. Runs in pool workers, or in-process for small batches.
+    """
+    if _vader_analyzer is None:
+        _init_worker()
+    return np.array([_score_text(text) for text in texts], dtype=float).reshape(-1, 2)
+
+
+def text_hash(text):
+    """
+    Content hash used as the cache key of a headline (a str; other values are never
+    hashed, so a number cannot share the key of its string form).
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"Only headline strings are hashed, got {type(text).__name__}")
+    return hashlib.blake2b(f"{SCORER_VERSION}\0{text}".encode('utf-8'), digest_size=16).digest()
+
+
+class SentimentCache:
+    """
+    Persistent headline hash -> (TextBlob, VADER) score store backed by SQLite.
+    Only the parent process reads and writes it; workers just compute scores.
+    The connection may be used from any thread of that process (e.g. the scoring thread
+    of streaming_pipeline), one call at a time.
+    """
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock() # sqlite3 connections must not be used by two threads at once
+        self.conn.execute("CREATE TABLE IF NOT EXISTS scores "
+                          "(hash BLOB PRIMARY KEY, textblob REAL NOT NULL, vader REAL NOT NULL)")
+        self.conn.commit()
+
+    def get_many(self, hashes, chunk=900):
+        """
+        Returns a dict hash -> (textblob, vader) for the hashes present in the cache.
+        Lookups are chunked to stay under SQLite's bound-parameter limit.
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(hashes), chunk):
+                batch = hashes[start:start + chunk]
+                placeholders = ','.join('?' * len(batch))
+                rows = self.conn.execute(f"SELECT hash, textblob, vader FROM scores WHERE hash IN ({placeholders})", batch)
+                for key, textblob, vader in rows:
+                    found[key] = (textblob, vader)
+        return found
+
+    def put_many(self, hashes, scores):
+        """
+        Stores scores for the given hashes in one transaction.
+        """
+        with self._lock, self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO scores VALUES (?, ?, ?)",
+                                  ((key, float(tb), float(vd)) for key, (tb, vd) in zip(hashes, scores)))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class SentimentScorer:
+    """
+    Scores headlines with TextBlob polarity and VADER compound scores.
+
+    Identical headlines are scored once: inputs are deduplicated, scores are remembered
+    in memory (so other tickers in the same run reuse them; see 'memo_size') and, when
+    'cache_path' is set, persisted in a SQLite content-hash cache across runs.
+    Headlines that still need scoring are split into batches and scored across a
+    process pool, so throughput scales with the number of cores.
+    """
+    def __init__(self, cache_path=None, max_workers=None, batch_size=2000, verbose=True, memo_size=None):
+        """
+        'max_workers' defaults to the number of CPUs; 1 scores in-process.
+        Work smaller than one batch is always scored in-process.
+        verbose=False silences the per-call throughput message (e.g. for streaming use,
+        where score() is called for every small batch).
+        'memo_size' bounds the in-memory scores to that many most recently used headlines
+        (0 disables them, None keeps every headline scored by this scorer); for a
+        long-running feed, bound it and let the SQLite cache serve older repeats.
+        """
+        self.cache = SentimentCache(cache_path) if cache_path else None
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.verbose = verbose
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+
+    def _remember(self, scores):
+        """
+        Adds hash -> scores pairs to the in-memory scores, evicting the least recently
+        used ones beyond 'memo_size'.
+        """
+        if self.memo_size == 0:
+            return
+        self._memo.update(scores)
+        if self.memo_size is not None:
+            for key in scores:
+                self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+    def _score_missing(self, texts):
+        """
+        Scores the given unique headlines, in parallel when there is enough work.
+        """
+        if not texts:
+            return np.zeros((0, 2))
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        if self.max_workers > 1 and len(batches) > 1:
+            workers = min(self.max_workers, len(batches))
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                return np.vstack(list(pool.map(score_batch, batches)))
+        return np.vstack([score_batch(batch) for batch in batches])
+
+    def score(self, texts):
+        """
+        Returns a DataFrame with 'TextBlob_Sentiment' and 'VADER_Sentiment' columns,
+        aligned with 'texts' (a Series or list of headlines).
+        """
+        start = time.perf_counter()
+        series = pd.Series(texts)
+        codes, uniques = pd.factorize(series) # Missing values get code -1 and score 0.0
+        # Non-string values (numbers, ...) also score 0.0 and get no cache key
+        is_string = np.array([isinstance(text, str) for text in uniques], dtype=bool)
+        string_codes = np.cumsum(is_string) - 1 # Unique position -> position among the strings
+        valid = codes >= 0
+        valid[valid] = is_string[codes[valid]]
+        uniques = [text for text in uniques if isinstance(text, str)]
+        hashes = [text_hash(text) for text in uniques]
+
+        unique_scores = np.zeros((len(uniques), 2))
+        found = {key: self._memo[key] for key in hashes if key in self._memo}
+        pending = [i for i, key in enumerate(hashes) if key not in found]
+        if self.cache is not None and pending:
+            found.update(self.cache.get_many([hashes[i] for i in pending]))
+        missing = [i for i in pending if hashes[i] not in found]
+
+        new_scores = self._score_missing([uniques[i] for i in missing])
+        new_hashes = [hashes[i] for i in missing]
+        found.update(zip(new_hashes, map(tuple, new_scores)))
+        if self.cache is not None and new_hashes:
+            self.cache.put_many(new_hashes, new_scores)
+        self._remember(found)
+
+        for i, key in enumerate(hashes):
+            unique_scores[i] = found[key]
+        scores = np.zeros((len(series), 2))
+        scores[valid] = unique_scores[string_codes[codes[valid]]]
+
+        elapsed = time.perf_counter() - start
+        rate = len(series) / elapsed if elapsed > 0 else float('inf')
+        if self.verbose:
+            print(f"Scored {len(series)} headlines ({len(uniques)} unique, {len(missing)} newly scored) "
+                  f"in {elapsed:.2f}s ({rate:,.0f} headlines/sec).")
+        return pd.DataFrame(scores, columns=SCORE_COLUMNS, index=series.index)
+
+    def add_sentiment_scores(self, df, text_column='Headline'):
+        """Adds TextBlob and VADER sentiment scores to the DataFrame."""
+        print("\nPerforming sentiment analysis...")
+        scores = self.score(df[text_column])
+        df['TextBlob_Sentiment'] = scores['TextBlob_Sentiment'].to_numpy()
+        df['VADER_Sentiment'] = scores['VADER_Sentiment'].to_numpy()
+        print("Sentiment analysis complete.")
+        return df
+
+    def close(self):
+        """
+        Closes the persistent cache, if any.
+        """
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+from date_parsing import EXCHANGE_TZ, parse_dates
+
+MARKET_OPEN = '09:30'
+MARKET_CLOSE = '16:00'
+
+
+def _clock_offset(clock):
+    """
+    Time of day ('HH:MM', 'HH:MM:SS' or datetime.time) as a Timedelta since midnight.
+    """
+    parsed = pd.Timestamp(str(clock))
+    return pd.Timedelta(hours=parsed.hour, minutes=parsed.minute, seconds=parsed.second)
+
+
+def _at_clock(days, clock, timezone):
+    """
+    UTC instants of exchange wall-clock time on each of 'days' (DST-aware). 'clock' is one
+    time of day, or a per-day array of Timedelta offsets since midnight.
+    """
+    offsets = _clock_offset(clock) if np.ndim(clock) == 0 else clock
+    local = days + offsets
+    return local.tz_localize(timezone, ambiguous=False, nonexistent='shift_forward').tz_convert('UTC')
+
+
+def build_sessions(trading_dates, market_open=MARKET_OPEN, market_close=MARKET_CLOSE, cutoff=None,
+                   early_closes=None, timezone=EXCHANGE_TZ) -> pd.DataFrame:
+    """
+    Builds the session table for a set of trading dates (e.g. the Date index of a price file).
+
+    Returns one row per trading day, sorted, with the session 'Date' (naive midnight) and
+    its 'Session_Open', 'Session_Close' and 'Cutoff' instants in UTC. Articles published
+    up to a session's cutoff (inclusive) and after the previous session's cutoff belong to
+    that session. The cutoff defaults to the close; pass a clock time such as '15:30' to
+    move it. 'early_closes' maps dates to an earlier close time (half trading days).
+    """
+    days = pd.DatetimeIndex(pd.to_datetime(pd.Index(trading_dates)))
+    if days.tz is not None:
+        days = days.tz_convert(timezone).tz_localize(None)
+    days = days.normalize().unique().sort_values()
+
+    close_offsets = pd.Series(_clock_offset(market_close), index=days)
+    for day, clock in (early_closes or {}).items():
+        day = pd.Timestamp(day).normalize()
+        if day in close_offsets.index:
+            close_offsets[day] = _clock_offset(clock)
+    sessions = pd.DataFrame({
+        'Date': days,
+        'Session_Open': _at_clock(days, market_open, timezone),
+        'Session_Close': _at_clock(days, close_offsets.to_numpy(), timezone),
+    })
+    sessions['Cutoff'] = sessions['Session_Close'] if cutoff is None else _at_clock(days, cutoff, timezone)
+    return sessions
+
+
+def assign_sessions(timestamps, sessions: pd.DataFrame) -> pd.Series:
+    """
+    Maps every timestamp to its effective trading session with one binary search over the
+    sorted session cutoffs (no Python loop): an article belongs to the first session whose
+    cutoff is at or after its publication time, so after-close, overnight, weekend and
+    holiday news rolls forward to the next session. Naive timestamps are taken as exchange
+    time (see date_parsing.parse_dates). Returns the session Date per timestamp (NaT for
+    missing timestamps and for those after the last session's cutoff), aligned with the input.
+    """
+    times = parse_dates(pd.Series(timestamps))
+    cutoffs = sessions['Cutoff'].dt.tz_convert('UTC').dt.tz_localize(None).dt.as_unit('ns').to_numpy().view('int64')
+    instants = times.dt.tz_localize(None).dt.as_unit('ns').to_numpy().view('int64')
+
+    positions = np.searchsorted(cutoffs, instants, side='left')
+    valid = times.notna().to_numpy() & (positions < len(cutoffs))
+    session_dates = np.full(len(times), np.datetime64('NaT'), dtype='datetime64[ns]')
+    session_dates[valid] = sessions['Date'].dt.as_unit('ns').to_numpy()[positions[valid]]
+    return pd.Series(session_dates, index=times.index, name='Session')
+
+
+def align_news_to_sessions(news_df: pd.DataFrame, trading_dates, date_column='date', **session_options) -> pd.DataFrame:
+    """
+    Convenience wrapper: adds a 'Session' column (the effective trading day) to a news frame
+    and drops articles that fall after the last available session.
+    'session_options' are passed to build_sessions (market_open, market_close, cutoff, ...).
+    """
+    sessions = build_sessions(trading_dates, **session_options)
+    aligned = news_df.assign(Session=assign_sessions(news_df[date_column], sessions).to_numpy())
+    return aligned.dropna(subset=['Session'])
@@ -1,8 +1,10 @@
 import pandas as pd
 import numpy as np
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import talib
+from bar_store import BarStore
+from data_cache import ParquetCache
+from downsampling import downsample_line, resample_ohlcv, slice_range
+from incremental_indicators import IncrementalIndicators
+from instrumentation import instrumented, log, log_error, set_rows
 # import pynance # pynance is commented out as we are using a mock for demonstration
 
 # --- Mocking pynance.Stock for demonstration purposes ---
@@ -21,50 +23,163 @@ class MockStock:
         self.eps = round(np.random.uniform(1.5, 5.0), 2) # Dummy EPS
         self.market_cap = f"{round(np.random.uniform(50, 2000), 2)} Billion" # Dummy Market Cap
 
+def read_price_csv(data_path: str) -> pd.DataFrame:
+    """
+    Parses a yfinance-style OHLCV CSV into a Date-indexed, date-sorted DataFrame.
+    """
+    df = pd.read_csv(data_path, parse_dates=["Date"])
+    df.sort_values("Date", inplace=True)
+    df.set_index("Date", inplace=True)
+    return df
+
+def build_price_figure(ticker: str, df: pd.DataFrame, max_bars: int = None, start=None, end=None) -> 'go.Figure':
+    """
+    Builds the candlestick + SMA + volume Plotly figure for a Date-indexed frame
+    (module-level so it can also run in rendering workers).
+    'start'/'end' restrict the plotted date range. With 'max_bars', the range is drawn
+    with at most that many candles/volume bars (merged OHLCV bars) and LTTB-downsampled
+    SMA lines, so the figure size no longer grows with the history length.
+    """
+    if max_bars is not None and max_bars < 1:
+        raise ValueError(f"max_bars must be at least 1, got {max_bars}")
+    # Plotly is imported on first use, so loading data or computing indicators does not pay for it
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    df = slice_range(df, start, end)
+    bars = resample_ohlcv(df, max_bars)
+
+    # Create subplots: 1 for candlestick/SMA, 1 for volume
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
+                        row_heights=[0.7, 0.3], # Allocate more space to price chart
+                        vertical_spacing=0.05) # Small space between subplots
+
+    # Add Candlestick chart to the first row
+    fig.add_trace(go.Candlestick(
+        x=bars.index,
+        open=bars['Open'], high=bars['High'],
+        low=bars['Low'], close=bars['Close'],
+        name='Candlestick'), row=1, col=1)
+
+    # Add SMA 20 to the first row, if available and not all NaNs
+    if 'SMA_20' in df.columns and not df['SMA_20'].isnull().all():
+        sma_20 = downsample_line(df['SMA_20'], max_bars) if max_bars else df['SMA_20']
+        fig.add_trace(go.Scatter(x=sma_20.index, y=sma_20, name='SMA 20',
+                                 line=dict(color='blue', width=1.5)), row=1, col=1)
+    # Add SMA 50 to the first row, if available and not all NaNs
+    if 'SMA_50' in df.columns and not df['SMA_50'].isnull().all():
+        sma_50 = downsample_line(df['SMA_50'], max_bars) if max_bars else df['SMA_50']
+        fig.add_trace(go.Scatter(x=sma_50.index, y=sma_50, name='SMA 50',
+                                 line=dict(color='red', width=1.5)), row=1, col=1)
+
+    # Add Volume bar chart to the second row
+    fig.add_trace(go.Bar(x=bars.index, y=bars['Volume'], name='Volume',
+                         marker_color='gray', opacity=0.6), row=2, col=1)
+
+    # Update layout for a cleaner look
+    fig.update_layout(
+        title=f'{ticker} Stock Analysis with Indicators',
+        template='plotly_white', # Use a clean white background
+        xaxis_rangeslider_visible=False, # Hide the range slider at the bottom
+        height=700, # Set a fixed height for the plot
+        hovermode='x unified' # Show unified hover information
+    )
+
+    # Update y-axis titles
+    fig.update_yaxes(title_text='Price', row=1, col=1)
+    fig.update_yaxes(title_text='Volume', row=2, col=1)
+
+    return fig
+
+def _ticker_field(analyzer, *args, **kwargs) -> dict:
+    """
+    Span field identifying the StockAnalyzer a call belongs to (see instrumentation).
+    """
+    return {'ticker': analyzer.ticker}
+
 class StockAnalyzer:
     """
     Analyzes stock data, calculates technical indicators,
     and visualizes the results.
     """
-    def __init__(self, ticker: str, data_path: str): # <-- THIS IS THE CRUCIAL LINE
+    def __init__(self, ticker: str, data_path: str, use_cache: bool = False, cache_dir: str = None,
+                 fallback_to_dummy: bool = True, data: pd.DataFrame = None): # <-- THIS IS THE CRUCIAL LINE
         """
         Initialize the StockAnalyzer with a stock ticker and the path
         to its historical data CSV file.
+        With use_cache=True the parsed CSV is kept in a Parquet cache
+        (see data_cache.ParquetCache) that is rebuilt whenever the CSV changes.
+        With fallback_to_dummy=False, load errors are raised instead of being
+        replaced by dummy data (used by batch runs).
+        An already-loaded Date-indexed OHLCV DataFrame can be passed as 'data'
+        to skip loading from 'data_path'.
         """
         self.ticker = ticker
         self.data_path = data_path
-        self.data = self._load_data()
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.fallback_to_dummy = fallback_to_dummy
+        self.data = data if data is not None else self._load_data()
+        self.bars = None # bar_store.TickerBars when opened with from_bar_store()
         # Use the MockStock for financial metrics.
         # Replace with 'Stock(ticker)' if pynance is installed and configured for real data.
         self.stock = MockStock(ticker)
 
+    @classmethod
+    @instrumented('stock.open_bars')
+    def from_bar_store(cls, ticker: str, store_path: str, start=None, end=None, mode: str = 'r'):
+        """
+        Opens a ticker from a binary bar store (see bar_store.BarStore) instead of parsing
+        its CSV: the files are memory-mapped in constant time and only the [start, end]
+        date range (found by binary search) backs self.data, without copying.
+        The mapped bars are kept in self.bars; with mode='r+', self.bars.append(new_bars)
+        adds bars to the store in place (re-open to include them in self.data).
+        """
+        bars = BarStore(store_path).open(ticker, mode=mode)
+        analyzer = cls(ticker, store_path, data=bars.to_frame(start, end))
+        analyzer.bars = bars
+        set_rows(len(analyzer.data))
+        return analyzer
+
+    @instrumented('stock.load', fields=_ticker_field)
     def _load_data(self) -> pd.DataFrame:
         """
         Loads stock CSV data from the specified file path.
         Includes error handling for file not found.
         """
         try:
-            print(f"Attempting to load data for {self.ticker} from: {self.data_path}")
-            df = pd.read_csv(self.data_path, parse_dates=["Date"])
-            df.sort_values("Date", inplace=True)
-            df.set_index("Date", inplace=True)
-            print(f"Data for {self.ticker} loaded successfully.")
+            log(f"Attempting to load data for {self.ticker} from: {self.data_path}")
+            if self.use_cache:
+                df = ParquetCache(self.cache_dir).load(self.data_path, self._read_csv, {'reader': 'ohlcv'})
+            else:
+                df = self._read_csv()
+            log(f"Data for {self.ticker} loaded successfully.")
             return df
         except FileNotFoundError:
-            print(f"Error: CSV file not found at {self.data_path}. Please ensure the path is correct.")
-            print(f"Generating dummy data for {self.ticker} as a fallback for demonstration.")
+            log_error(f"Error: CSV file not found at {self.data_path}. Please ensure the path is correct.")
+            if not self.fallback_to_dummy:
+                raise
+            log(f"Generating dummy data for {self.ticker} as a fallback for demonstration.")
             return self._generate_dummy_data()
         except Exception as e:
-            print(f"Error loading data for {self.ticker} from {self.data_path}: {e}")
-            print(f"Generating dummy data for {self.ticker} as a fallback for demonstration.")
+            log_error(f"Error loading data for {self.ticker} from {self.data_path}: {e}")
+            if not self.fallback_to_dummy:
+                raise
+            log(f"Generating dummy data for {self.ticker} as a fallback for demonstration.")
             return self._generate_dummy_data()
 
+    def _read_csv(self) -> pd.DataFrame:
+        """
+        Parses the stock CSV into a Date-indexed, date-sorted DataFrame.
+        """
+        return read_price_csv(self.data_path)
+
     def _generate_dummy_data(self) -> pd.DataFrame:
         """
         Generates dummy stock OHLCV data as a fallback when actual file loading fails.
         This ensures the rest of the analysis can still run for demonstration.
         """
-        print(f"Generating dummy stock data for {self.ticker}...")
+        log(f"Generating dummy stock data for {self.ticker}...")
         dates = pd.date_range(start='2024-01-01', periods=100, freq='D')
         np.random.seed(hash(self.ticker) % (2**32 - 1)) # Seed based on ticker for varied dummy data
 
@@ -86,6 +201,7 @@ class StockAnalyzer:
         df = df.apply(lambda x: x.clip(lower=0.1)) # Ensure prices are positive
         return df
 
+    @instrumented('stock.indicators', fields=_ticker_field)
     def calculate_indicators(self) -> pd.DataFrame:
         """
         Uses TA-Lib to compute common technical indicators (SMA, RSI, MACD).
@@ -97,7 +213,7 @@ class StockAnalyzer:
 
         # Check if the DataFrame is empty or has insufficient data
         if df.empty or len(close) < 50: # SMA_50 needs at least 50 periods
-            print(f"Warning: Not enough data points ({len(close)}) for {self.ticker} to calculate all indicators.")
+            log(f"Warning: Not enough data points ({len(close)}) for {self.ticker} to calculate all indicators.")
             # Initialize indicator columns with NaN if data is insufficient
             df['SMA_20'] = np.nan
             df['SMA_50'] = np.nan
@@ -106,6 +222,7 @@ class StockAnalyzer:
             df['MACD_signal'] = np.nan
             return df
 
+        import talib # Imported on first use (see build_price_figure)
         df['SMA_20'] = talib.SMA(close, timeperiod=20)
         df['SMA_50'] = talib.SMA(close, timeperiod=50)
         df['RSI'] = talib.RSI(close, timeperiod=14)
@@ -114,54 +231,41 @@ class StockAnalyzer:
 
         return df
 
-    def plot(self, df: pd.DataFrame) -> None:
+    def incremental_indicators(self, state_path: str = None) -> IncrementalIndicators:
+        """
+        Returns an IncrementalIndicators engine for appending new bars in O(1) each.
+        If 'state_path' points to a saved state it is resumed from there; otherwise the
+        engine is warmed up once on the loaded Close history.
+        Call engine.update(close) for every new bar and engine.save(state_path) to persist.
+        """
+        if state_path is not None:
+            try:
+                return IncrementalIndicators.load(state_path)
+            except FileNotFoundError:
+                log(f"No saved indicator state at {state_path}; warming up from {self.ticker} history.")
+        return IncrementalIndicators.from_history(self.data['Close'].to_numpy())
+
+    @instrumented('stock.plot', fields=_ticker_field)
+    def plot(self, df: pd.DataFrame, renderer=None, max_bars: int = None, start=None, end=None) -> None:
         """
         Visualizes stock price with candlestick chart, SMA indicators,
         and volume using Plotly.
+        With a rendering.FigureRenderer the chart is written to '<ticker>_price.html'
+        in the background instead of being opened.
+        'max_bars' caps the number of candles drawn for the [start, end] range
+        (see build_price_figure), e.g. max_bars=1000 for decades of daily data.
         """
         if df.empty:
-            print(f"Cannot plot for {self.ticker}: DataFrame is empty or failed to load data.")
+            log_error(f"Cannot plot for {self.ticker}: DataFrame is empty or failed to load data.")
             return
+        set_rows(len(df))
 
-        # Create subplots: 1 for candlestick/SMA, 1 for volume
-        fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
-                            row_heights=[0.7, 0.3], # Allocate more space to price chart
-                            vertical_spacing=0.05) # Small space between subplots
-
-        # Add Candlestick chart to the first row
-        fig.add_trace(go.Candlestick(
-            x=df.index,
-            open=df['Open'], high=df['High'],
-            low=df['Low'], close=df['Close'],
-            name='Candlestick'), row=1, col=1)
-
-        # Add SMA 20 to the first row, if available and not all NaNs
-        if 'SMA_20' in df.columns and not df['SMA_20'].isnull().all():
-            fig.add_trace(go.Scatter(x=df.index, y=df['SMA_20'], name='SMA 20',
-                                     line=dict(color='blue', width=1.5)), row=1, col=1)
-        # Add SMA 50 to the first row, if available and not all NaNs
-        if 'SMA_50' in df.columns and not df['SMA_50'].isnull().all():
-            fig.add_trace(go.Scatter(x=df.index, y=df['SMA_50'], name='SMA 50',
-                                     line=dict(color='red', width=1.5)), row=1, col=1)
-
-        # Add Volume bar chart to the second row
-        fig.add_trace(go.Bar(x=df.index, y=df['Volume'], name='Volume',
-                             marker_color='gray', opacity=0.6), row=2, col=1)
-
-        # Update layout for a cleaner look
-        fig.update_layout(
-            title=f'{self.ticker} Stock Analysis with Indicators',
-            template='plotly_white', # Use a clean white background
-            xaxis_rangeslider_visible=False, # Hide the range slider at the bottom
-            height=700, # Set a fixed height for the plot
-            hovermode='x unified' # Show unified hover information
-        )
-
-        # Update y-axis titles
-        fig.update_yaxes(title_text='Price', row=1, col=1)
-        fig.update_yaxes(title_text='Volume', row=2, col=1)
-
-        fig.show()
+        if renderer is not None:
+            renderer.submit_plotly(f'{self.ticker}_price', build_price_figure, self.ticker, df,
+                                   max_bars=max_bars, start=start, end=end)
+            log(f"Chart for {self.ticker} queued for rendering.")
+            return
+        build_price_figure(self.ticker, df, max_bars=max_bars, start=start, end=end).show()
 
     def show_financial_metrics(self):
         """
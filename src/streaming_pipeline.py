@@ -0,0 +1,356 @@
+import asyncio
+import csv
+import json
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from incremental_indicators import INDICATOR_COLUMNS, IncrementalIndicators
+from sentiment import SentimentScorer
+
+# Column layout of the per-ticker ring buffers
+HEADLINE_FIELDS = ['arrived', 'TextBlob_Sentiment', 'VADER_Sentiment']
+BAR_FIELDS = ['arrived', 'Close'] + INDICATOR_COLUMNS
+
+
+class RingBuffer:
+    """
+    Fixed-capacity table of float rows: once full, each append overwrites the oldest
+    row, so memory stays constant however long the stream runs.
+    """
+    def __init__(self, capacity, columns=1):
+        self.capacity = capacity
+        self._data = np.full((capacity, columns), np.nan)
+        self._next = 0 # Slot written by the next append
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, row):
+        self._data[self._next] = row
+        self._next = (self._next + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def values(self) -> np.ndarray:
+        """Stored rows, oldest first (a copy)."""
+        if self._count < self.capacity:
+            return self._data[:self._count].copy()
+        return np.roll(self._data, -self._next, axis=0)
+
+    def column_mean(self, column):
+        """Mean of one column over the stored rows (NaN when empty)."""
+        return float(self._data[:self._count, column].mean()) if self._count else math.nan
+
+    def last(self) -> np.ndarray:
+        """Most recent row (NaNs when empty)."""
+        return self._data[self._next - 1] if self._count else np.full(self._data.shape[1], np.nan)
+
+
+class LatencyTracker:
+    """
+    Keeps the last 'capacity' latencies (seconds) in a ring buffer and summarizes them.
+    """
+    def __init__(self, capacity=10_000):
+        self._samples = RingBuffer(capacity)
+        self.count = 0
+
+    def record(self, seconds):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def summary(self) -> dict:
+        """Event count and p50/p95/p99/max latency in milliseconds over the retained samples."""
+        samples = self._samples.values()[:, 0] * 1000
+        if not len(samples):
+            return {'count': 0, 'p50_ms': None, 'p95_ms': None, 'p99_ms': None, 'max_ms': None}
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+        return {'count': self.count, 'p50_ms': round(float(p50), 3), 'p95_ms': round(float(p95), 3),
+                'p99_ms': round(float(p99), 3), 'max_ms': round(float(samples.max()), 3)}
+
+
+class TickerState:
+    """
+    Rolling state of one ticker: the scores of its last 'headline_window' headlines, its
+    last 'bar_window' closes with their indicator values, and the IncrementalIndicators
+    engine (the same SMA/RSI/MACD definitions as StockAnalyzer.calculate_indicators).
+    """
+    def __init__(self, ticker, headline_window, bar_window, indicators=None):
+        self.ticker = ticker
+        self.headlines = RingBuffer(headline_window, len(HEADLINE_FIELDS))
+        self.bars = RingBuffer(bar_window, len(BAR_FIELDS))
+        self.indicators = indicators or IncrementalIndicators()
+        self.headline_count = 0
+
+    def add_headline(self, arrived, textblob, vader):
+        self.headlines.append((arrived, textblob, vader))
+        self.headline_count += 1
+
+    def add_bar(self, arrived, close):
+        values = self.indicators.update(close)
+        self.bars.append([arrived, close] + [values[column] for column in INDICATOR_COLUMNS])
+
+
+class StreamingSentimentPipeline:
+    """
+    Consumes a live headline feed and live price bars and keeps a per-ticker signal up
+    to date as events arrive.
+
+    Headlines and bars go through bounded asyncio queues: when scoring falls behind, the
+    producers' put_headline()/put_bar() calls wait (backpressure) instead of letting
+    the backlog grow. Headlines are scored in small batches with SentimentScorer
+    (TextBlob + VADER, deduplicated, with a bounded in-memory memo and an optional SQLite
+    cache) on a worker thread, so the event loop keeps accepting input. Per-ticker state
+    lives in fixed-size ring buffers (see TickerState), and every update recomputes the
+    ticker's signal: the mean VADER score over its recent headlines combined with the
+    latest RSI/MACD. The time from an event's arrival to its updated signal is tracked
+    per event type (latency_summary()).
+    """
+    def __init__(self, scorer=None, headline_window=50, bar_window=256, max_queue=1_000, batch_size=64,
+                 batch_delay=0.01, buy_threshold=0.05, sell_threshold=-0.05, latency_samples=10_000,
+                 score_cache=None, memo_size=10_000):
+        """
+        Without a 'scorer', one is created that keeps the scores of the last 'memo_size'
+        distinct headlines in memory (so memory stays bounded on an endless feed) and, with
+        'score_cache' (a SQLite path), looks older repeats up there.
+        'batch_size'/'batch_delay': a scoring batch is closed when it has that many
+        headlines or that many seconds after its first one arrived (latency vs. throughput).
+        'buy_threshold'/'sell_threshold' apply to the rolling mean VADER score.
+        """
+        self.scorer = scorer or SentimentScorer(score_cache, max_workers=1, verbose=False, memo_size=memo_size)
+        self.headline_window = headline_window
+        self.bar_window = bar_window
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.buy_threshold = buy_threshold
+        self.sell_threshold = sell_threshold
+        self.headline_queue = asyncio.Queue(maxsize=max_queue)
+        self.bar_queue = asyncio.Queue(maxsize=max_queue)
+        self.states = {}
+        self.latest = {} # Ticker -> latest signal dict
+        self.on_signal = [] # Callbacks receiving every updated signal dict
+        self.headline_latency = LatencyTracker(latency_samples)
+        self.bar_latency = LatencyTracker(latency_samples)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def state(self, ticker) -> TickerState:
+        if ticker not in self.states:
+            self.states[ticker] = TickerState(ticker, self.headline_window, self.bar_window)
+        return self.states[ticker]
+
+    def warm_up(self, ticker, closes):
+        """
+        Seeds a ticker's indicators with its close history (e.g. StockAnalyzer(...).data['Close']),
+        so they are valid from the first live bar.
+        """
+        self.state(ticker).indicators = IncrementalIndicators.from_history(np.asarray(closes, dtype=float))
+
+    # --- Input
+
+    async def put_headline(self, ticker, headline, arrived=None):
+        """Queues one headline; waits while the queue is full."""
+        await self.headline_queue.put((ticker, headline, arrived or time.perf_counter()))
+
+    async def put_bar(self, ticker, close, arrived=None):
+        """Queues one price bar (its close); waits while the queue is full."""
+        await self.bar_queue.put((ticker, float(close), arrived or time.perf_counter()))
+
+    # --- Processing
+
+    async def _next_batch(self):
+        """
+        Waits for a headline, then collects more until the batch is full or
+        'batch_delay' has passed. Returns (events, finished); None marks the end.
+        """
+        first = await self.headline_queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = asyncio.get_running_loop().time() + self.batch_delay
+        while len(batch) < self.batch_size:
+            try:
+                event = self.headline_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self.headline_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if event is None:
+                return batch, True
+            batch.append(event)
+        return batch, False
+
+    async def _headline_worker(self):
+        loop = asyncio.get_running_loop()
+        finished = False
+        while not finished:
+            batch, finished = await self._next_batch()
+            if not batch:
+                continue
+            scores = await loop.run_in_executor(self._executor, self.scorer.score, [event[1] for event in batch])
+            scores = scores.to_numpy()
+            for (ticker, _, arrived), (textblob, vader) in zip(batch, scores):
+                self.state(ticker).add_headline(arrived, textblob, vader)
+            for ticker in dict.fromkeys(event[0] for event in batch):
+                self._update_signal(ticker)
+            now = time.perf_counter()
+            for _, _, arrived in batch:
+                self.headline_latency.record(now - arrived)
+
+    async def _bar_worker(self):
+        while True:
+            event = await self.bar_queue.get()
+            if event is None:
+                return
+            ticker, close, arrived = event
+            self.state(ticker).add_bar(arrived, close)
+            self._update_signal(ticker)
+            self.bar_latency.record(time.perf_counter() - arrived)
+
+    def _update_signal(self, ticker):
+        """
+        Recomputes a ticker's signal from its ring buffers: +1 (buy) when the rolling
+        VADER mean is at or above buy_threshold and RSI is not overbought (> 70),
+        -1 (sell) when it is at or below sell_threshold and RSI is not oversold (< 30),
+        0 otherwise. Missing indicators (warm-up) do not block a signal. MACD above its
+        signal line is reported as 'trend' (+1/-1) for consumers that want confirmation.
+        """
+        state = self.states[ticker]
+        sentiment = state.headlines.column_mean(HEADLINE_FIELDS.index('VADER_Sentiment'))
+        bar = dict(zip(BAR_FIELDS, state.bars.last()))
+        rsi, macd, macd_signal = bar['RSI'], bar['MACD'], bar['MACD_signal']
+        signal = 0
+        if sentiment >= self.buy_threshold and not rsi > 70:
+            signal = 1
+        elif sentiment <= self.sell_threshold and not rsi < 30:
+            signal = -1
+        update = {
+            'ticker': ticker,
+            'updated': time.time(),
+            'signal': signal,
+            'trend': int(np.sign(macd - macd_signal)) if not (math.isnan(macd) or math.isnan(macd_signal)) else 0,
+            'VADER_mean': sentiment,
+            'TextBlob_mean': state.headlines.column_mean(HEADLINE_FIELDS.index('TextBlob_Sentiment')),
+            'headlines': state.headline_count,
+            'bars': state.indicators.count,
+            **{column: bar[column] for column in ['Close'] + INDICATOR_COLUMNS},
+        }
+        self.latest[ticker] = update
+        for callback in self.on_signal:
+            callback(update)
+
+    # --- Running
+
+    async def _feed(self, source, put):
+        """Forwards (ticker, value) pairs from an async iterable into a queue."""
+        async for ticker, value in source:
+            await put(ticker, value)
+
+    async def run(self, headlines=None, bars=None):
+        """
+        Processes the given sources until both are exhausted: async iterables of
+        (ticker, headline) and (ticker, close) pairs, e.g. tail_headlines()/tail_bars().
+        Events put directly with put_headline()/put_bar() while running are processed too.
+        Returns the latest signal per ticker.
+        """
+        workers = [asyncio.create_task(self._headline_worker()), asyncio.create_task(self._bar_worker())]
+        try:
+            feeds = [self._feed(source, put) for source, put in ((headlines, self.put_headline), (bars, self.put_bar))
+                     if source is not None]
+            await asyncio.gather(*feeds)
+            await self.headline_queue.put(None)
+            await self.bar_queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        return self.latest
+
+    async def serve(self, host='127.0.0.1', port=8765):
+        """
+        Socket stand-in for a live feed: accepts TCP connections whose lines are JSON
+        objects, {"type": "headline", "ticker": ..., "headline": ...} or
+        {"type": "bar", "ticker": ..., "close": ...}. A full queue stops reading from the
+        connection, so backpressure reaches the sender through TCP flow control.
+        Runs until cancelled.
+        """
+        async def handle(reader, writer):
+            while line := await reader.readline():
+                try:
+                    event = json.loads(line)
+                    if event.get('type') == 'bar':
+                        await self.put_bar(event['ticker'], event['close'])
+                    else:
+                        await self.put_headline(event['ticker'], event['headline'])
+                except (ValueError, KeyError, TypeError) as e:
+                    print(f"Skipping malformed event {line[:80]!r}: {e}")
+            writer.close()
+
+        workers = [asyncio.create_task(self._headline_worker()), asyncio.create_task(self._bar_worker())]
+        server = await asyncio.start_server(handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    def latency_summary(self) -> dict:
+        """Arrival-to-signal latency statistics per event type."""
+        return {'headline': self.headline_latency.summary(), 'bar': self.bar_latency.summary()}
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+async def _tail_rows(path, poll_interval=0.2, from_start=False, idle_timeout=None):
+    """
+    Yields the rows of a CSV file as dicts while it is being appended to ('tail -f').
+    The header is read first; with from_start=False, existing rows are skipped.
+    Stops after 'idle_timeout' seconds without new data (None: never).
+    """
+    while not os.path.exists(path):
+        await asyncio.sleep(poll_interval)
+    with open(path, newline='') as f:
+        header = next(csv.reader([f.readline()]))
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        pending, idle_since = '', time.monotonic()
+        while True:
+            line = f.readline()
+            if not line:
+                if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                    return
+                await asyncio.sleep(poll_interval)
+                continue
+            pending += line
+            if not pending.endswith('\n'):
+                continue # Partially written line: wait for the rest
+            row, pending, idle_since = next(csv.reader([pending])), '', time.monotonic()
+            if len(row) == len(header):
+                yield dict(zip(header, row))
+
+
+async def tail_headlines(path, headline_column='headline', ticker_column='stock', **options):
+    """
+    (ticker, headline) pairs from a news CSV being appended to (analyst ratings layout).
+    'options' are passed to the tailer (poll_interval, from_start, idle_timeout).
+    """
+    async for row in _tail_rows(path, **options):
+        yield row[ticker_column], row[headline_column]
+
+
+async def tail_bars(path, ticker_column='Ticker', close_column='Close', **options):
+    """
+    (ticker, close) pairs from a long-format bar CSV (Ticker, Date, ..., Close, ...)
+    being appended to. 'options' are passed to the tailer.
+    """
+    async for row in _tail_rows(path, **options):
+        try:
+            yield row[ticker_column], float(row[close_column])
+        except ValueError:
+            continue # Missing or malformed close
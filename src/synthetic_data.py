@@ -0,0 +1,135 @@
+import os
+import numpy as np
+import pandas as pd
+
+WORDS = ("stocks shares rise fall earnings beat miss guidance upgrade downgrade analyst price "
+         "target buy sell hold company reports quarterly revenue growth outlook market").split()
+
+# Timestamp styles of the 'date' column; 'offset' is exchange time with its UTC offset
+# (-04:00/-05:00, like part of the analyst ratings file), 'iso' is UTC with a 'Z' suffix.
+DATE_FORMATS = ('naive', 'offset', 'iso', 'date')
+NEWS_COLUMNS = ['headline', 'url', 'publisher', 'date', 'stock']
+PRICE_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume', 'Dividends', 'Stock Splits']
+
+
+def ticker_names(count):
+    """Synthetic ticker symbols: T000, T001, ..."""
+    return [f'T{i:03d}' for i in range(count)]
+
+
+def make_headlines(rows, seed=0):
+    """
+    Generates synthetic headlines with 1-30 words, some double spaces and a few NaNs.
+    """
+    rng = np.random.default_rng(seed)
+    vocab = np.array(WORDS + [w.capitalize() for w in WORDS] + ['', ' '], dtype=object)
+    lengths = rng.integers(1, 31, rows)
+    words = rng.choice(vocab, lengths.sum()).tolist()
+    ends = np.cumsum(lengths).tolist()
+    # Slicing a list of Python strings is far faster than joining np.split() pieces
+    headlines = [' '.join(words[start:end]) for start, end in zip([0] + ends[:-1], ends)]
+    series = pd.Series(headlines, name='headline')
+    series[rng.random(rows) < 0.001] = np.nan
+    return series
+
+
+def _format_dates(utc, styles, exchange_tz='America/New_York'):
+    """
+    Writes UTC datetime64[s] values as strings, row i in the style DATE_FORMATS[styles[i]].
+    Uses numpy's ISO formatting rather than strftime (much faster for millions of rows).
+    """
+    local = pd.DatetimeIndex(utc).tz_localize('UTC').tz_convert(exchange_tz).tz_localize(None)
+    local = local.to_numpy().astype('datetime64[s]')
+    text = pd.Series(np.datetime_as_string(local, unit='s')).str.replace('T', ' ', regex=False).to_numpy(dtype=object)
+
+    rows = styles == DATE_FORMATS.index('offset')
+    hours = (local[rows] - utc[rows]).astype('int64') // 3600 # -4 or -5 in New York
+    suffixes = {hour: f"{'-' if hour < 0 else '+'}{abs(hour):02d}:00" for hour in np.unique(hours)}
+    text[rows] = text[rows] + pd.Series(hours).map(suffixes).to_numpy(dtype=object)
+    rows = styles == DATE_FORMATS.index('iso')
+    text[rows] = np.datetime_as_string(utc[rows], unit='s').astype(object) + 'Z'
+    rows = styles == DATE_FORMATS.index('date')
+    text[rows] = np.datetime_as_string(local[rows], unit='D').astype(object)
+    return text
+
+
+def make_news(rows, tickers=10, publishers=200, date_formats=None, start='2011-01-03', end='2020-12-31',
+              seed=0, first_row=0):
+    """
+    Synthetic news frame shaped like the analyst ratings file: an unnamed row number,
+    'headline', 'url', 'publisher', 'date' and 'stock' columns.
+
+    'tickers' is a count (symbols from ticker_names()) or a list of symbols; articles are
+    spread uniformly over them and over [start, end). Publishers follow a Zipf-like
+    distribution (a few very active publishers, a long tail). 'date_formats' maps
+    DATE_FORMATS styles to their share of rows (default: 95% 'naive', 5% 'offset').
+    'first_row' offsets the row numbers and URLs, for files written in chunks.
+    """
+    rng = np.random.default_rng(seed)
+    symbols = ticker_names(tickers) if isinstance(tickers, int) else list(tickers)
+    date_formats = date_formats or {'naive': 0.95, 'offset': 0.05}
+
+    weights = 1.0 / np.arange(1, publishers + 1)
+    publisher_names = np.array([f'Publisher {i}' for i in range(publishers)])
+    start_s, end_s = (pd.Timestamp(value).value // 10**9 for value in (start, end))
+    utc = rng.integers(start_s, end_s, rows).astype('datetime64[s]')
+    shares = np.array([date_formats.get(style, 0.0) for style in DATE_FORMATS], dtype=float)
+    styles = rng.choice(len(DATE_FORMATS), rows, p=shares / shares.sum())
+
+    row_numbers = np.arange(first_row, first_row + rows)
+    df = pd.DataFrame({
+        'headline': make_headlines(rows, seed=seed).to_numpy(),
+        'url': 'https://news.example.com/' + pd.Series(row_numbers).astype(str),
+        'publisher': publisher_names[rng.choice(publishers, rows, p=weights / weights.sum())],
+        'date': _format_dates(utc, styles),
+        'stock': np.array(symbols)[rng.integers(0, len(symbols), rows)],
+    }, index=row_numbers)
+    return df
+
+
+def write_news_csv(path, rows, chunk_rows=1_000_000, seed=0, **options):
+    """
+    Writes a synthetic news CSV of 'rows' rows (see make_news for 'options'), generating
+    at most 'chunk_rows' rows at a time so memory stays bounded at any file size.
+    Returns the path.
+    """
+    for chunk, first_row in enumerate(range(0, rows, chunk_rows)):
+        size = min(chunk_rows, rows - first_row)
+        df = make_news(size, seed=seed + chunk, first_row=first_row, **options)
+        df.to_csv(path, mode='w' if chunk == 0 else 'a', header=chunk == 0, index=True)
+    if rows == 0:
+        pd.DataFrame(columns=NEWS_COLUMNS).to_csv(path, index=True)
+    return path
+
+
+def make_ohlcv(rows, start='2011-01-03', freq='B', seed=0):
+    """
+    Random-walk OHLCV frame (Date index) with 'rows' bars at the given pandas frequency
+    ('B' for daily bars, 'min' for intraday).
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, rows)))
+    open_ = close * np.exp(rng.normal(0, 0.004, rows))
+    spread = np.abs(rng.normal(0, 0.006, rows)) * close
+    return pd.DataFrame({'Open': open_, 'High': np.maximum(open_, close) + spread,
+                         'Low': np.minimum(open_, close) - spread, 'Close': close,
+                         'Volume': rng.integers(100_000, 10_000_000, rows)},
+                        index=pd.date_range(start, periods=rows, freq=freq, name='Date'))
+
+
+def write_ohlcv_csvs(directory, tickers=10, rows=2_520, start='2011-01-03', freq='B', seed=0):
+    """
+    Writes one yfinance-style CSV ('<TICKER>_historical_data.csv') per ticker into
+    'directory'. 'tickers' is a count or a list of symbols. Returns a ticker -> path dict.
+    """
+    os.makedirs(directory, exist_ok=True)
+    symbols = ticker_names(tickers) if isinstance(tickers, int) else list(tickers)
+    paths = {}
+    for i, ticker in enumerate(symbols):
+        df = make_ohlcv(rows, start=start, freq=freq, seed=seed + i)
+        df['Adj Close'] = df['Close']
+        df['Dividends'] = 0.0
+        df['Stock Splits'] = 0.0
+        paths[ticker] = os.path.join(directory, f'{ticker}_historical_data.csv')
+        df.reset_index()[PRICE_COLUMNS].to_csv(paths[ticker], index=False)
+    return paths
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError: # Falls back to pandas string methods
+    pa = None
+    pc = None
+
+# UTF-8 encodings of the non-ASCII characters for which str.isspace() is True
+# (U+0085, U+00A0, U+1680, U+2000-U+200A, U+2028/9, U+202F, U+205F, U+3000)
+_UNICODE_WHITESPACE = [chr(code).encode('utf-8') for code in range(0x80, 0x3001) if chr(code).isspace()]
+
+
+def _to_arrow_strings(values):
+    """
+    Converts a Series of headlines to a contiguous Arrow string array. Missing values
+    (NaN, and also None) become 'nan' as str(np.nan) would, other non-strings their str() form.
+    """
+    series = pd.Series(values)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    try:
+        arr = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed object columns (e.g. numbers among strings)
+        arr = pa.array(series.map(str, na_action='ignore'), from_pandas=True)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        arr = pc.cast(arr, pa.string())
+    return pc.fill_null(arr, 'nan')
+
+
+def _to_python_strings(series):
+    """
+    The pandas fallback of _to_arrow_strings: missing values become 'nan', other values their str().
+    """
+    series = series.astype(object)
+    return series.where(series.notna(), 'nan').map(str)
+
+
+def _utf8_buffers(arr):
+    """
+    Returns the row offsets (int64, rebased to 0) and the UTF-8 bytes of an Arrow string array
+    as zero-copy NumPy views.
+    """
+    offset_type = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    offsets = np.frombuffer(arr.buffers()[1], dtype=offset_type)[arr.offset:arr.offset + len(arr) + 1]
+    data_buffer = arr.buffers()[2]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.zeros(0, dtype=np.uint8)
+    offsets = offsets.astype(np.int64)
+    data = data[offsets[0]:offsets[-1]]
+    return offsets - offsets[0], data
+
+
+def _whitespace_mask(data):
+    """
+    Flags every byte that belongs to a whitespace character (ASCII or multi-byte Unicode).
+    """
+    # ASCII whitespace for str.split() is 9-13 and 28-32; two range checks on uint8
+    # (wrapping subtraction) are much cheaper than a lookup-table gather
+    mask = (data - np.uint8(9)) <= 4
+    mask |= (data - np.uint8(28)) <= 4
+    # Multi-byte whitespace only starts with 0xC2, 0xE1, 0xE2 or 0xE3, which are rare in
+    # headlines, so only those positions are inspected.
+    candidates = np.flatnonzero((data - np.uint8(0xC2)) <= 0x21)
+    if len(candidates):
+        padded = np.concatenate((data, np.zeros(2, dtype=np.uint8)))
+        sequences = np.stack([padded[candidates], padded[candidates + 1], padded[candidates + 2]], axis=1)
+        for encoded in _UNICODE_WHITESPACE:
+            width = len(encoded)
+            matches = candidates[(sequences[:, :width] == np.frombuffer(encoded, dtype=np.uint8)).all(axis=1)]
+            for k in range(width):
+                mask[matches + k] = True
+    return mask
+
+
+def _count_per_row(byte_mask, offsets):
+    """
+    Counts the set bytes of byte_mask falling in each row [offsets[i], offsets[i+1]).
+    """
+    positions = np.flatnonzero(byte_mask)
+    return np.diff(np.searchsorted(positions, offsets))
+
+
+def _word_start_mask(whitespace, offsets):
+    """
+    Flags the first byte of every word: a non-whitespace byte that starts a row
+    or follows a whitespace byte.
+    """
+    starts = np.empty(len(whitespace), dtype=bool)
+    if len(whitespace):
+        starts[0] = not whitespace[0]
+        np.less(whitespace[1:], whitespace[:-1], out=starts[1:])
+        row_starts = offsets[:-1][offsets[:-1] < len(whitespace)]
+        starts[row_starts] = ~whitespace[row_starts]
+    return starts
+
+
+def headline_word_counts(values):
+    """
+    Returns the number of whitespace-separated words per headline as an int64 Series,
+    the same numbers as values.apply(lambda x: len(str(x).split())) without per-row
+    Python calls.
+    """
+    series = pd.Series(values)
+    if pa is None:
+        counts = _to_python_strings(series).str.split().str.len()
+        return counts.astype('int64')
+    offsets, data = _utf8_buffers(_to_arrow_strings(series))
+    counts = _count_per_row(_word_start_mask(_whitespace_mask(data), offsets), offsets)
+    return pd.Series(counts, index=series.index, name=series.name, dtype='int64')
+
+
+def text_stats(values):
+    """
+    Computes per-headline text statistics in a single batched pass:
+    word_count, char_count and mean_word_length (characters per word, whitespace excluded).
+    """
+    series = pd.Series(values)
+    if pa is None:
+        strings = _to_python_strings(series)
+        words = strings.str.split()
+        word_count = words.str.len().to_numpy(dtype=np.int64)
+        char_count = strings.str.len().to_numpy(dtype=np.int64)
+        letters = words.map(lambda w: sum(map(len, w))).to_numpy(dtype=float)
+    else:
+        arr = _to_arrow_strings(series)
+        offsets, data = _utf8_buffers(arr)
+        whitespace = _whitespace_mask(data)
+        word_count = _count_per_row(_word_start_mask(whitespace, offsets), offsets)
+        char_count = pc.utf8_length(arr).to_numpy(zero_copy_only=False).astype(np.int64)
+        # A character starts at every byte that is not a UTF-8 continuation byte (10xxxxxx)
+        letters = _count_per_row(~whitespace & ((data & 0xC0) != 0x80), offsets).astype(float)
+    mean_word_length = np.divide(letters, word_count, out=np.zeros(len(series)), where=word_count > 0)
+    return pd.DataFrame({'word_count': word_count,
+                         'char_count': char_count,
+                         'mean_word_length': mean_word_length}, index=series.index)
+
+
+def token_summary(values):
+    """
+    Returns corpus-level token statistics as a dict: number of headlines, total tokens,
+    vocabulary size (case-insensitive), mean/max tokens per headline and mean token length.
+    Requires pyarrow.
+    """
+    if pa is None:
+        raise ImportError("token_summary() requires pyarrow.")
+    tokens = pc.list_flatten(pc.utf8_split_whitespace(pc.utf8_trim_whitespace(_to_arrow_strings(values))))
+    tokens = pc.filter(tokens, pc.greater(pc.utf8_length(tokens), 0)) # ''.split() yields no tokens
+    word_counts = headline_word_counts(values)
+    return {
+        'documents': len(word_counts),
+        'total_tokens': len(tokens),
+        'vocabulary_size': pc.count_distinct(pc.utf8_lower(tokens)).as_py(),
+        'mean_tokens': float(word_counts.mean()) if len(word_counts) else float('nan'),
+        'max_tokens': int(word_counts.max()) if len(word_counts) else 0,
+        'mean_token_length': pc.mean(pc.utf8_length(tokens)).as_py() if len(tokens) else float('nan'),
+    }
@@ -0,0 +1,355 @@
+import hashlib
+import io
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# Bump when the on-disk layout or the matching rules change, so old indexes are rebuilt.
+INDEX_FORMAT_VERSION = 1
+INDEX_DIR_NAME = '.ticker_index'
+KINDS = ('tagged', 'mentioned')
+TOKEN_PATTERN = r"[A-Za-z0-9&]+"
+TAIL_BYTES = 4096 # Bytes before the indexed end that must be unchanged for an incremental update
+
+
+def _empty_postings():
+    return [], np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+
+def _postings(keys, rows):
+    """
+    CSR postings of (key, row) pairs: (sorted unique keys, indptr, rows), where the rows
+    of keys[i] are rows[indptr[i]:indptr[i + 1]], ascending and without duplicates.
+    """
+    if not len(keys):
+        return _empty_postings()
+    pairs = pd.DataFrame({'key': keys, 'row': rows}).drop_duplicates().sort_values(['key', 'row'], kind='stable')
+    unique, counts = np.unique(pairs['key'].to_numpy(dtype=object), return_counts=True)
+    return list(unique), np.concatenate([[0], np.cumsum(counts)]).astype(np.int64), pairs['row'].to_numpy(np.int64)
+
+
+def _merge_postings(old, new):
+    """
+    Merges two CSR postings whose rows do not overlap (all rows of 'new' come after those
+    of 'old'): one stable sort of the combined key codes, so rows stay ascending per key.
+    """
+    old_keys, old_indptr, old_rows = old
+    new_keys, new_indptr, new_rows = new
+    keys = sorted(set(old_keys) | set(new_keys))
+    position = {key: i for i, key in enumerate(keys)}
+    codes = np.concatenate([
+        np.repeat(np.array([position[key] for key in old_keys], dtype=np.int64), np.diff(old_indptr)),
+        np.repeat(np.array([position[key] for key in new_keys], dtype=np.int64), np.diff(new_indptr))])
+    order = np.argsort(codes, kind='stable')
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(keys)))]).astype(np.int64)
+    return keys, indptr, np.concatenate([old_rows, new_rows])[order]
+
+
+def _last_record_end(data: bytes) -> int:
+    """
+    Position of the last newline in 'data' that ends a CSV record, or -1. 'data' must start
+    at a record boundary. A newline ends a record only outside quotes, i.e. after an even
+    number of '"' characters (an escaped quote, '""', adds two), so a quoted headline
+    spanning several lines is never split.
+    """
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buffer == ord('\n'))
+    if not len(newlines):
+        return -1
+    quotes_before = np.searchsorted(np.flatnonzero(buffer == ord('"')), newlines)
+    ends = newlines[quotes_before % 2 == 0]
+    return int(ends[-1]) if len(ends) else -1
+
+
+def _tail_hash(path, end):
+    """Digest of the TAIL_BYTES bytes before offset 'end' of a file."""
+    with open(path, 'rb') as f:
+        f.seek(max(0, end - TAIL_BYTES))
+        return hashlib.blake2b(f.read(min(end, TAIL_BYTES)), digest_size=16).hexdigest()
+
+
+class TickerIndex:
+    """
+    Inverted index from ticker to the row offsets of a news CSV (positions in the frame
+    read by pd.read_csv, i.e. NewsAnalyzer.df), persisted next to the data.
+
+    Two posting lists are kept per ticker: 'tagged' rows, whose ticker column holds it,
+    and 'mentioned' rows, whose headline names it without being tagged with it — its
+    symbol as an upper-case word (e.g. 'AAPL') or one of its 'aliases' (company names,
+    case-insensitive, whole words, e.g. {'AAPL': ['Apple'], 'GS': ['Goldman Sachs']}).
+    Postings are stored as CSR arrays (one sorted row array plus offsets per ticker) in
+    .npy files that are memory-mapped on load, so rows() returns a ticker's k rows in
+    O(k) without touching the rest of the data.
+
+    update() only reads the bytes appended since the last update (checked against the
+    size and a digest of the last indexed bytes; anything else triggers a rebuild), so
+    indexing new rows costs time proportional to the new rows. The file is read in blocks
+    cut at record boundaries, so quoted fields may contain newlines (standard '""'
+    quoting, as written by pandas). A last record without a trailing newline is indexed
+    when it is complete (no open quote) and re-read by the next update if the file grew,
+    in case the writer was still appending to it; an unfinished quoted record is left for
+    the next update. Symbols are matched against the tickers known when a row
+    is indexed, so a ticker first tagged in appended rows is not looked up in older
+    headlines until rebuild().
+    """
+    def __init__(self, filepath, index_dir=None, aliases=None, match_symbols=True, min_symbol_length=2,
+                 ticker_column='stock', headline_column='headline', block_bytes=64 << 20):
+        """
+        'index_dir' defaults to a '.ticker_index' folder next to the CSV. 'aliases' maps
+        tickers to lists of names matched in headlines. Symbols shorter than
+        'min_symbol_length' are not matched in headlines. The CSV is read in blocks of
+        about 'block_bytes' bytes.
+        """
+        self.filepath = filepath
+        self.aliases = {ticker: sorted(set(names)) for ticker, names in (aliases or {}).items()}
+        self.match_symbols = match_symbols
+        self.min_symbol_length = min_symbol_length
+        self.ticker_column = ticker_column
+        self.headline_column = headline_column
+        self.block_bytes = block_bytes
+        source_path = os.path.abspath(filepath)
+        path_id = hashlib.blake2b(source_path.encode('utf-8'), digest_size=8).hexdigest()
+        self.directory = os.path.join(index_dir or os.path.join(os.path.dirname(source_path), INDEX_DIR_NAME),
+                                      f"{os.path.basename(source_path)}.{path_id}")
+        self.options = {'version': INDEX_FORMAT_VERSION, 'aliases': self.aliases, 'match_symbols': match_symbols,
+                        'min_symbol_length': min_symbol_length, 'ticker_column': ticker_column,
+                        'headline_column': headline_column}
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        # 'open_bytes' > 0: the last indexed row is an unterminated record of that many bytes after 'byte_offset'
+        self.meta = {'options': self.options, 'rows': 0, 'byte_offset': 0, 'open_bytes': 0, 'tail_hash': None,
+                     'columns': None}
+        self.postings = {kind: _empty_postings() for kind in KINDS}
+        self._positions = {kind: {} for kind in KINDS}
+
+    def _load(self):
+        """Maps a persisted index built with the same options (keeps the empty state otherwise)."""
+        try:
+            with open(os.path.join(self.directory, 'meta.json')) as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return
+        if meta.get('options') != self.options:
+            return
+        self.meta = meta
+        for kind in KINDS:
+            indptr = np.load(self._array_path(kind, 'indptr', meta['generation']), mmap_mode='r')
+            rows = np.load(self._array_path(kind, 'rows', meta['generation']), mmap_mode='r')
+            self.postings[kind] = (meta['keys'][kind], indptr, rows)
+        self._index_positions()
+
+    def _index_positions(self):
+        self._positions = {kind: {key: i for i, key in enumerate(self.postings[kind][0])} for kind in KINDS}
+
+    def _array_path(self, kind, name, generation):
+        return os.path.join(self.directory, f'{kind}_{name}.{generation}.npy')
+
+    def _save(self):
+        """
+        Writes the postings as a new generation of files, then switches meta.json to it
+        (atomically), so a crash mid-save keeps the previous index.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        existing = [int(name.split('.')[-2]) for name in os.listdir(self.directory) if name.endswith('.npy')]
+        generation = max(existing, default=-1) + 1
+        for kind in KINDS:
+            _, indptr, rows = self.postings[kind]
+            np.save(self._array_path(kind, 'indptr', generation), np.asarray(indptr))
+            np.save(self._array_path(kind, 'rows', generation), np.asarray(rows))
+        self.meta['generation'] = generation
+        self.meta['keys'] = {kind: self.postings[kind][0] for kind in KINDS}
+        tmp_path = os.path.join(self.directory, 'meta.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self.meta, f)
+        os.replace(tmp_path, os.path.join(self.directory, 'meta.json'))
+        # Re-map the files just written and drop the older generations (files another
+        # reader still maps cannot be deleted on Windows; they go on a later save)
+        self._load()
+        for name in os.listdir(self.directory):
+            if name.endswith('.npy') and not name.endswith(f'.{generation}.npy'):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def __len__(self):
+        """Number of indexed rows."""
+        return self.meta['rows']
+
+    def tickers(self) -> list:
+        """Tickers with at least one tagged or mentioned row, sorted."""
+        return sorted(set(self.postings['tagged'][0]) | set(self.postings['mentioned'][0]))
+
+    def _rows(self, kind, ticker):
+        position = self._positions[kind].get(ticker)
+        if position is None:
+            return np.zeros(0, dtype=np.int64)
+        _, indptr, rows = self.postings[kind]
+        return rows[indptr[position]:indptr[position + 1]]
+
+    def rows(self, tickers, mentions=True) -> np.ndarray:
+        """
+        Ascending row offsets of the news about one ticker or a list of tickers: the rows
+        tagged with them, plus (with mentions=True) the rows whose headline mentions them.
+        """
+        tickers = [tickers] if isinstance(tickers, str) else list(tickers)
+        parts = [self._rows(kind, ticker) for ticker in tickers for kind in (KINDS if mentions else KINDS[:1])]
+        if len(parts) == 1:
+            return np.array(parts[0])
+        return np.unique(np.concatenate(parts)) if parts else np.zeros(0, dtype=np.int64)
+
+    def counts(self) -> pd.DataFrame:
+        """Tagged and mentioned row counts per ticker, most tagged first."""
+        counts = pd.DataFrame({kind: pd.Series(np.diff(self.postings[kind][1]), index=self.postings[kind][0],
+                                               dtype='int64') for kind in KINDS}).fillna(0).astype('int64')
+        return counts.rename_axis('ticker').sort_values(['tagged', 'mentioned'], ascending=False)
+
+    def _is_current(self, size):
+        """True when the file still starts with the bytes that were indexed."""
+        offset = self.meta['byte_offset']
+        return offset > 0 and size >= offset and self.meta['tail_hash'] == _tail_hash(self.filepath, offset)
+
+    def _drop_open_record(self):
+        """Removes the unterminated last row from the postings so it can be read again."""
+        last = self.meta['rows'] - 1
+        for kind in KINDS:
+            keys, indptr, rows = self.postings[kind]
+            expanded = np.repeat(np.array(keys, dtype=object), np.diff(indptr))
+            keep = np.asarray(rows) < last
+            self.postings[kind] = _postings(expanded[keep], np.asarray(rows)[keep])
+        self.meta['rows'] = last
+        self.meta['open_bytes'] = 0
+
+    def _parse(self, data, columns):
+        return pd.read_csv(io.BytesIO(data), header=None, names=columns,
+                           usecols=[self.ticker_column, self.headline_column],
+                           dtype={self.ticker_column: str, self.headline_column: str})
+
+    def _mentions(self, headlines: pd.Series, first_row, known):
+        """
+        (ticker, row) pairs of the headlines naming a ticker: upper-case tokens equal to a
+        known symbol, and case-insensitive word n-grams equal to an alias.
+        """
+        headlines = headlines.fillna('').astype(str)
+        # Only tokenize headlines that can match: two upper-case letters in a row for a
+        # symbol, or an alias anywhere (one vectorized regex search each)
+        candidates = np.zeros(len(headlines), dtype=bool)
+        if self.match_symbols:
+            candidates |= headlines.str.contains(r'[A-Z]{%d}' % max(self.min_symbol_length, 1)).to_numpy(bool)
+        alias_map = {' '.join(words): ticker for ticker, names in self.aliases.items() for name in names
+                     if (words := re.findall(TOKEN_PATTERN, name.lower()))}
+        if alias_map:
+            pattern = r'(?i)(?<![A-Za-z0-9&])(?:%s)(?![A-Za-z0-9&])' % '|'.join(
+                r'[^A-Za-z0-9&]+'.join(map(re.escape, name.split())) for name in sorted(alias_map, key=len, reverse=True))
+            candidates |= headlines.str.contains(pattern).to_numpy(bool)
+        tokens = headlines[candidates].str.findall(TOKEN_PATTERN).explode().dropna()
+        if tokens.empty:
+            return np.zeros(0, dtype=object), np.zeros(0, dtype=np.int64)
+        words = tokens.to_numpy(dtype=object)
+        rows = tokens.index.to_numpy(np.int64) + first_row
+        keys, found = [], []
+
+        if self.match_symbols:
+            symbols = {ticker for ticker in known if len(ticker) >= self.min_symbol_length}
+            hit = pd.Series(words).isin(symbols).to_numpy()
+            keys.append(words[hit])
+            found.append(rows[hit])
+
+        if alias_map:
+            lower = np.array([word.lower() for word in words], dtype=object)
+            longest = max(len(name.split()) for name in alias_map)
+            grams = lower
+            for n in range(1, longest + 1):
+                if n > 1:
+                    # n-grams within one headline: extend each (n-1)-gram by the next word
+                    grams = grams[:-1] + ' ' + lower[n - 1:]
+                same_row = rows[:len(grams)] == rows[n - 1:]
+                tickers = pd.Series(grams).map(alias_map).to_numpy(dtype=object)
+                hit = same_row & pd.notna(tickers)
+                keys.append(tickers[hit])
+                found.append(rows[:len(grams)][hit])
+        if not keys:
+            return np.zeros(0, dtype=object), np.zeros(0, dtype=np.int64)
+        return np.concatenate(keys), np.concatenate(found)
+
+    def _index_block(self, block: pd.DataFrame, first_row, known):
+        """Postings (per kind) of one parsed block whose first row has offset 'first_row'."""
+        tagged = block[self.ticker_column]
+        valid = tagged.notna().to_numpy()
+        tagged_keys = tagged.to_numpy(dtype=object)[valid].astype(str)
+        tagged_rows = np.arange(first_row, first_row + len(block), dtype=np.int64)[valid]
+        known.update(tagged_keys)
+
+        mention_keys, mention_rows = self._mentions(block[self.headline_column].reset_index(drop=True), first_row, known)
+        # Drop mentions of the ticker a row is already tagged with
+        if len(mention_keys):
+            own = tagged.to_numpy(dtype=object)[mention_rows - first_row]
+            keep = mention_keys != own
+            mention_keys, mention_rows = mention_keys[keep], mention_rows[keep]
+        return {'tagged': _postings(tagged_keys, tagged_rows), 'mentioned': _postings(mention_keys, mention_rows)}
+
+    def update(self) -> int:
+        """
+        Indexes the rows appended to the CSV since the last update (all rows the first
+        time, or when the indexed part of the file changed) and persists the index.
+        Returns the number of rows indexed.
+        """
+        size = os.path.getsize(self.filepath)
+        if not self._is_current(size):
+            self._reset()
+        elif size == self.meta['byte_offset'] + self.meta.get('open_bytes', 0):
+            return 0
+        elif self.meta.get('open_bytes'):
+            self._drop_open_record()
+
+        with open(self.filepath, 'rb') as f:
+            if self.meta['columns'] is None:
+                header = f.readline()
+                self.meta['columns'] = list(pd.read_csv(io.BytesIO(header), nrows=0).columns)
+                self.meta['byte_offset'] = f.tell()
+            columns = self.meta['columns']
+            missing = {self.ticker_column, self.headline_column} - set(columns)
+            if missing:
+                raise ValueError(f"Columns {sorted(missing)} not found in '{self.filepath}'")
+
+            f.seek(self.meta['byte_offset'])
+            known = set(self.postings['tagged'][0]) | set(self.aliases)
+            added, pending = 0, b''
+            while True:
+                data = f.read(self.block_bytes)
+                if not data:
+                    break
+                data = pending + data
+                cut = _last_record_end(data)
+                block, pending = data[:cut + 1], data[cut + 1:]
+                if not block:
+                    continue
+                parsed = self._parse(block, columns)
+                new = self._index_block(parsed, self.meta['rows'] + added, known)
+                self.postings = {kind: _merge_postings(self.postings[kind], new[kind]) for kind in KINDS}
+                added += len(parsed)
+                self.meta['byte_offset'] += len(block)
+
+            # A last record without a trailing newline: indexed when it is complete (an even
+            # number of quotes), with its length kept so a later append re-reads it
+            if pending.strip() and pending.count(b'"') % 2 == 0:
+                parsed = self._parse(pending, columns)
+                if len(parsed) == 1:
+                    new = self._index_block(parsed, self.meta['rows'] + added, known)
+                    self.postings = {kind: _merge_postings(self.postings[kind], new[kind]) for kind in KINDS}
+                    added += 1
+                    self.meta['open_bytes'] = len(pending)
+
+        self.meta['rows'] += added
+        self.meta['tail_hash'] = _tail_hash(self.filepath, self.meta['byte_offset'])
+        self._save()
+        return added
+
+    def rebuild(self) -> int:
+        """Re-indexes the whole file. Returns the number of rows indexed."""
+        self._reset()
+        return self.update()
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The analysis modules live flat in src/ (as the scripts and notebooks import them)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import METRIC_COLUMNS, SentimentBacktester
+from synthetic_data import make_ohlcv
+
+talib = pytest.importorskip('talib') # StockAnalyzer.calculate_indicators for the reference indicators
+
+
+def _inputs(tickers=4, seed=1):
+    from stock_analyzer import StockAnalyzer
+
+    rng = np.random.default_rng(seed)
+    results, indicators = {}, {}
+    for i in range(tickers):
+        df = make_ohlcv(300 - 30 * i, seed=i).iloc[5 * i:] # Staggered starts and ends
+        df['Daily_Return'] = df['Close'].pct_change() * 100
+        vader = rng.normal(0, 0.2, len(df))
+        vader[rng.random(len(df)) < 0.3] = 0
+        df['VADER_Sentiment'], df['TextBlob_Sentiment'] = vader, 0.5 * vader
+        indicators[f'T{i}'] = StockAnalyzer(f'T{i}', '', data=df[['Open', 'High', 'Low', 'Close', 'Volume']]) \
+            .calculate_indicators()
+        results[f'T{i}'] = df.dropna(subset=['Daily_Return'])
+        results[f'T{i}'].attrs['sentiment_alignment'] = 'session'
+    return results, indicators
+
+
+def _reference(df, indicators, column, threshold, lag, gate, long_only, cost):
+    """
+    Day-by-day loop: the position held on day d is decided at the close of day d - 1 from
+    the score of day d - 1 - lag and that close's RSI/MACD.
+    """
+    returns = df['Daily_Return'].to_numpy() / 100
+    score = df[column].to_numpy()
+    rsi, macd, macd_signal = (indicators[name].reindex(df.index).to_numpy() for name in ('RSI', 'MACD', 'MACD_signal'))
+    previous, equity, peak, drawdown, turnover, trades, exposure, pnls = 0, 1.0, 1.0, 0.0, 0.0, 0, 0, []
+    for d in range(len(df)):
+        position, t, source = 0, d - 1, d - 1 - lag
+        if t >= 0 and source >= 0:
+            long_ok = short_ok = True
+            if gate in ('rsi', 'rsi_macd'):
+                long_ok, short_ok = long_ok and rsi[t] < 70, short_ok and rsi[t] > 30
+            if gate in ('macd', 'rsi_macd'):
+                long_ok, short_ok = long_ok and macd[t] > macd_signal[t], short_ok and macd[t] < macd_signal[t]
+            if score[source] > threshold and long_ok:
+                position = 1
+            elif score[source] < -threshold and short_ok and not long_only:
+                position = -1
+        change = abs(position - previous)
+        pnl = position * returns[d] - cost * change
+        turnover, trades, exposure = turnover + change, trades + (position != 0 and change > 0), exposure + (position != 0)
+        equity *= 1 + pnl
+        peak = max(peak, equity)
+        drawdown = min(drawdown, equity / peak - 1)
+        pnls.append(pnl)
+        previous = position
+    pnls, days = np.array(pnls), len(pnls)
+    with np.errstate(invalid='ignore', divide='ignore'): # Never in the market: NaN Sharpe, as in the backtester
+        sharpe = pnls.mean() / pnls.std(ddof=1) * np.sqrt(252)
+    return {'days': days, 'total_return': equity - 1, 'sharpe': sharpe,
+            'max_drawdown': drawdown, 'turnover': turnover / days, 'exposure': exposure / days, 'trades': trades}
+
+
+@pytest.mark.parametrize('long_only,cost_bps', [(False, 10), (True, 0)])
+def test_grid_matches_a_per_day_loop(long_only, cost_bps):
+    results, indicators = _inputs()
+    backtester = SentimentBacktester.from_results(results, indicators=indicators)
+    grid = backtester.grid(thresholds=[0.0, 0.05, 0.2], lags=[0, 2], long_only=long_only, cost_bps=cost_bps)
+    assert len(grid) == 2 * 3 * 2 * 4 * 4
+    for row in grid.itertuples():
+        expected = _reference(results[row.ticker], indicators[row.ticker], row.column, row.threshold, row.lag,
+                              row.gate, long_only, cost_bps / 10_000)
+        for name, value in expected.items():
+            assert getattr(row, name) == pytest.approx(value, rel=1e-9, abs=1e-12, nan_ok=True), (row, name)
+
+
+def test_pool_and_run_agree_with_the_serial_grid():
+    results, indicators = _inputs()
+    backtester = SentimentBacktester.from_results(results, indicators=indicators)
+    keys = ['column', 'lag', 'threshold', 'gate', 'ticker']
+    serial = backtester.grid(thresholds=[0.05, 0.1], lags=[0, 1], cost_bps=5)
+    pooled = backtester.grid(thresholds=[0.05, 0.1], lags=[0, 1], cost_bps=5, max_workers=2)
+    pd.testing.assert_frame_equal(serial.sort_values(keys, ignore_index=True), pooled.sort_values(keys, ignore_index=True))
+
+    single = backtester.run('TextBlob_Sentiment', threshold=0.05, lag=1, gate='macd', cost_bps=5)
+    rows = serial.query("column == 'TextBlob_Sentiment' and lag == 1 and threshold == 0.05 and gate == 'macd'") \
+        .set_index('ticker')[METRIC_COLUMNS]
+    pd.testing.assert_frame_equal(single['metrics'], rows.loc[single['metrics'].index], check_dtype=False)
+    final_equity = single['equity'].iloc[-1].to_numpy()
+    np.testing.assert_allclose(final_equity - 1, rows.loc[backtester.tickers, 'total_return'], rtol=1e-9)
+
+
+def test_rejects_negative_lags_and_unknown_gates():
+    results, indicators = _inputs(tickers=1)
+    backtester = SentimentBacktester.from_results(results, indicators=indicators)
+    with pytest.raises(ValueError, match='Lags'):
+        backtester.grid(lags=[0, -1])
+    with pytest.raises(ValueError, match='Lags'):
+        backtester.run(lag=-1)
+    with pytest.raises(ValueError):
+        backtester.grid(gates=['rsi', 'bollinger'])
+
+
+def test_requires_session_aligned_sentiment(capsys):
+    results, indicators = _inputs(tickers=2)
+    results['T1'].attrs['sentiment_alignment'] = 'calendar'
+    with pytest.raises(ValueError, match='session'):
+        SentimentBacktester.from_results(results, indicators=indicators)
+
+    del results['T1'].attrs['sentiment_alignment'] # Unknown alignment: accepted with a warning
+    SentimentBacktester.from_results(results, indicators=indicators)
+    assert 'Warning' in capsys.readouterr().out
@@ -0,0 +1,84 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bar_store import BAR_COLUMNS, BarStore
+from synthetic_data import make_ohlcv
+
+
+def _bars(rows, start='2020-01-01', seed=0):
+    df = make_ohlcv(rows, seed=seed)
+    df.index = pd.bdate_range(start, periods=rows, name='Date').as_unit('ns')
+    df['Volume'] = df['Volume'].astype('int64')
+    return df[BAR_COLUMNS]
+
+
+def _loaded(frame):
+    """Copies a to_frame() result (columns backed by np.memmap) into plain arrays."""
+    return pd.DataFrame({column: np.array(frame[column].to_numpy()) for column in frame.columns}, index=frame.index)
+
+
+def _column_files(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith('.npy'))
+
+
+def test_write_open_and_slice(tmp_path):
+    store = BarStore(str(tmp_path))
+    bars = _bars(300)
+    store.write('AAPL', bars)
+    assert store.tickers() == ['AAPL'] and 'AAPL' in store and 'MSFT' not in store
+    opened = store.open('AAPL')
+    pd.testing.assert_frame_equal(_loaded(opened.to_frame()), bars, check_freq=False)
+    window = opened.to_frame('2020-03-02', '2020-03-31')
+    pd.testing.assert_frame_equal(_loaded(window), bars.loc['2020-03-02':'2020-03-31'], check_freq=False)
+    with pytest.raises(FileNotFoundError):
+        store.open('MSFT')
+
+
+def test_append_grows_into_a_new_generation(tmp_path):
+    store = BarStore(str(tmp_path))
+    bars = _bars(600)
+    ticker = store.write('AAPL', bars.iloc[:100]) # Capacity 356
+    reader_frame = store.open('AAPL').to_frame()  # Keeps the first generation mapped
+    first_files = _column_files(ticker.directory)
+
+    assert ticker.append(bars.iloc[50:300]) == 200 # Overlapping bars are skipped; fits in place
+    assert _column_files(ticker.directory) == first_files
+    assert ticker.append(bars.iloc[300:]) == 300   # Exceeds the capacity: new generation
+    assert ticker.capacity >= 600
+    assert set(_column_files(ticker.directory)).isdisjoint(first_files)
+    assert ticker.append(bars) == 0
+
+    pd.testing.assert_frame_equal(_loaded(BarStore(str(tmp_path)).open('AAPL').to_frame()), bars, check_freq=False)
+    pd.testing.assert_frame_equal(_loaded(reader_frame), bars.iloc[:100], check_freq=False)
+
+
+def test_rewrite_keeps_open_readers_valid(tmp_path):
+    store = BarStore(str(tmp_path))
+    store.write('AAPL', _bars(50, seed=1))
+    reader = store.open('AAPL')
+    before = _loaded(reader.to_frame())
+    replacement = _bars(80, start='2021-01-01', seed=2)
+    store.write('AAPL', replacement)
+    pd.testing.assert_frame_equal(_loaded(reader.to_frame()), before)
+    pd.testing.assert_frame_equal(_loaded(store.open('AAPL').to_frame()), replacement, check_freq=False)
+    assert len(_column_files(reader.directory)) == len(BAR_COLUMNS) + 1 # Old generation removed
+
+
+def test_append_rejects_values_that_do_not_fit(tmp_path):
+    ticker = BarStore(str(tmp_path)).write('AAPL', _bars(20))
+    new = _bars(25).iloc[20:].astype({'Volume': float})
+    new.iloc[2, new.columns.get_loc('Volume')] = np.nan
+    with pytest.raises(ValueError, match='Volume'):
+        ticker.append(new)
+    new.iloc[2, new.columns.get_loc('Volume')] = 1.5
+    with pytest.raises(ValueError, match='Volume'):
+        ticker.append(new)
+    assert len(ticker) == 20 # Nothing was written
+
+    new.iloc[2, new.columns.get_loc('Volume')] = 1_000.0 # Whole floats are converted
+    assert ticker.append(new) == 5
+    assert ticker.column('Volume').dtype == np.int64 and ticker.column('Volume')[22] == 1_000
+
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('talib')
+pytest.importorskip('pyarrow')
+
+from batch_runner import analyze_ticker, run_batch
+
+
+def _write_prices(path, days=80, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, days)))
+    pd.DataFrame({'Date': pd.bdate_range('2020-01-01', periods=days).strftime('%Y-%m-%d'), 'Open': close,
+                  'High': close + 1, 'Low': close - 1, 'Close': close, 'Volume': 1000}).to_csv(path, index=False)
+
+
+def _stale_partition(output_dir, ticker):
+    partition = output_dir / f'Ticker={ticker}'
+    partition.mkdir(parents=True)
+    pd.DataFrame({'Date': pd.to_datetime(['2019-01-02']), 'Close': [1.0]}).to_parquet(partition / 'part-0.parquet')
+    return partition
+
+
+def test_failed_ticker_leaves_no_stale_partition(tmp_path):
+    good = tmp_path / 'GOOD_historical_data.csv'
+    _write_prices(good)
+    output_dir = tmp_path / 'dataset'
+    _stale_partition(output_dir, 'GOOD')
+    stale = _stale_partition(output_dir, 'BAD')
+
+    manifest = {'GOOD': str(good), 'BAD': str(tmp_path / 'missing.csv')}
+    results, timings = run_batch(manifest, max_workers=2, output_dir=str(output_dir))
+    status = timings.set_index('ticker')['status']
+    assert status['GOOD'] == 'ok' and status['BAD'] == 'error'
+    assert not stale.exists()
+
+    dataset = pd.read_parquet(results)
+    assert dataset['Ticker'].astype(str).unique().tolist() == ['GOOD']
+    assert len(dataset) == 80 and dataset['Date'].min() == pd.Timestamp('2020-01-01')
+
+
+def test_collected_results_match_a_direct_run(tmp_path):
+    paths = {}
+    for seed, ticker in enumerate(['AAA', 'BBB']):
+        paths[ticker] = str(tmp_path / f'{ticker}_historical_data.csv')
+        _write_prices(paths[ticker], seed=seed)
+    results, timings = run_batch(paths, max_workers=2)
+    assert (timings['status'] == 'ok').all() and timings['rows'].sum() == 160
+
+    record, direct = analyze_ticker('BBB', paths['BBB'])
+    pd.testing.assert_frame_equal(results.xs('BBB'), direct.drop(columns='Ticker').set_index('Date'))
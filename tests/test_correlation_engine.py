@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from correlation_engine import CorrelationEngine
+
+
+def _panels(days=300, tickers=4, missing=0.2, seed=0):
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2020-01-01', periods=days, name='Date')
+    columns = [f'T{i}' for i in range(tickers)]
+    sentiment = rng.normal(0, 0.3, (days, tickers))
+    returns = rng.normal(0, 1.5, (days, tickers))
+    returns[1:] += 0.5 * sentiment[:-1]
+    sentiment[rng.random((days, tickers)) < missing] = np.nan
+    returns[rng.random((days, tickers)) < 0.05] = np.nan
+    sentiment[:, -1] = np.nan # A ticker without news
+    return pd.DataFrame(sentiment, index, columns), pd.DataFrame(returns, index, columns)
+
+
+def test_lag_sweep_matches_shift_corr():
+    sentiment, returns = _panels()
+    lags = range(-10, 11)
+    sweep = CorrelationEngine(sentiment, returns).lag_sweep(lags)
+    expected = pd.DataFrame({ticker: [sentiment[ticker].shift(k).corr(returns[ticker]) for k in lags]
+                             for ticker in sentiment.columns}, index=pd.Index(list(lags), name='Lag'))
+    pd.testing.assert_frame_equal(sweep, expected, check_exact=False, rtol=1e-10, atol=1e-12)
+    assert sweep['T3'].isna().all()
+
+
+def test_lag_sweep_counts_rows_of_the_shared_panel():
+    # T1 has no rows on 30 dates that T0 trades: lag 1 means one row of the union-of-dates
+    # panel, i.e. shift(1) after reindexing, not shift(1) over T1's own calendar
+    sentiment, returns = _panels(tickers=3, missing=0.0)
+    own_dates = sentiment.index.delete(range(100, 130))
+    engine = CorrelationEngine(pd.concat([sentiment['T0'], sentiment['T1'].loc[own_dates]], axis=1),
+                               pd.concat([returns['T0'], returns['T1'].loc[own_dates]], axis=1))
+    on_panel = sentiment['T1'].where(sentiment.index.isin(own_dates))
+    panel_shift = on_panel.shift(1).corr(returns['T1'].where(sentiment.index.isin(own_dates)))
+    own_shift = sentiment['T1'].loc[own_dates].shift(1).corr(returns['T1'].loc[own_dates])
+    result = engine.lag_sweep([1]).loc[1, 'T1']
+    assert result == pytest.approx(panel_shift, rel=1e-10)
+    assert result != pytest.approx(own_shift, rel=1e-10)
+
+
+def test_lag_sweep_empty_lag_beyond_history():
+    sentiment, returns = _panels(days=20)
+    sweep = CorrelationEngine(sentiment, returns).lag_sweep([0, 25, -25])
+    assert sweep.loc[[25, -25]].isna().all().all()
+    assert sweep.loc[0, 'T0'] == pytest.approx(sentiment['T0'].corr(returns['T0']))
+
+
+@pytest.mark.parametrize('window,lag,min_periods', [(20, 0, None), (30, 1, 10), (15, -2, 5)])
+def test_rolling_matches_windowed_reference(window, lag, min_periods):
+    sentiment, returns = _panels(days=150)
+    result = CorrelationEngine(sentiment, returns).rolling(window=window, lag=lag, min_periods=min_periods)
+    needed = window if min_periods is None else min_periods
+    expected = pd.DataFrame(np.nan, index=sentiment.index, columns=sentiment.columns)
+    for ticker in sentiment.columns:
+        x, y = sentiment[ticker].shift(lag).to_numpy(), returns[ticker].to_numpy()
+        for t in range(len(x)):
+            xs, ys = x[max(t - window + 1, 0):t + 1], y[max(t - window + 1, 0):t + 1]
+            paired = ~(np.isnan(xs) | np.isnan(ys))
+            if paired.sum() >= max(needed, 2) and xs[paired].std() > 0 and ys[paired].std() > 0:
+                expected.iloc[t, expected.columns.get_loc(ticker)] = np.corrcoef(xs[paired], ys[paired])[0, 1]
+    pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-8, atol=1e-10)
+
+
+def test_bootstrap_interval_contains_the_estimate():
+    sentiment, returns = _panels(days=400)
+    engine = CorrelationEngine(sentiment, returns)
+    result = engine.bootstrap(lags=(0, 1), n_boot=200, block_size=5, seed=1)
+    sweep = engine.lag_sweep([0, 1])
+    for ticker in ('T0', 'T1', 'T2'):
+        for lag in (0, 1):
+            row = result.loc[(ticker, lag)]
+            assert row['corr'] == pytest.approx(sweep.loc[lag, ticker], rel=1e-9)
+            assert row['ci_low'] <= row['corr'] <= row['ci_high']
+    assert result.loc[('T3', 0)][['corr', 'ci_low', 'ci_high']].isna().all()
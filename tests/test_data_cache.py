@@ -0,0 +1,51 @@
+import pandas as pd
+
+from data_cache import ParquetCache
+
+
+def _write_csv(path, rows):
+    pd.DataFrame({'a': range(rows), 'b': [f"x{i}" for i in range(rows)]}).to_csv(path, index=False)
+
+
+def _counting_parser(path, calls, usecols=None):
+    def parse():
+        calls.append(usecols)
+        return pd.read_csv(path, usecols=usecols)
+    return parse
+
+
+def test_alternating_options_keep_separate_entries(tmp_path):
+    path = str(tmp_path / 'news.csv')
+    _write_csv(path, 5)
+    cache, calls = ParquetCache(), []
+    for _ in range(2):
+        for usecols in (['a'], ['a', 'b']):
+            df = cache.load(path, _counting_parser(path, calls, usecols), {'usecols': usecols})
+            assert list(df.columns) == usecols
+    assert calls == [['a'], ['a', 'b']] # The second round is served from the cache
+
+
+def test_changed_source_is_reparsed(tmp_path):
+    path = str(tmp_path / 'news.csv')
+    _write_csv(path, 5)
+    cache, calls = ParquetCache(), []
+    cache.load(path, _counting_parser(path, calls), {})
+    _write_csv(path, 7)
+    assert len(cache.load(path, _counting_parser(path, calls), {})) == 7
+    assert len(calls) == 2
+
+
+def test_file_written_during_parse_is_not_cached(tmp_path):
+    path = str(tmp_path / 'news.csv')
+    _write_csv(path, 5)
+    cache, calls = ParquetCache(), []
+
+    def parse_while_writing():
+        calls.append(None)
+        df = pd.read_csv(path)
+        _write_csv(path, 9)
+        return df
+
+    assert len(cache.load(path, parse_while_writing, {})) == 5
+    assert len(cache.load(path, _counting_parser(path, calls), {})) == 9
+    assert len(calls) == 2
@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from date_parsing import EXCHANGE_TZ, infer_format, parse_dates
+
+
+def _utc(*values):
+    return pd.Series(pd.to_datetime(list(values), utc=True)).dt.as_unit('ns')
+
+
+def test_offsets_are_applied_and_naive_values_are_exchange_time():
+    parsed = parse_dates(['2020-06-05 10:30:54-04:00', '2020-06-05 10:30:54+0530', '2020-06-05 10:30:54Z',
+                          '2020-06-05 10:30:54', '2020-01-06 10:30:54'])
+    expected = _utc('2020-06-05 14:30:54', '2020-06-05 05:00:54', '2020-06-05 10:30:54',
+                    '2020-06-05 14:30:54', '2020-01-06 15:30:54') # EDT in June, EST in January
+    pd.testing.assert_series_equal(parsed, expected)
+
+
+def test_mixed_formats_of_the_same_length_all_parse():
+    values = ['2020-06-05 10:30:54'] * 6 + ['2020-06-05T10:30:54'] * 4
+    parsed = parse_dates(values)
+    assert parsed.notna().all()
+    pd.testing.assert_series_equal(parsed, pd.to_datetime(pd.Series(values), format='ISO8601')
+                                   .dt.tz_localize(EXCHANGE_TZ).dt.tz_convert('UTC').dt.as_unit('ns'))
+
+    # A minority with an offset among naive values of the same length
+    parsed = parse_dates(['2020-06-05 10:30:54.1234'] * 3 + ['2020-06-05 06:30:54-0400'])
+    assert parsed.tolist() == [pd.Timestamp('2020-06-05 14:30:54.1234', tz='UTC')] * 3 + \
+        [pd.Timestamp('2020-06-05 10:30:54', tz='UTC')]
+
+
+def test_random_mix_matches_element_wise_parsing():
+    rng = np.random.default_rng(0)
+    times = pd.Timestamp('2019-01-01') + pd.to_timedelta(rng.integers(0, 3 * 365 * 86400, 500), unit='s')
+    naive = times.strftime('%Y-%m-%d %H:%M:%S')
+    iso = times.strftime('%Y-%m-%dT%H:%M:%S')
+    offset = times.strftime('%Y-%m-%d %H:%M:%S') + '-04:00'
+    choice = rng.integers(0, 3, len(times))
+    values = pd.Series(np.where(choice == 0, naive, np.where(choice == 1, iso, offset)))
+    parsed = parse_dates(values)
+
+    expected = pd.Series(pd.NaT, index=values.index, dtype='datetime64[ns, UTC]')
+    expected[choice == 2] = pd.to_datetime(values[choice == 2], utc=True)
+    expected[choice != 2] = pd.Series(times[choice != 2]).dt.tz_localize(
+        EXCHANGE_TZ, ambiguous=False, nonexistent='shift_forward').dt.tz_convert('UTC').to_numpy()
+    pd.testing.assert_series_equal(parsed, expected.dt.as_unit('ns'))
+
+
+def test_missing_and_malformed_values_become_nat():
+    values = pd.Series(['2020-06-05 10:30:54', None, 'not a date', '', '2020-13-45 10:30:54', '06/05/2020'],
+                       index=[10, 11, 12, 13, 14, 15], name='date')
+    parsed = parse_dates(values)
+    assert parsed.index.tolist() == values.index.tolist() and parsed.name == 'date'
+    assert parsed.isna().tolist() == [False, True, True, True, True, False]
+    assert parsed.iloc[-1] == pd.Timestamp('2020-06-05 04:00', tz='UTC')
+
+
+def test_datetime_input_and_dst_edges():
+    naive = pd.Series(pd.to_datetime(['2020-11-01 01:30', '2020-03-08 02:30']))
+    parsed = parse_dates(naive)
+    # Ambiguous fall-back hour is standard time; the spring-forward gap is shifted forward
+    assert parsed.tolist() == [pd.Timestamp('2020-11-01 06:30', tz='UTC'), pd.Timestamp('2020-03-08 07:00', tz='UTC')]
+    aware = pd.Series(pd.to_datetime(['2020-06-05 10:30'])).dt.tz_localize('Europe/Paris')
+    assert parse_dates(aware).tolist() == [pd.Timestamp('2020-06-05 08:30', tz='UTC')]
+
+
+def test_infer_format():
+    assert infer_format(['2020-06-05 10:30:54-04:00', '2020-06-05 11:00:00-05:00']) == ('%Y-%m-%d %H:%M:%S', 6)
+    assert infer_format(['06/05/2020', '12/31/2020', 'garbage']) == ('%m/%d/%Y', 0)
+    assert infer_format(['garbage', 'more garbage']) is None
+
+
+def test_prepare_dates_derives_exchange_fields_and_drops_failures(tmp_path):
+    from data_analysis import NewsAnalyzer
+
+    path = tmp_path / 'news.csv'
+    pd.DataFrame({'headline': list('abcde'), 'stock': 'AAPL',
+                  'date': ['2020-06-05 20:30:00-04:00', '2020-06-06T00:30:00Z', 'bad', '2020-06-08 09:00:00',
+                           '2020-06-08T09:00:00']}).to_csv(path, index=False)
+    analyzer = NewsAnalyzer(str(path))
+    analyzer.load_data()
+    df = analyzer.prepare_dates()
+    assert analyzer.date_parse_failures == 1
+    assert df.index.tolist() == [0, 1, 3, 4]
+    assert str(df['date'].dt.tz) == EXCHANGE_TZ
+    assert df['hour'].tolist() == [20, 20, 9, 9]
+    assert df['day_of_week'].astype(str).tolist() == ['Friday', 'Friday', 'Monday', 'Monday']
+    assert df['date_only'].tolist() == [pd.Timestamp('2020-06-05')] * 2 + [pd.Timestamp('2020-06-08')] * 2
+    assert (df['year'].tolist(), df['month'].tolist()) == ([2020] * 4, [6] * 4)
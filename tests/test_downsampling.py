@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from downsampling import downsample_line, lttb, resample_ohlcv
+from synthetic_data import make_ohlcv
+
+
+def _line(rows=500):
+    index = pd.date_range('2020-01-01', periods=rows, freq='D')
+    return pd.Series(np.sin(np.linspace(0, 20, rows)), index=index)
+
+
+def test_lttb_keeps_endpoints_and_threshold():
+    line = _line()
+    positions = lttb(line.index.to_numpy(), line.to_numpy(), 50)
+    assert len(positions) == 50
+    assert positions[0] == 0 and positions[-1] == len(line) - 1
+    assert (np.diff(positions) > 0).all()
+
+
+@pytest.mark.parametrize('threshold', [1, 2, 3])
+def test_downsample_line_clamps_small_thresholds(threshold):
+    line = _line()
+    line.iloc[:20] = np.nan # Warm-up period
+    result = downsample_line(line, threshold)
+    assert len(result) == 3
+    assert result.index[0] == line.index[20] and result.index[-1] == line.index[-1]
+
+
+def test_resample_ohlcv_bounds_the_bar_count():
+    df = make_ohlcv(1_000)
+    for max_bars in (1, 2, 7, 1_000):
+        bars = resample_ohlcv(df, max_bars)
+        assert len(bars) <= max_bars
+        assert bars['Volume'].sum() == pytest.approx(df['Volume'].sum())
+        assert bars['High'].max() == df['High'].max() and bars['Low'].min() == df['Low'].min()
+
+
+def test_price_figure_with_tiny_max_bars():
+    pytest.importorskip('plotly')
+    from stock_analyzer import build_price_figure
+
+    df = make_ohlcv(300)
+    df['SMA_20'] = df['Close'].rolling(20).mean()
+    df['SMA_50'] = df['Close'].rolling(50).mean()
+    for max_bars in (1, 2):
+        figure = build_price_figure('TEST', df, max_bars=max_bars)
+        assert len(figure.data[0].x) <= max_bars
+    with pytest.raises(ValueError):
+        build_price_figure('TEST', df, max_bars=0)
@@ -0,0 +1,90 @@
+import pandas as pd
+import pytest
+
+from data_analysis import NewsAnalyzer, _date_fields
+from date_parsing import EXCHANGE_TZ, parse_dates
+from eda_report import DAY_ORDER, MONTH_ORDER, EDAReport
+from synthetic_data import write_news_csv
+
+
+@pytest.fixture
+def news_path(tmp_path):
+    path = tmp_path / 'news.csv'
+    write_news_csv(path, 500, chunk_rows=200, seed=4, publishers=20,
+                   date_formats={'naive': 0.6, 'offset': 0.2, 'iso': 0.1, 'date': 0.1})
+    df = pd.read_csv(path, index_col=0)
+    df.loc[[3, 77], 'date'] = ['not a date', None] # Rows without a parseable date
+    df.loc[5, 'headline'] = None
+    df.to_csv(path)
+    return path
+
+
+def _in_memory(path):
+    analyzer = NewsAnalyzer(str(path))
+    analyzer.load_data()
+    return analyzer.build_report()
+
+
+def _streamed(path, chunksize=64):
+    analyzer = NewsAnalyzer(str(path))
+    analyzer.load_data(chunksize=chunksize)
+    return analyzer, analyzer.build_report()
+
+
+def test_in_memory_streamed_and_saved_reports_are_equal(news_path, tmp_path):
+    report = _in_memory(news_path)
+    _, streamed = _streamed(news_path)
+    assert streamed.to_dict() == report.to_dict()
+
+    report.save(tmp_path / 'report.json')
+    loaded = EDAReport.load(tmp_path / 'report.json')
+    assert loaded.to_dict() == report.to_dict()
+    for view in ('publisher_counts', 'headline_length_counts', 'headline_length_summary', 'day_of_week_counts',
+                 'month_counts', 'hour_counts', 'daily_counts'):
+        pd.testing.assert_series_equal(getattr(loaded, view)(), getattr(report, view)(), check_index_type=False)
+
+    halves = [EDAReport().update(chunk) for chunk in (pd.read_csv(news_path, nrows=250),
+                                                      pd.read_csv(news_path, skiprows=range(1, 251)))]
+    assert halves[0].merge(halves[1]).to_dict() == report.to_dict()
+
+
+def test_report_matches_pandas_counts(news_path):
+    report = _in_memory(news_path)
+    df = pd.read_csv(news_path, index_col=0)
+    dates = parse_dates(df['date']).dropna().dt.tz_convert(EXCHANGE_TZ)
+    assert report.rows == len(df) and report.date_parse_failures == 2
+    assert report.day_of_week_counts().tolist() == \
+        dates.dt.dayofweek.value_counts().reindex(range(7), fill_value=0).tolist()
+    assert report.month_counts().tolist() == dates.dt.month.value_counts().reindex(range(1, 13), fill_value=0).tolist()
+    assert report.hour_counts().tolist() == dates.dt.hour.value_counts().reindex(range(24), fill_value=0).tolist()
+    daily = dates.dt.tz_localize(None).dt.normalize().value_counts().sort_index()
+    assert report.daily_counts().to_dict() == daily.to_dict()
+    assert report.publisher_counts().to_dict() == df['publisher'].value_counts().to_dict()
+
+    lengths = df['headline'].apply(lambda text: len(str(text).split()))
+    pd.testing.assert_series_equal(report.headline_length_summary(), lengths.describe().rename('headline_length'))
+
+
+def test_date_fields_match_dt_accessors(news_path):
+    dates = parse_dates(pd.read_csv(news_path)['date']).dropna().dt.tz_convert(EXCHANGE_TZ)
+    fields = _date_fields(dates)
+    assert fields['year'].tolist() == dates.dt.year.tolist()
+    assert fields['month'].tolist() == dates.dt.month.tolist()
+    assert fields['hour'].tolist() == dates.dt.hour.tolist()
+    assert fields['day_of_week'].astype(str).tolist() == dates.dt.day_name().tolist()
+    assert fields['date_only'].tolist() == dates.dt.tz_localize(None).dt.normalize().tolist()
+
+
+def test_streaming_methods_read_from_one_report(news_path, capsys):
+    analyzer, report = _streamed(news_path)
+    analyzer.report = None
+    counts = analyzer.textual_lengths() # Builds the report from the chunks
+    assert counts.to_dict() == report.headline_length_counts().to_dict()
+    built = analyzer.report
+    assert analyzer.prepare_dates() is built and analyzer.date_parse_failures == 2
+    analyzer.articles_per_publisher()
+    assert analyzer.publisher_counts.to_dict() == report.publisher_counts().to_dict()
+    analyzer.descriptive_statistics()
+    assert 'Descriptive Statistics' in capsys.readouterr().out
+    assert analyzer.report is built # Every method reused the same pass
+    assert list(built.day_of_week_counts().index) == DAY_ORDER and list(built.month_counts().index) == MONTH_ORDER
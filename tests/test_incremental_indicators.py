@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from incremental_indicators import IncrementalIndicators
+from synthetic_data import make_ohlcv
+
+talib = pytest.importorskip('talib')
+
+
+def _talib_reference(closes, sma_periods=(20, 50), rsi_period=14, fast_period=12, slow_period=26, signal_period=9):
+    closes = np.asarray(closes, dtype=float)
+    expected = {f'SMA_{period}': talib.SMA(closes, timeperiod=period) for period in sma_periods}
+    expected['RSI'] = talib.RSI(closes, timeperiod=rsi_period)
+    expected['MACD'], expected['MACD_signal'], _ = talib.MACD(closes, fastperiod=fast_period,
+                                                              slowperiod=slow_period, signalperiod=signal_period)
+    return pd.DataFrame(expected)
+
+
+def _stream(engine, closes):
+    return pd.DataFrame([engine.update(close) for close in closes])
+
+
+def _closes(rows=400, seed=0):
+    return make_ohlcv(rows, seed=seed)['Close'].to_numpy()
+
+
+@pytest.mark.parametrize('params', [
+    {},
+    {'sma_periods': (5, 10), 'rsi_period': 7, 'fast_period': 5, 'slow_period': 13, 'signal_period': 4},
+])
+def test_stream_matches_talib(params):
+    closes = _closes()
+    result = _stream(IncrementalIndicators(**params), closes)
+    pd.testing.assert_frame_equal(result, _talib_reference(closes, **params)[result.columns],
+                                  check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_flat_and_short_series_match_talib():
+    # A flat stretch makes TA-Lib's RSI denominator zero; a short series stays inside every lookback
+    closes = np.concatenate([np.full(30, 100.0), _closes(80, seed=1)])
+    for series in (closes, closes[:10]):
+        result = _stream(IncrementalIndicators(), series)
+        pd.testing.assert_frame_equal(result, _talib_reference(series)[result.columns],
+                                      check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize('split', [5, 30, 60, 399])
+def test_json_save_restore_mid_stream(tmp_path, split):
+    closes = _closes()
+    engine = IncrementalIndicators()
+    head = _stream(engine, closes[:split])
+    path = tmp_path / 'state.json'
+    engine.save(path)
+
+    restored = IncrementalIndicators.load(path)
+    assert restored.last.keys() == engine.last.keys()
+    np.testing.assert_array_equal(np.array(list(restored.last.values())), np.array(list(engine.last.values())))
+    result = pd.concat([head, _stream(restored, closes[split:])], ignore_index=True)
+    pd.testing.assert_frame_equal(result, _talib_reference(closes)[result.columns],
+                                  check_exact=False, rtol=1e-9, atol=1e-9)
+
+
+def test_from_history_continues_like_a_stream():
+    closes = _closes()
+    engine = IncrementalIndicators.from_history(closes[:250])
+    assert engine.count == 250
+    tail = _stream(engine, closes[250:])
+    expected = _talib_reference(closes).iloc[250:].reset_index(drop=True)
+    pd.testing.assert_frame_equal(tail, expected[tail.columns], check_exact=False, rtol=1e-9, atol=1e-9)
@@ -0,0 +1,116 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import instrumentation
+from instrumentation import PeakMemory, instrumented, log, log_error, set_rows, span
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    yield instrumentation.configure
+    instrumentation.configure(enabled=False)
+    instrumentation.reset()
+
+
+def _spans():
+    return {record['name']: record for record in instrumentation.records() if record['event'] == 'span'}
+
+
+def test_nesting_rows_and_messages(enabled):
+    enabled()
+
+    @instrumented('inner')
+    def inner():
+        log("inner message")
+        return pd.DataFrame({'a': range(5)})
+
+    with span('outer', stage='demo') as outer:
+        inner()
+        set_rows(42)
+        log("outer message")
+    assert outer.rows == 42
+
+    spans = _spans()
+    assert spans['inner']['parent'] == 'outer' and spans['inner']['depth'] == 1
+    assert spans['outer']['parent'] is None and spans['outer']['depth'] == 0
+    assert spans['inner']['rows'] == 5 and spans['outer']['rows'] == 42
+    assert spans['inner']['messages'] == ["inner message"] and spans['outer']['messages'] == ["outer message"]
+    assert spans['outer']['stage'] == 'demo' and spans['outer']['status'] == 'ok'
+
+
+def test_errors_propagate_and_mark_the_span(enabled, capsys):
+    enabled()
+    with pytest.raises(ValueError, match="bad input"):
+        with span('outer'):
+            with span('failing'):
+                raise ValueError("bad input")
+    with span('reported'):
+        log_error("could not load")
+
+    spans = _spans()
+    assert spans['failing']['status'] == "error: ValueError: bad input"
+    assert spans['outer']['status'] == "error: ValueError: bad input"
+    assert spans['reported']['status'] == "error: could not load"
+    assert "could not load" in capsys.readouterr().out # Errors are still printed
+
+    table = instrumentation.summary().set_index('name')
+    assert table.loc['failing', 'errors'] == 1 and table.loc['reported', 'calls'] == 1
+
+
+def test_json_lines_output(enabled, tmp_path):
+    path = tmp_path / 'spans.jsonl'
+    enabled(output='json', log_path=str(path))
+    with span('load', rows=10):
+        pass
+    log("outside any span")
+    instrumentation.configure(enabled=False) # Closes the log file
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line['event'] for line in lines] == ['span', 'log']
+    assert lines[0]['name'] == 'load' and lines[0]['rows'] == 10 and lines[0]['rows_per_s'] > 0
+    assert lines[1]['message'] == "outside any span"
+
+
+def test_peak_memory_is_sampled_only_when_asked(enabled):
+    enabled()
+    with span('unsampled'):
+        pass
+    record = _spans()['unsampled']
+    assert record['peak_rss_mb'] is None and record['rss_start_mb'] > 0
+
+    instrumentation.reset()
+    enabled(memory='top', memory_interval=0.001)
+    with span('top'):
+        with span('nested'):
+            pass
+    spans = _spans()
+    assert spans['top']['peak_rss_mb'] >= spans['top']['rss_start_mb']
+    assert spans['nested']['peak_rss_mb'] is None
+    assert np.isnan(instrumentation.summary().set_index('name').loc['nested', 'peak_delta_mb'])
+
+    with pytest.raises(ValueError):
+        instrumentation.configure(memory='every')
+
+
+def test_peak_memory_captures_a_freed_allocation():
+    with PeakMemory(interval=0.001) as memory:
+        block = np.ones(50_000_000 // 8) # About 50 MB, touched
+        block.sum()
+        del block
+    assert memory.peak - memory.start > 25_000_000
+
+
+def test_disabled_spans_are_no_ops(capsys):
+    instrumentation.configure(enabled=False)
+    instrumentation.reset()
+    with span('ignored') as current:
+        current.rows = 3
+        set_rows(5)
+        log("printed")
+    assert instrumented('wrapped')(lambda: 1)() == 1
+    assert instrumentation.records() == [] and instrumentation.summary().empty
+    assert capsys.readouterr().out == "printed\n"
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from date_parsing import EXCHANGE_TZ, parse_dates
+from market_sentiment import MultiTickerSentimentEngine
+from sentiment import SCORE_COLUMNS, SentimentScorer
+from session_alignment import assign_sessions, build_sessions
+
+TRADING_DATES = pd.bdate_range('2020-06-01', '2020-06-12')
+NEWS = [
+    ('Apple beats earnings expectations', '2020-06-01 10:00:00-04:00', 'AAPL'),
+    ('Apple shares plunge after weak guidance', '2020-06-01 20:00:00-04:00', 'AAPL'), # Evening: 00:00 UTC next day
+    ('Apple beats earnings expectations', '2020-06-02 09:00:00', 'AAPL'),
+    ('Microsoft announces record cloud growth', '2020-06-05 16:00:00', 'MSFT'), # At the close
+    ('Microsoft faces antitrust probe', '2020-06-05 16:00:01', 'MSFT'), # After the Friday close
+    ('Microsoft weekend deal talk', '2020-06-06 12:00:00', 'MSFT'),
+    ('Nvidia rallies', '2020-06-03 11:00:00', 'NVDA'), # Not a requested ticker
+    ('Apple late news', '2020-06-12 18:00:00', 'AAPL'), # After the last session
+    ('Apple news without a date', 'not a date', 'AAPL'),
+]
+
+
+@pytest.fixture
+def files(tmp_path):
+    news_path = tmp_path / 'news.csv'
+    pd.DataFrame(NEWS, columns=['headline', 'date', 'stock']).to_csv(news_path, index=False)
+    paths = {}
+    for i, ticker in enumerate(['AAPL', 'MSFT']):
+        rng = np.random.default_rng(i)
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(TRADING_DATES))))
+        prices = pd.DataFrame({'Date': TRADING_DATES.strftime('%Y-%m-%d'), 'Open': close, 'High': close + 1,
+                               'Low': close - 1, 'Close': close, 'Volume': 1000})
+        paths[ticker] = tmp_path / f'{ticker}_historical_data.csv'
+        prices.to_csv(paths[ticker], index=False)
+    return str(news_path), {ticker: str(path) for ticker, path in paths.items()}
+
+
+def _reference(news_path, paths, day_of):
+    """Per-ticker loop: filter the news, score it, bucket it per day and left-join it to the prices."""
+    scorer = SentimentScorer(max_workers=1, verbose=False)
+    news = pd.read_csv(news_path)
+    news['date'] = parse_dates(news['date'])
+    results = {}
+    for ticker, path in paths.items():
+        prices = pd.read_csv(path, parse_dates=['Date']).set_index('Date')
+        own = news[(news['stock'] == ticker) & news['date'].notna()].copy()
+        own[SCORE_COLUMNS] = scorer.score(own['headline']).to_numpy()
+        own['Date'] = day_of(own['date'], prices.index)
+        grouped = own.dropna(subset=['Date']).groupby('Date')[SCORE_COLUMNS]
+        daily = pd.concat([grouped.mean(), grouped.sum().add_suffix('_Sum'),
+                           grouped.size().rename('Article_Count')], axis=1)
+        frame = prices.join(daily).fillna({column: 0 for column in daily.columns})
+        frame['Daily_Return'] = frame['Close'].pct_change() * 100
+        results[ticker] = frame.dropna(subset=['Daily_Return'])
+    return results
+
+
+def _run(news_path, paths, **options):
+    engine = MultiTickerSentimentEngine(news_path, paths, scorer=SentimentScorer(max_workers=1, verbose=False),
+                                        use_cache=False, **options)
+    return engine, engine.run()
+
+
+def _compare(results, expected):
+    assert sorted(results) == sorted(expected)
+    for ticker, frame in expected.items():
+        actual = results[ticker]
+        pd.testing.assert_frame_equal(actual[frame.columns], frame, check_dtype=False, check_freq=False,
+                                      check_index_type=False, check_names=False)
+
+
+def test_calendar_days_are_exchange_days(files):
+    news_path, paths = files
+    engine, results = _run(news_path, paths)
+    local_day = lambda dates, _: dates.dt.tz_convert(EXCHANGE_TZ).dt.tz_localize(None).dt.normalize()
+    _compare(results, _reference(news_path, paths, local_day))
+    # The 8pm ET headline stays on Monday June 1 (the first row, dropped for its return, holds it)
+    assert engine.daily_sentiment.loc[('AAPL', pd.Timestamp('2020-06-01')), 'Article_Count'] == 2
+    assert results['MSFT'].loc['2020-06-05', 'Article_Count'] == 2
+    assert all(frame.attrs['sentiment_alignment'] == 'calendar' for frame in results.values())
+
+
+def test_session_alignment_rolls_news_forward(files):
+    news_path, paths = files
+    engine, results = _run(news_path, paths, align='session')
+    session = lambda dates, trading_dates: assign_sessions(dates, build_sessions(trading_dates)).to_numpy()
+    _compare(results, _reference(news_path, paths, session))
+    assert results['AAPL'].loc['2020-06-02', 'Article_Count'] == 2 # Monday evening + Tuesday morning
+    assert results['MSFT'].loc['2020-06-05', 'Article_Count'] == 1 # Exactly 16:00 is the Friday session
+    assert results['MSFT'].loc['2020-06-08', 'Article_Count'] == 2 # After the close and the weekend
+    assert results['AAPL']['Article_Count'].sum() == 2 # Nothing after the last session
+    assert all(frame.attrs['sentiment_alignment'] == 'session' for frame in results.values())
+
+
+def test_rejects_unknown_alignment(files):
+    with pytest.raises(ValueError):
+        MultiTickerSentimentEngine(*files, align='utc')
+
+
+def test_sessions_follow_each_tickers_own_dates(files):
+    news_path, paths = files
+    msft = pd.read_csv(paths['MSFT'])
+    msft[msft['Date'] != '2020-06-08'].to_csv(paths['MSFT'], index=False) # MSFT did not trade on Monday
+    engine, results = _run(news_path, paths, align='session')
+    session = lambda dates, trading_dates: assign_sessions(dates, build_sessions(trading_dates)).to_numpy()
+    _compare(results, _reference(news_path, paths, session))
+    assert results['MSFT'].loc['2020-06-09', 'Article_Count'] == 2 # Rolled to MSFT's next session
+    assert engine.daily_sentiment['Article_Count'].sum() == 6 # No headline lost in the join
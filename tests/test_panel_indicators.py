@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from panel_indicators import close_panel, compute_panel_indicators
+from synthetic_data import make_ohlcv
+
+talib = pytest.importorskip('talib')
+
+
+def _per_ticker_talib(panel):
+    """
+    Reference: TA-Lib on each ticker's own bars (NaNs dropped), put back on the panel's dates.
+    """
+    expected = {name: pd.DataFrame(np.nan, index=panel.index, columns=panel.columns)
+                for name in ('SMA_20', 'SMA_50', 'RSI', 'MACD', 'MACD_signal')}
+    for ticker in panel.columns:
+        series = panel[ticker].dropna()
+        closes = series.to_numpy(dtype=float)
+        values = {'SMA_20': talib.SMA(closes, timeperiod=20), 'SMA_50': talib.SMA(closes, timeperiod=50),
+                  'RSI': talib.RSI(closes, timeperiod=14)}
+        values['MACD'], values['MACD_signal'], _ = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=9)
+        for name, column in values.items():
+            expected[name].loc[series.index, ticker] = column
+    return expected
+
+
+def _panel(rows=300):
+    dates = pd.bdate_range('2020-01-01', periods=rows)
+    panel = pd.DataFrame({f'T{i}': make_ohlcv(rows, seed=i)['Close'].to_numpy() for i in range(6)}, index=dates)
+    panel.iloc[:40, 1] = np.nan                     # Starts late
+    panel.iloc[-70:, 2] = np.nan                    # Ends early
+    panel.iloc[[5, 6, 7, 60, 61, 100, rows - 1], 3] = np.nan # Interior gaps (and a missing last bar)
+    panel.iloc[:, 4] = np.nan                       # No bars at all
+    panel.iloc[:-30, 5] = np.nan                    # Shorter than the SMA_50 lookback
+    return panel
+
+
+def test_matches_per_ticker_talib():
+    panel = _panel()
+    result = compute_panel_indicators(panel)
+    expected = _per_ticker_talib(panel)
+    assert result.keys() == expected.keys()
+    for name in expected:
+        pd.testing.assert_frame_equal(result[name], expected[name], check_exact=False, rtol=1e-8, atol=1e-8)
+    assert result['SMA_20']['T4'].isna().all()
+    assert result['SMA_50']['T5'].isna().all() and result['SMA_20']['T5'].notna().sum() == 11
+
+
+def test_numpy_input_returns_arrays():
+    panel = _panel(150)
+    result = compute_panel_indicators(panel.to_numpy())
+    expected = _per_ticker_talib(panel)
+    for name in expected:
+        assert isinstance(result[name], np.ndarray)
+        np.testing.assert_allclose(result[name], expected[name].to_numpy(), rtol=1e-8, atol=1e-8)
+
+
+def test_rejects_one_dimensional_input():
+    with pytest.raises(ValueError):
+        compute_panel_indicators(np.arange(10.0))
+
+
+def test_close_panel_aligns_on_the_union_of_dates():
+    a = pd.DataFrame({'Close': [1.0, 2.0]}, index=pd.to_datetime(['2020-01-02', '2020-01-03']))
+    b = pd.DataFrame({'Close': [5.0]}, index=pd.to_datetime(['2020-01-01']))
+    panel = close_panel({'A': a, 'B': b})
+    assert list(panel.index) == list(pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-03']))
+    assert panel['A'].isna().tolist() == [True, False, False]
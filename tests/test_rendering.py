@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('seaborn')
+
+from data_analysis import NewsAnalyzer
+from rendering import FigureRenderer, draw_bar, draw_histogram
+
+
+def _broken_draw(ax, data):
+    raise RuntimeError("cannot draw")
+
+
+@pytest.mark.parametrize('use_processes', [True, False])
+def test_renderer_writes_every_format(tmp_path, use_processes):
+    counts = pd.Series([5, 3, 1], index=['Reuters', 'Benzinga', 'AP'])
+    with FigureRenderer(str(tmp_path), formats=('png', 'svg'), max_workers=2, use_processes=use_processes) as renderer:
+        renderer.submit('publishers', draw_bar, counts, title="Publishers")
+        renderer.submit('lengths', draw_histogram, [3, 5, 8], weights=[10, 4, 1], bins=5)
+        renderer.submit('broken', _broken_draw, None)
+    timings = renderer.timings().set_index('figure')
+
+    for name in ('publishers', 'lengths'):
+        assert timings.loc[name, 'status'] == 'ok' and timings.loc[name, 'bytes'] > 0
+        for fmt in ('png', 'svg'):
+            assert os.path.getsize(tmp_path / f'{name}.{fmt}') > 0
+    assert timings.loc['broken', 'status'] == 'error' and "cannot draw" in timings.loc['broken', 'error']
+    assert not (tmp_path / 'broken.png').exists()
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match='bmp'):
+        FigureRenderer(str(tmp_path), formats=('png', 'bmp'))
+
+
+def test_headline_histogram_sends_counts_not_rows(tmp_path):
+    renderer = FigureRenderer(str(tmp_path / 'figures'), max_workers=1)
+    submitted = {}
+    submit = renderer.submit
+
+    def record(name, draw, data, **options):
+        submitted[name] = (data, options)
+        return submit(name, draw, data, **options)
+
+    renderer.submit = record
+    analyzer = NewsAnalyzer(str(tmp_path / 'unused.csv'), renderer=renderer)
+    analyzer.df = pd.DataFrame({'headline': ['one two', 'one two three', 'a b', 'x y'] * 250})
+    analyzer.textual_lengths()
+    analyzer.headline_length_visualization()
+    timings = renderer.close()
+
+    values, options = submitted['headline_lengths']
+    assert values.tolist() == [2, 3] and options['weights'].tolist() == [750, 250]
+    assert timings['status'].tolist() == ['ok']
+    assert os.path.getsize(tmp_path / 'figures' / 'headline_lengths.png') > 0
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from sentiment import SCORE_COLUMNS, SentimentCache, SentimentScorer, score_batch, text_hash
+
+HEADLINES = [
+    "Apple beats estimates and raises its outlook",
+    "Stocks fall sharply after weak jobs report",
+    "Tesla recalls vehicles over a software issue",
+    "Microsoft shares are unchanged",
+    "Great quarter for Nvidia, terrible one for Intel",
+    "",
+]
+
+
+def _expected(texts):
+    return score_batch(list(texts))
+
+
+def test_batches_and_duplicates_match_per_headline_scores():
+    texts = HEADLINES * 3 + [HEADLINES[0]]
+    scorer = SentimentScorer(max_workers=1, batch_size=2, verbose=False)
+    scores = scorer.score(pd.Series(texts, index=range(100, 100 + len(texts))))
+    assert list(scores.columns) == SCORE_COLUMNS and scores.index[0] == 100
+    np.testing.assert_allclose(scores.to_numpy(), _expected(texts))
+    assert len(scorer._memo) == len(HEADLINES) # Each distinct headline scored and remembered once
+
+
+def test_process_pool_matches_in_process_scoring():
+    texts = [f"{headline} ({i})" for i, headline in enumerate(HEADLINES * 4)]
+    pooled = SentimentScorer(max_workers=2, batch_size=5, verbose=False).score(texts)
+    in_process = SentimentScorer(max_workers=1, batch_size=5, verbose=False).score(texts)
+    pd.testing.assert_frame_equal(pooled, in_process)
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / 'scores' / 'cache.sqlite')
+    first = SentimentScorer(path, max_workers=1, verbose=False)
+    expected = first.score(HEADLINES)
+    first.close()
+
+    cache = SentimentCache(path)
+    stored = cache.get_many([text_hash(text) for text in HEADLINES])
+    cache.close()
+    assert len(stored) == len(HEADLINES)
+
+    again = SentimentScorer(path, max_workers=1, verbose=False)
+    rescored = []
+    score_missing = again._score_missing
+    again._score_missing = lambda texts: rescored.extend(texts) or score_missing(texts)
+    pd.testing.assert_frame_equal(again.score(HEADLINES), expected)
+    assert rescored == [] # Everything came from the cache
+    again.close()
+
+
+def test_non_strings_score_zero_and_never_share_a_key():
+    with pytest.raises(TypeError):
+        text_hash(12345)
+
+    texts = pd.Series([12345, '12345', np.nan, None, HEADLINES[0], 1.5], dtype=object)
+    scorer = SentimentScorer(max_workers=1, verbose=False)
+    scores = scorer.score(texts)
+    np.testing.assert_allclose(scores.iloc[[0, 2, 3, 5]].to_numpy(), 0.0)
+    np.testing.assert_allclose(scores.iloc[[1, 4]].to_numpy(), _expected(['12345', HEADLINES[0]]))
+    assert set(scorer._memo) == {text_hash('12345'), text_hash(HEADLINES[0])}
@@ -0,0 +1,53 @@
+import pandas as pd
+
+from session_alignment import align_news_to_sessions, assign_sessions, build_sessions
+
+# July 3, 2020 (a Friday) was a market holiday
+TRADING_DATES = pd.bdate_range('2020-06-29', '2020-07-10').drop(pd.Timestamp('2020-07-03'))
+
+
+def _sessions(timestamps, trading_dates=TRADING_DATES, **options):
+    return assign_sessions(pd.Series(timestamps), build_sessions(trading_dates, **options)).tolist()
+
+
+def test_session_table():
+    sessions = build_sessions(list(reversed(TRADING_DATES)) + [TRADING_DATES[0]])
+    assert sessions['Date'].tolist() == list(TRADING_DATES) # Sorted and unique
+    first = sessions.iloc[0]
+    assert first['Session_Open'] == pd.Timestamp('2020-06-29 13:30', tz='UTC') # 09:30 EDT
+    assert first['Session_Close'] == first['Cutoff'] == pd.Timestamp('2020-06-29 20:00', tz='UTC')
+
+    winter = build_sessions(['2020-11-25', '2020-11-27'], early_closes={'2020-11-27': '13:00'}, cutoff=None)
+    assert winter['Session_Close'].tolist() == [pd.Timestamp('2020-11-25 21:00', tz='UTC'),
+                                                pd.Timestamp('2020-11-27 18:00', tz='UTC')] # EST, half day
+    aware = build_sessions(pd.DatetimeIndex(['2020-06-29 00:00'], tz='America/New_York'))
+    assert aware['Date'].tolist() == [pd.Timestamp('2020-06-29')]
+
+
+def test_close_boundaries():
+    assert _sessions(['2020-06-29 16:00:00', '2020-06-29 16:00:01', '2020-06-29 15:59:59.999']) == \
+        [pd.Timestamp('2020-06-29'), pd.Timestamp('2020-06-30'), pd.Timestamp('2020-06-29')]
+    # Offsets are applied before comparing: 20:00 UTC is exactly the close
+    assert _sessions(['2020-06-29 20:00:00+00:00', '2020-06-29T20:00:01Z']) == \
+        [pd.Timestamp('2020-06-29'), pd.Timestamp('2020-06-30')]
+
+
+def test_after_close_weekends_and_holidays_roll_forward():
+    assert _sessions(['2020-06-26 18:00', '2020-07-02 16:30', '2020-07-03 12:00', '2020-07-04 09:00',
+                      '2020-07-05 23:59', '2020-07-06 04:00']) == \
+        [pd.Timestamp('2020-06-29')] + [pd.Timestamp('2020-07-06')] * 5 # Holiday Friday and the weekend
+
+
+def test_cutoff_and_unassignable_timestamps():
+    assert _sessions(['2020-06-29 15:45', '2020-06-29 15:15'], cutoff='15:30') == \
+        [pd.Timestamp('2020-06-30'), pd.Timestamp('2020-06-29')]
+    result = _sessions(['2020-07-10 16:00:01', '2020-07-13 10:00', None, 'not a date', '2020-07-10 16:00'])
+    assert pd.isna(result[:4]).all() and result[4] == pd.Timestamp('2020-07-10')
+
+
+def test_align_news_to_sessions_drops_unassignable_rows():
+    news = pd.DataFrame({'headline': list('abc'), 'date': ['2020-07-02 17:00', '2020-07-11 10:00', '2020-06-29 10:00']},
+                        index=[5, 6, 7])
+    aligned = align_news_to_sessions(news, TRADING_DATES)
+    assert aligned.index.tolist() == [5, 7]
+    assert aligned['Session'].tolist() == [pd.Timestamp('2020-07-06'), pd.Timestamp('2020-06-29')]
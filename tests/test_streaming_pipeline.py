@@ -0,0 +1,73 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from sentiment import SentimentScorer
+from streaming_pipeline import RingBuffer, StreamingSentimentPipeline
+from synthetic_data import make_ohlcv
+
+HEADLINES = ['Apple beats earnings expectations', 'Apple shares plunge after weak guidance',
+             'Microsoft announces record cloud growth', 'Apple beats earnings expectations']
+
+
+async def _iterate(pairs):
+    for pair in pairs:
+        yield pair
+
+
+def _stream(pipeline, headlines, bars=()):
+    try:
+        return asyncio.run(pipeline.run(headlines=_iterate(headlines), bars=_iterate(bars)))
+    finally:
+        pipeline.close()
+
+
+def test_streams_with_a_cached_scorer(tmp_path):
+    # The scorer runs on the pipeline's worker thread while its SQLite cache was opened here
+    cache_path = str(tmp_path / 'scores.sqlite')
+    events = [('AAPL' if 'Apple' in text else 'MSFT', text) for text in HEADLINES]
+    first = _stream(StreamingSentimentPipeline(SentimentScorer(cache_path, max_workers=1, verbose=False)), events)
+    assert first['AAPL']['headlines'] == 3 and first['MSFT']['headlines'] == 1
+
+    rescoring = SentimentScorer(cache_path, max_workers=1, verbose=False)
+    again = _stream(StreamingSentimentPipeline(rescoring), events) # Served from the cache
+    assert again['AAPL']['VADER_mean'] == pytest.approx(first['AAPL']['VADER_mean'])
+    expected = SentimentScorer(max_workers=1, verbose=False).score(HEADLINES[:3])['VADER_Sentiment']
+    assert first['AAPL']['VADER_mean'] == pytest.approx(np.mean([expected[0], expected[1], expected[0]]))
+
+
+def test_bars_update_indicators_after_warm_up():
+    closes = make_ohlcv(120)['Close'].to_numpy()
+    pipeline = StreamingSentimentPipeline()
+    pipeline.warm_up('AAPL', closes[:100])
+    latest = _stream(pipeline, [('AAPL', 'Apple beats earnings expectations')],
+                     [('AAPL', close) for close in closes[100:]])
+    assert latest['AAPL']['bars'] == 120 and latest['AAPL']['Close'] == closes[-1]
+    assert not np.isnan(latest['AAPL']['RSI'])
+    assert pipeline.latency_summary()['bar']['count'] == 20
+
+
+def test_ring_buffer_keeps_the_latest_rows():
+    buffer = RingBuffer(3, 2)
+    for i in range(5):
+        buffer.append((i, 10 * i))
+    np.testing.assert_array_equal(buffer.values(), [[2, 20], [3, 30], [4, 40]])
+    assert buffer.column_mean(1) == pytest.approx(30)
+
+
+def test_memo_stays_bounded_on_a_long_feed(tmp_path):
+    from synthetic_data import make_headlines
+
+    headlines = list(make_headlines(300, seed=3)) * 2 # Every headline repeats after it was evicted
+    events = [('AAPL', text) for text in headlines]
+    pipeline = StreamingSentimentPipeline(score_cache=str(tmp_path / 'scores.sqlite'), memo_size=50, batch_size=16)
+    scorer = pipeline.scorer
+    result = _stream(pipeline, events)
+    assert len(scorer._memo) <= 50
+    assert result['AAPL']['headlines'] == len(events)
+
+    unbounded = SentimentScorer(max_workers=1, verbose=False)
+    expected = unbounded.score(headlines)['VADER_Sentiment'].iloc[-pipeline.headline_window:].mean()
+    assert result['AAPL']['VADER_mean'] == pytest.approx(expected)
+    assert len(unbounded._memo) == len(set(headlines))
@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import text_stats
+from synthetic_data import make_headlines
+from text_stats import headline_word_counts, text_stats as compute_text_stats, token_summary
+
+EDGE_CASES = [
+    'Stocks rise as earnings beat',
+    '',
+    '   ',
+    '  leading and trailing  ',
+    'tabs\tand\nnewlines\r\nmixed',
+    'separators\x1c\x1d\x1e\x1f between',
+    'non breaking and em　ideographic spaces',
+    'line separator and next\u0085line',
+    'café naïve über €5 日本株',
+    'emoji \U0001F680 rockets \U0001F4C8',
+    ' ',
+    'x',
+    np.nan,
+    None,
+    12345,
+]
+
+
+def _reference(values):
+    # Missing values (NaN and None) count as the string 'nan', like str(np.nan)
+    strings = pd.Series(values, dtype=object).map(lambda x: 'nan' if pd.isna(x) else str(x))
+    words = strings.map(str.split)
+    word_count = words.map(len).to_numpy(dtype=np.int64)
+    letters = words.map(lambda w: sum(map(len, w))).to_numpy(dtype=float)
+    return pd.DataFrame({
+        'word_count': word_count,
+        'char_count': strings.map(len).to_numpy(dtype=np.int64),
+        'mean_word_length': np.divide(letters, word_count, out=np.zeros(len(strings)), where=word_count > 0),
+    })
+
+
+@pytest.mark.parametrize('values', [
+    pd.Series(EDGE_CASES, dtype=object),
+    make_headlines(5_000, seed=3),
+], ids=['edge_cases', 'synthetic'])
+def test_matches_python_split(values):
+    values = values.reset_index(drop=True)
+    expected = _reference(values)
+    counts = headline_word_counts(values)
+    assert counts.dtype == np.int64
+    np.testing.assert_array_equal(counts.to_numpy(), values.map(lambda x: len(str(x).split())).to_numpy())
+    pd.testing.assert_frame_equal(compute_text_stats(values), expected, check_exact=False, rtol=1e-12)
+
+
+def test_categorical_and_sliced_inputs():
+    values = pd.Series(EDGE_CASES[:12] * 3, dtype=object).astype('category')
+    np.testing.assert_array_equal(headline_word_counts(values).to_numpy(), _reference(values)['word_count'].to_numpy())
+    # Arrow arrays built from a slice carry a non-zero offset into their buffers
+    sliced = pd.Series(EDGE_CASES[:12], dtype=object).iloc[5:].reset_index(drop=True)
+    np.testing.assert_array_equal(headline_word_counts(sliced).to_numpy(), _reference(sliced)['word_count'].to_numpy())
+
+
+def test_index_is_preserved():
+    values = pd.Series(['a b', 'c'], index=[10, 20], name='headline')
+    counts = headline_word_counts(values)
+    assert list(counts.index) == [10, 20] and counts.name == 'headline'
+    assert list(compute_text_stats(values).index) == [10, 20]
+
+
+def test_pandas_fallback_matches(monkeypatch):
+    values = pd.Series(EDGE_CASES, dtype=object)
+    monkeypatch.setattr(text_stats, 'pa', None)
+    pd.testing.assert_frame_equal(compute_text_stats(values), _reference(values))
+
+
+def test_token_summary():
+    values = pd.Series(['Apple beats', 'apple  misses', '', 'Tesla'])
+    summary = token_summary(values)
+    assert summary['documents'] == 4
+    assert summary['total_tokens'] == 5
+    assert summary['vocabulary_size'] == 4 # 'Apple' and 'apple' are the same token
+    assert summary['max_tokens'] == 2
+    assert summary['mean_token_length'] == pytest.approx(np.mean([5, 5, 5, 6, 5]))
@@ -0,0 +1,143 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ticker_index import TickerIndex
+
+ROWS = [
+    ('AAPL', 'Apple beats estimates'),
+    ('MSFT', 'Microsoft and AAPL rally\non cloud news'), # Quoted newline
+    ('GS', 'Goldman Sachs upgrades "big tech"\n\nagain'), # Escaped quotes, blank line inside quotes
+    ('AAPL', 'aapl lower-case is not a symbol, AAPLX is not AAPL'),
+    ('TSLA', 'Goldman-Sachs and apple, MSFT, F and GS'),
+    ('F', 'Ford recalls trucks'),
+]
+
+
+def _write(path, rows, mode='w'):
+    frame = pd.DataFrame(rows, columns=['stock', 'headline'])
+    frame.insert(0, 'date', '2020-06-05 10:30:00')
+    frame.to_csv(path, mode=mode, header=(mode == 'w'), index=False)
+
+
+def _index(path, tmp_path, **options):
+    return TickerIndex(str(path), index_dir=str(tmp_path / 'index'), **options)
+
+
+def _as_lists(index, tickers=('AAPL', 'MSFT', 'GS', 'TSLA', 'F')):
+    return {ticker: (index.rows(ticker, mentions=False).tolist(), index.rows(ticker).tolist()) for ticker in tickers}
+
+
+EXPECTED = {
+    # ticker: (tagged rows, tagged + mentioned rows)
+    'AAPL': ([0, 3], [0, 1, 3]),
+    'MSFT': ([1], [1, 4]),
+    'GS': ([2], [2, 4]),
+    'TSLA': ([4], [4]),
+    'F': ([5], [5]),
+}
+
+
+@pytest.mark.parametrize('block_bytes', [7, 20, 64, 1 << 20])
+def test_quoted_newlines_across_block_boundaries(tmp_path, block_bytes):
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS)
+    index = _index(path, tmp_path, block_bytes=block_bytes)
+    assert index.update() == len(ROWS) == len(pd.read_csv(path))
+    assert _as_lists(index) == EXPECTED
+
+
+def test_aliases_and_symbol_rules(tmp_path):
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS)
+    index = _index(path, tmp_path, aliases={'AAPL': ['Apple'], 'GS': ['Goldman Sachs']})
+    index.update()
+    # 'Apple' (any case, whole word) and 'Goldman-Sachs' match their aliases; a row's own tag is not a mention
+    assert index.rows('AAPL').tolist() == [0, 1, 3, 4]
+    assert index.rows('GS').tolist() == [2, 4]
+    assert index.rows(['MSFT', 'F']).tolist() == [1, 4, 5] # 'F' is shorter than min_symbol_length
+    assert index.counts().loc['AAPL'].tolist() == [2, 2]
+
+    no_symbols = _index(path, tmp_path / 'other', match_symbols=False, min_symbol_length=1)
+    no_symbols.update()
+    assert no_symbols.rows('MSFT').tolist() == [1]
+
+
+def test_append_indexes_only_new_rows(tmp_path):
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS[:3])
+    index = _index(path, tmp_path, block_bytes=16)
+    assert index.update() == 3
+    _write(path, ROWS[3:], mode='a')
+    with open(path, 'ab') as f:
+        f.write(b'2020-06-05 10:30:00,NVDA,"half written') # Partial record: left for the next update
+    assert index.update() == 3
+    assert _as_lists(index) == EXPECTED
+    with open(path, 'ab') as f:
+        f.write(b'\nheadline about AAPL"\n')
+    assert index.update() == 1
+    assert index.rows('NVDA').tolist() == [6] and index.rows('AAPL').tolist() == [0, 1, 3, 6]
+
+    reopened = _index(path, tmp_path)
+    assert reopened.update() == 0
+    assert _as_lists(reopened) == _as_lists(index)
+
+
+def test_rewritten_file_triggers_a_rebuild(tmp_path):
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS)
+    index = _index(path, tmp_path)
+    index.update()
+    _write(path, [('NVDA', 'Nvidia and MSFT'), ('MSFT', 'Microsoft news')] + ROWS) # Longer, different prefix
+    assert index.update() == len(ROWS) + 2
+    assert index.rows('MSFT').tolist() == [0, 1, 3, 6]
+    _write(path, ROWS[:2]) # Truncated
+    assert index.update() == 2
+    assert index.rows('AAPL').tolist() == [0, 1]
+
+
+def test_subset_returns_the_indexed_rows(tmp_path):
+    from data_analysis import NewsAnalyzer
+
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS)
+    analyzer = NewsAnalyzer(str(path))
+    analyzer.df = pd.read_csv(path)
+    subset = analyzer.subset('MSFT')
+    assert subset['headline'].tolist() == [ROWS[1][1], ROWS[4][1]]
+    np.testing.assert_array_equal(analyzer.subset('AAPL', mentions=False).index, [0, 3])
+
+
+def test_last_record_without_trailing_newline(tmp_path):
+    path = tmp_path / 'news.csv'
+    _write(path, ROWS)
+    data = path.read_bytes().rstrip(b'\n')
+    path.write_bytes(data)
+    index = _index(path, tmp_path, block_bytes=16)
+    assert index.update() == len(ROWS) == len(pd.read_csv(path))
+    assert _as_lists(index) == EXPECTED
+    assert _index(path, tmp_path).update() == 0 # Reopened: nothing new
+
+    # The writer finishes the open record and appends another: the open record is re-read
+    with open(path, 'ab') as f:
+        f.write(b' and MSFT\n2020-06-05 10:31:00,NVDA,AAPL supplier\n')
+    assert index.update() == 2
+    assert index.rows('MSFT').tolist() == [1, 4, 5]
+    assert index.rows('AAPL').tolist() == [0, 1, 3, 6] and index.rows('F').tolist() == [5]
+    assert len(index) == len(pd.read_csv(path)) == 7
+
+
+def test_subset_after_prepare_dates_drops_rows(tmp_path):
+    from data_analysis import NewsAnalyzer
+
+    path = tmp_path / 'news.csv'
+    pd.DataFrame({'date': ['2020-06-05 10:30:00', 'not a date', '2020-06-05 11:30:00', '2020-06-05 12:30:00'],
+                  'stock': ['AAPL', 'AAPL', 'MSFT', 'AAPL'],
+                  'headline': ['a', 'b', 'c', 'd']}).to_csv(path, index=False)
+    analyzer = NewsAnalyzer(str(path))
+    analyzer.load_data()
+    analyzer.prepare_dates()
+    assert len(analyzer.df) == 3
+    analyzer.build_ticker_index(index_dir=str(tmp_path / 'index'))
+    assert analyzer.subset('AAPL', mentions=False)['headline'].tolist() == ['a', 'd']
+    assert analyzer.subset('MSFT', mentions=False)['headline'].tolist() == ['c']